@@ -9,17 +9,24 @@ When context becomes too large, automatically:
 4. Save recovery information
 """
 
+import atexit
 import gzip
-import json
+import hashlib
+import heapq
+import mmap
 import os
-import select
+import stat
 import subprocess
 import sys
-import tempfile
+import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -27,18 +34,41 @@ from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
+from common import fastjson
+from common.chroma_client import get_client, get_collection
 from common.config import load_auto_compact_config
 from common.logger import HookLogger
-from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
+from common import breadcrumb_buffer
+from common.sentry import init_sentry, capture_exception, flush
 
 console = Console(stderr=True)
 
+# Transcript read buffer size (1 MiB)
+TRANSCRIPT_READ_CHUNK = 1 << 20
 
+# Incremental transcript parse cache
+TRANSCRIPT_CACHE_VERSION = 2
+TRANSCRIPT_CACHE_MAX_FILES = 10
+
+# Bytes just before the cached offset that must be unchanged when a grown
+# transcript reuses the cache
+TRANSCRIPT_CACHE_CHECK_BYTES = 4096
+
+# Minimum interval between status file writes (seconds)
+STATUS_DEBOUNCE_SECONDS = 0.2
+
+# Upper bound for a single collection.add() call (ChromaDB default max batch size)
+CHROMADB_MAX_BATCH_SIZE = 5461
+
+
+@cache
 def find_project_root() -> Optional[Path]:
     """
     Example Project
     Automatically detects the project root
     Finds the root directory containing `pyproject.toml` with `project_sample`
+
+    Cached for the process lifetime; hooks never change the working directory.
     """
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
     if project_dir:
@@ -48,73 +78,337 @@ def find_project_root() -> Optional[Path]:
 
     current = Path.cwd()
     for parent in [current] + list(current.parents):
-        pyproject = parent / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text(encoding='utf-8')
-                if 'project_sample' in content.lower() or 'example_project' in content:
-                    if (parent / ".claude").exists():
-                        return parent
-            except Exception:
-                pass
-
-        if (parent / ".git").exists() and (parent / ".claude").exists():
+        # Both markers below require .claude, so check it before opening anything
+        if not (parent / ".claude").exists():
+            continue
+
+        try:
+            data = (parent / "pyproject.toml").read_bytes()
+        except OSError:
+            data = b''
+        if b'project_sample' in data.lower() or b'example_project' in data:
+            return parent
+
+        if (parent / ".git").exists():
             return parent
 
     return None
 
 
-def parse_transcript_jsonl(transcript_path: Path) -> Dict[str, Any]:
-    """Parse JSONL files and return structured data"""
-    messages = []
-    file_history = {'snapshots': [], 'tracked_files': {}}
+def iter_jsonl_lines(f, include_tail: bool = True) -> Iterator[bytes]:
+    """
+    Yield raw lines from a binary file object
+
+    Reads in large chunks and splits on b'\\n' instead of relying on
+    text-mode line iteration, so decoding is deferred to each JSON line.
+
+    Args:
+        f: File object opened in binary mode
+        include_tail: Also yield the last line when it has no trailing newline
+    """
+    buf = bytearray()
+    while True:
+        chunk = f.read(TRANSCRIPT_READ_CHUNK)
+        if not chunk:
+            break
+        buf.extend(chunk)
+
+        start = 0
+        while True:
+            newline = buf.find(b'\n', start)
+            if newline == -1:
+                break
+            yield bytes(buf[start:newline])
+            start = newline + 1
+        del buf[:start]
+
+    # Last line without a trailing newline
+    if buf and include_tail:
+        yield bytes(buf)
+
+
+def iter_transcript_lines(f, start: int = 0) -> Iterator[bytes]:
+    """
+    Yield newline-terminated lines of a transcript starting at a byte offset
 
+    Memory-maps the file and scans newline offsets directly, so the kernel
+    pages the file in on demand without an extra userspace copy. Falls back
+    to the chunked reader when the file cannot be mapped (empty file, pipe).
+    """
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                entry_type = entry.get('type')
-
-                if entry_type == 'user':
-                    msg = entry.get('message', {})
-                    messages.append({
-                        'uuid': entry.get('uuid'),
-                        'type': 'user',
-                        'timestamp': entry.get('timestamp'),
-                        'content': msg.get('content', ''),
-                        'metadata': {
-                            'cwd': entry.get('cwd'),
-                            'git_branch': entry.get('git_branch'),
-                            'is_sidechain': entry.get('isSidechain', False)
-                        }
-                    })
-
-                elif entry_type == 'assistant':
-                    msg = entry.get('message', {})
-                    messages.append({
-                        'uuid': entry.get('uuid'),
-                        'type': 'assistant',
-                        'timestamp': entry.get('timestamp'),
-                        'content': msg.get('content', []),
-                        'model': msg.get('model'),
-                        'usage': msg.get('usage', {}),
-                        'stop_reason': msg.get('stop_reason')
-                    })
-
-                elif entry_type == 'file-history-snapshot':
-                    snapshot = entry.get('snapshot', {})
-                    file_history['snapshots'].append({
-                        'message_id': snapshot.get('messageId'),
-                        'timestamp': snapshot.get('timestamp'),
-                        'tracked_files': snapshot.get('trackedFileBackups', {})
-                    })
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        f.seek(start)
+        yield from iter_jsonl_lines(f, include_tail=False)
+        return
+
+    with mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        pos = start
+        while True:
+            newline = mm.find(b'\n', pos)
+            if newline == -1:
+                break
+            yield mm[pos:newline]
+            pos = newline + 1
+
+
+def new_message_counters() -> Dict[str, Any]:
+    """Create empty running counters for conversation statistics"""
+    return {
+        'total_messages': 0,
+        'user_messages': 0,
+        'assistant_messages': 0,
+        'total_tokens': 0,
+        'file_snapshots': 0,
+        'first_timestamp': None,
+        'last_timestamp': None,
+    }
+
+
+def count_message(counters: Dict[str, Any], msg: Dict[str, Any]) -> None:
+    """Add a single parsed message to the running counters"""
+    counters['total_messages'] += 1
+    msg_type = msg.get('type')
+    if msg_type == 'user':
+        counters['user_messages'] += 1
+    elif msg_type == 'assistant':
+        counters['assistant_messages'] += 1
+        usage = msg.get('usage', {})
+        counters['total_tokens'] += (
+            usage.get('input_tokens', 0)
+            + usage.get('output_tokens', 0)
+            + usage.get('cache_read_input_tokens', 0)
+        )
+
+    timestamp = msg.get('timestamp', '')
+    if counters['total_messages'] == 1:
+        counters['first_timestamp'] = timestamp
+    counters['last_timestamp'] = timestamp
+
+
+def new_transcript_state(keep_recent: Optional[int] = None) -> Dict[str, Any]:
+    """Create an empty parse state (messages, file history, counters)"""
+    return {
+        'messages': deque(maxlen=keep_recent) if keep_recent else [],
+        'file_history': {'snapshots': [], 'tracked_files': {}},
+        'counters': new_message_counters(),
+    }
+
+
+def _handle_user(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """Append a user message entry"""
+    msg = entry.get('message', {})
+    message = {
+        'uuid': entry.get('uuid'),
+        'type': 'user',
+        'timestamp': entry.get('timestamp'),
+        'content': msg.get('content', ''),
+        'metadata': {
+            'cwd': entry.get('cwd'),
+            'git_branch': entry.get('git_branch'),
+            'is_sidechain': entry.get('isSidechain', False)
+        }
+    }
+    state['messages'].append(message)
+    count_message(state['counters'], message)
+
+
+def _handle_assistant(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """Append an assistant message entry"""
+    msg = entry.get('message', {})
+    message = {
+        'uuid': entry.get('uuid'),
+        'type': 'assistant',
+        'timestamp': entry.get('timestamp'),
+        'content': msg.get('content', []),
+        'model': msg.get('model'),
+        'usage': msg.get('usage', {}),
+        'stop_reason': msg.get('stop_reason')
+    }
+    state['messages'].append(message)
+    count_message(state['counters'], message)
+
+
+def _handle_snapshot(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """Count a file history snapshot and keep it unless trimming to recent messages"""
+    state['counters']['file_snapshots'] += 1
+    if keep_recent:
+        return
+    snapshot = entry.get('snapshot', {})
+    state['file_history']['snapshots'].append({
+        'message_id': snapshot.get('messageId'),
+        'timestamp': snapshot.get('timestamp'),
+        'tracked_files': snapshot.get('trackedFileBackups', {})
+    })
+
+
+# Transcript entry type -> handler
+_DISPATCH = {
+    'user': _handle_user,
+    'assistant': _handle_assistant,
+    'file-history-snapshot': _handle_snapshot,
+}
+
+
+def parse_transcript_line(line: bytes, state: Dict[str, Any], keep_recent: Optional[int] = None) -> None:
+    """Parse a single JSONL line into the parse state"""
+    if not line.strip():
+        return
+
+    try:
+        entry = fastjson.loads(line)
+    except (fastjson.JSONDecodeError, UnicodeDecodeError):
+        return
+
+    handler = _DISPATCH.get(entry.get('type'))
+    if handler:
+        handler(entry, state, keep_recent)
+
+
+def get_transcript_cache_file(transcript_path: Path) -> Path:
+    """Return the parse cache path for a transcript"""
+    project_root = find_project_root()
+    if project_root:
+        cache_dir = project_root / ".claude" / "cache"
+    else:
+        cache_dir = Path(".claude/cache")
+
+    key = hashlib.sha1(str(transcript_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"transcript-{key}.json"
+
+
+def transcript_boundary_digest(f, offset: int) -> str:
+    """Hash the bytes just before offset (detects in-place rewrites of the parsed prefix)"""
+    start = max(0, offset - TRANSCRIPT_CACHE_CHECK_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def load_transcript_cache(
+    cache_file: Path,
+    transcript_path: Path,
+    transcript_stat: os.stat_result,
+    keep_recent: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached parse state if it is still a valid prefix of the transcript
+
+    The cache is dropped when the transcript was replaced (different inode),
+    truncated below the cached size, or parsed with another keep_recent. At
+    the same size the mtime must match; a grown transcript must still hold
+    the same bytes just before the cached offset.
+    """
+    try:
+        cached = fastjson.load_file(cache_file)
+
+        valid = (
+            cached['version'] == TRANSCRIPT_CACHE_VERSION
+            and cached['keep_recent'] == keep_recent
+            and cached['inode'] == transcript_stat.st_ino
+            and cached['offset'] <= cached['size'] <= transcript_stat.st_size
+        )
+        if valid and cached['size'] == transcript_stat.st_size:
+            valid = cached['mtime_ns'] == transcript_stat.st_mtime_ns
+        elif valid:
+            with open(transcript_path, 'rb') as f:
+                valid = transcript_boundary_digest(f, cached['offset']) == cached['boundary_digest']
+        if not valid:
+            return None
+
+        # JSON has no deque; restore the bounded message buffer
+        if keep_recent:
+            state = cached['state']
+            state['messages'] = deque(state['messages'], maxlen=keep_recent)
+    except Exception:
+        return None
+
+    return cached
+
+
+def save_transcript_cache(cache_file: Path, cached: Dict[str, Any]) -> None:
+    """Save the parse state as JSON and keep only the most recent cache files"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        state = cached['state']
+        data = fastjson.dumps({**cached, 'state': {**state, 'messages': list(state['messages'])}})
+        tmp_file = cache_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+
+        cache_files = sorted(
+            cache_file.parent.glob('transcript-*.json'),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True
+        )
+        for old_file in cache_files[TRANSCRIPT_CACHE_MAX_FILES:]:
+            old_file.unlink(missing_ok=True)
+    except Exception as e:
+        console.print(f"[yellow]WARNING: Failed to save transcript cache: {e}[/]")
+
+
+def parse_transcript_jsonl(
+    transcript_path: Path,
+    keep_recent: Optional[int] = None,
+    use_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse JSONL files and return structured data
+
+    Args:
+        transcript_path: Transcript JSONL path
+        keep_recent: Keep only the most recent N messages (None keeps everything).
+            Older messages and file history snapshots are never materialized;
+            statistics are still counted over the whole transcript.
+        use_cache: Resume from the byte offset cached by a previous run and
+            parse only the lines appended since then
+    """
+    state = new_transcript_state(keep_recent)
+
+    try:
+        transcript_stat = transcript_path.stat()
+
+        cache_file = None
+        cached = None
+        offset = 0
+        if use_cache:
+            cache_file = get_transcript_cache_file(transcript_path)
+            cached = load_transcript_cache(cache_file, transcript_path, transcript_stat, keep_recent)
+            if cached:
+                state = cached['state']
+                offset = cached['offset']
+
+        with open(transcript_path, 'rb') as f:
+            for line in iter_transcript_lines(f, offset):
+                offset += len(line) + 1
+                parse_transcript_line(line, state, keep_recent)
+
+            # An unterminated last line may still be written to; parse it
+            # without advancing the cached offset
+            f.seek(offset)
+            tail = f.read()
+
+            save_cache = cache_file is not None and (cached is None or cached['offset'] != offset)
+            if save_cache:
+                end_stat = os.fstat(f.fileno())
+                boundary_digest = transcript_boundary_digest(f, offset)
+
+        if save_cache:
+            save_transcript_cache(cache_file, {
+                'version': TRANSCRIPT_CACHE_VERSION,
+                'transcript_path': str(transcript_path),
+                'keep_recent': keep_recent,
+                'inode': transcript_stat.st_ino,
+                'size': end_stat.st_size,
+                'mtime_ns': end_stat.st_mtime_ns,
+                'offset': offset,
+                'boundary_digest': boundary_digest,
+                'state': state,
+            })
+
+        parse_transcript_line(tail, state, keep_recent)
 
     except FileNotFoundError:
         console.print(f"[yellow]WARNING: Transcript file not found: {transcript_path}[/]")
@@ -122,28 +416,24 @@ def parse_transcript_jsonl(transcript_path: Path) -> Dict[str, Any]:
         console.print(f"[yellow]WARNING: Error during transcript parsing: {e}[/]")
 
     return {
-        'messages': messages,
-        'file_history': file_history
+        'messages': list(state['messages']),
+        'file_history': state['file_history'],
+        'counters': state['counters']
     }
 
 
 def calculate_statistics(conversation_data: Dict[str, Any]) -> Dict[str, Any]:
     """Conversation Statistics Calculation"""
-    messages = conversation_data.get('messages', [])
-
-    user_messages = [m for m in messages if m.get('type') == 'user']
-    assistant_messages = [m for m in messages if m.get('type') == 'assistant']
-
-    total_tokens = 0
-    for msg in assistant_messages:
-        usage = msg.get('usage', {})
-        total_tokens += usage.get('input_tokens', 0)
-        total_tokens += usage.get('output_tokens', 0)
-        total_tokens += usage.get('cache_read_input_tokens', 0)
-
-    if messages:
-        first_ts = messages[0].get('timestamp', '')
-        last_ts = messages[-1].get('timestamp', '')
+    counters = conversation_data.get('counters')
+    if counters is None:
+        counters = new_message_counters()
+        for msg in conversation_data.get('messages', []):
+            count_message(counters, msg)
+        counters['file_snapshots'] = len(conversation_data.get('file_history', {}).get('snapshots', []))
+
+    if counters['total_messages']:
+        first_ts = counters['first_timestamp']
+        last_ts = counters['last_timestamp']
         try:
             first_dt = datetime.fromisoformat(first_ts.replace('Z', '+00:00'))
             last_dt = datetime.fromisoformat(last_ts.replace('Z', '+00:00'))
@@ -154,44 +444,49 @@ def calculate_statistics(conversation_data: Dict[str, Any]) -> Dict[str, Any]:
         duration_seconds = 0
 
     return {
-        'total_messages': len(messages),
-        'user_messages': len(user_messages),
-        'assistant_messages': len(assistant_messages),
-        'total_tokens': total_tokens,
+        'total_messages': counters['total_messages'],
+        'user_messages': counters['user_messages'],
+        'assistant_messages': counters['assistant_messages'],
+        'total_tokens': counters['total_tokens'],
         'conversation_duration_seconds': int(duration_seconds),
-        'file_snapshots': len(conversation_data.get('file_history', {}).get('snapshots', []))
+        'file_snapshots': counters['file_snapshots']
     }
 
 
-def backup_conversation(
+def get_backup_location(backup_config: Dict[str, Any]) -> Path:
+    """Resolve the backup directory and create it"""
+    project_root = find_project_root()
+    if project_root:
+        backup_location = project_root / ".claude" / "backups"
+    else:
+        backup_location = Path(backup_config['backup_location'])
+
+    backup_location.mkdir(parents=True, exist_ok=True)
+    return backup_location
+
+
+def prepare_backup(
     conversation: str,
     config: Dict[str, Any]
 ) -> tuple[Optional[Path], Optional[Dict[str, Any]]]:
     """
-    Complete backup of conversation content (including JSONL parsing)
+    Parse session metadata and the transcript into backup data (no write)
 
     Returns:
-        (backup_file, backup_data) Tuple
+        (backup_file, backup_data) Tuple. backup_file is only set when stdin
+        is not JSON and the raw text was backed up as-is.
     """
     backup_config = config['backup']
 
     if not backup_config['enabled']:
         return None, None
 
-    project_root = find_project_root()
-    if project_root:
-        backup_location = project_root / ".claude" / "backups"
-    else:
-        backup_location = Path(backup_config['backup_location'])
-
-    backup_location.mkdir(parents=True, exist_ok=True)
-
     try:
-        session_meta = json.loads(conversation)
-    except json.JSONDecodeError:
+        session_meta = fastjson.loads(conversation)
+    except fastjson.JSONDecodeError:
         console.print("[yellow]WARNING: Session metadata parsing failed; backing up as text.[/]")
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_file = backup_location / f"conversation_{timestamp}.txt"
+        backup_file = get_backup_location(backup_config) / f"conversation_{timestamp}.txt"
         with open(backup_file, 'w', encoding='utf-8') as f:
             f.write(conversation)
         return backup_file, None
@@ -202,7 +497,14 @@ def backup_conversation(
         console.print(f"[yellow]WARNING: The transcript file does not exist.: {transcript_path}[/]")
         conversation_data = {'messages': [], 'file_history': {}}
     else:
-        conversation_data = parse_transcript_jsonl(transcript_path)
+        keep_recent = None
+        if not backup_config.get('keep_full_conversation', True):
+            keep_recent = config['compact_strategy'].get('keep_recent_messages', 10)
+        conversation_data = parse_transcript_jsonl(
+            transcript_path,
+            keep_recent=keep_recent,
+            use_cache=backup_config.get('transcript_cache', True)
+        )
 
     backup_data = {
         'backup_metadata': {
@@ -220,18 +522,46 @@ def backup_conversation(
         'statistics': calculate_statistics(conversation_data)
     }
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return None, backup_data
+
+
+def backup_conversation(backup_data: Dict[str, Any], config: Dict[str, Any]) -> Path:
+    """
+    Write parsed backup data to the backup directory
+
+    Returns:
+        Path of the written backup file
+    """
+    backup_config = config['backup']
+    backup_location = get_backup_location(backup_config)
+
+    created_at = datetime.fromisoformat(backup_data['backup_metadata']['timestamp'])
+    timestamp = created_at.strftime('%Y%m%d_%H%M%S')
 
     use_compression = backup_config['compress']
 
-    if use_compression:
+    zstd = None
+    if use_compression and backup_config.get('compress_format', 'gzip') == 'zstd':
+        try:
+            import zstandard as zstd
+        except ImportError:
+            console.print("[yellow]WARNING: The zstandard package is not installed - falling back to gzip[/]")
+
+    if zstd is not None:
+        backup_file = backup_location / f"conversation_{timestamp}.json.zst"
+        compressor = zstd.ZstdCompressor(level=backup_config.get('zstd_level', 3), threads=-1)
+        with open(backup_file, 'wb') as raw, compressor.stream_writer(raw) as writer:
+            writer.write(fastjson.dumps(backup_data))
+    elif use_compression:
         backup_file = backup_location / f"conversation_{timestamp}.json.gz"
-        with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)  # type: ignore[arg-type]
+        compress_level = backup_config.get('compress_level', 1)
+        with open(backup_file, 'wb') as raw, \
+                gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=compress_level) as gz:
+            gz.write(fastjson.dumps(backup_data))
     else:
         backup_file = backup_location / f"conversation_{timestamp}.json"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)
+        with open(backup_file, 'wb') as f:
+            f.write(fastjson.dumps(backup_data, indent=True))
 
     console.print(f"[green]OK[/] Create backup: {backup_file}")
     console.print(f"   Message: {backup_data['statistics']['total_messages']}")
@@ -241,17 +571,24 @@ def backup_conversation(
     max_backups = backup_config['max_backups']
     cleanup_old_backups(backup_location, max_backups)
 
-    return backup_file, backup_data
+    return backup_file
 
 
 def cleanup_old_backups(backup_dir: Path, max_backups: int) -> None:
     """Cleaning Up Old Backup Files"""
-    backups = sorted(backup_dir.glob('conversation_*.*'))
+    # Names embed a %Y%m%d_%H%M%S timestamp, so name order is chronological
+    with os.scandir(backup_dir) as it:
+        backups = [
+            entry for entry in it
+            if entry.name.startswith('conversation_') and '.' in entry.name and entry.is_file()
+        ]
 
-    if len(backups) > max_backups:
-        for backup in backups[:-max_backups]:
-            backup.unlink()
-            console.print(f"Delete: {backup.name}")
+    if len(backups) <= max_backups:
+        return
+
+    for backup in heapq.nsmallest(len(backups) - max_backups, backups, key=lambda e: e.name):
+        os.unlink(backup.path)
+        console.print(f"Delete: {backup.name}")
 
 
 def clean_backup_for_summary(backup_data: Dict[str, Any], keep_recent: int = 10) -> Dict[str, Any]:
@@ -289,7 +626,9 @@ def clean_backup_for_summary(backup_data: Dict[str, Any], keep_recent: int = 10)
 
 def format_conversation_for_claude(messages: List[Dict[str, Any]]) -> str:
     """Formatting dialogue to be passed to Claude CLI"""
-    formatted = []
+    out: List[str] = []
+    append = out.append
+    dumps = fastjson.dumps
 
     for msg in messages:
         msg_type = msg.get('type')
@@ -297,30 +636,88 @@ def format_conversation_for_claude(messages: List[Dict[str, Any]]) -> str:
 
         if msg_type == 'user':
             content = msg.get('content', '')
-            if isinstance(content, str) and content.strip():
-                formatted.append(f"[User - {timestamp}]\n{content}\n")
+            if type(content) is str and content.strip():
+                if out:
+                    append('\n---\n')
+                append(f"[User - {timestamp}]\n{content}\n")
 
         elif msg_type == 'assistant':
             content = msg.get('content', [])
-            text_parts = []
-
-            if isinstance(content, str):
-                text_parts.append(content)
-            elif isinstance(content, list):
+            block_start = len(out)
+            if out:
+                append('\n---\n')
+            append(f"[Assistant - {timestamp}]\n")
+            body_start = len(out)
+
+            if type(content) is str:
+                append(content)
+            elif type(content) is list:
                 for item in content:
-                    if isinstance(item, dict):
-                        if item.get('type') == 'text':
-                            text_parts.append(item.get('text', ''))
-                        elif item.get('type') == 'tool_use':
-                            tool_name = item.get('name', '')
-                            tool_input = item.get('input', {})
-                            text_parts.append(f"[Tool: {tool_name}]\n{tool_input}")
+                    if type(item) is not dict:
+                        continue
+                    item_type = item.get('type')
+                    if item_type == 'text':
+                        if len(out) > body_start:
+                            append('\n')
+                        append(item.get('text', ''))
+                    elif item_type == 'tool_use':
+                        if len(out) > body_start:
+                            append('\n')
+                        append(f"[Tool: {item.get('name', '')}]\n")
+                        append(dumps(item.get('input', {})).decode('utf-8'))
+
+            if len(out) == body_start:
+                # Nothing to show for this message
+                del out[block_start:]
+            else:
+                append('\n')
+
+    return ''.join(out)
+
 
-            if text_parts:
-                text = '\n'.join(text_parts)
-                formatted.append(f"[Assistant - {timestamp}]\n{text}\n")
+def _extract_assistant_text(item: Dict[str, Any]) -> str:
+    """Return the first text block of an assistant entry in Claude CLI output"""
+    content = item.get('message', {}).get('content', [])
+    if isinstance(content, list):
+        for content_item in content:
+            if isinstance(content_item, dict) and content_item.get('type') == 'text':
+                return content_item.get('text', '')
+    return ''
 
-    return '\n---\n'.join(formatted)
+
+# Summary prompt sent to the Claude CLI (filled in with format_map)
+_PROMPT_TMPL = """Please summarize the next development session **concise within 5000 characters**.
+
+## Session Information
+[{focus_areas}] | Session: {session_id}... | Branch: {branch} | Messages: {total_messages} | Duration: {duration_min} minutes
+
+## Summary Rules (Important!)
+1. **Must be within 5000 characters** - Focus on bullet points, keep concise
+2. Core only: Purpose of work → Key changes → Decisions made → Unfinished items
+3. Code: Only filename:line (Minimize code blocks)
+4. Remove unnecessary explanations, repetition, and background information
+
+## Summary Format
+# Previous Session Summary (Working Directory: {cwd})
+
+## Purpose of Work
+[Core objective in 1-2 lines]
+
+## Key Changes
+- File name: Line - [Change details in 1 line]
+
+## Key Decisions
+- [Decision in 1 line]
+
+## Unfinished/Next Steps
+- [TODO items]
+
+---
+
+## Conversation Details
+{conversation_text}
+
+Summarize the key points of the above conversation within 5,000 characters. Remove unnecessary explanations and retain only the information needed to restore the work context."""
 
 
 def generate_claude_cli_summary(
@@ -357,46 +754,19 @@ def generate_claude_cli_summary(
 
     conversation_text = format_conversation_for_claude(messages)
 
-    prompt = f"""Please summarize the next development session **concise within 5000 characters**.
-
-## Session Information
-[{focus_areas}] | Session: {metadata.get('session_id', 'N/A')[:8]}... | Branch: {metadata.get('git_branch', 'N/A')} | Messages: {statistics.get('total_messages', 0)} | Duration: {statistics.get('conversation_duration_seconds', 0)//60} minutes
-
-## Summary Rules (Important!)
-1. **Must be within 5000 characters** - Focus on bullet points, keep concise
-2. Core only: Purpose of work → Key changes → Decisions made → Unfinished items
-3. Code: Only filename:line (Minimize code blocks)
-4. Remove unnecessary explanations, repetition, and background information
-
-## Summary Format
-# Previous Session Summary (Working Directory: {metadata.get('cwd', 'N/A')})
-
-## Purpose of Work
-[Core objective in 1-2 lines]
-
-## Key Changes
-- File name: Line - [Change details in 1 line]
-
-## Key Decisions
-- [Decision in 1 line]
-
-## Unfinished/Next Steps
-- [TODO items]
-
----
-
-## Conversation Details
-{conversation_text}
-
-Summarize the key points of the above conversation within 5,000 characters. Remove unnecessary explanations and retain only the information needed to restore the work context."""
+    prompt = _PROMPT_TMPL.format_map({
+        'focus_areas': focus_areas,
+        'session_id': metadata.get('session_id', 'N/A')[:8],
+        'branch': metadata.get('git_branch', 'N/A'),
+        'total_messages': statistics.get('total_messages', 0),
+        'duration_min': statistics.get('conversation_duration_seconds', 0) // 60,
+        'cwd': metadata.get('cwd', 'N/A'),
+        'conversation_text': conversation_text
+    })
 
     try:
         console.print("[cyan]AI[/] Generating a quick summary with Claude Haiku 4.5...")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write(prompt)
-            temp_file = f.name
-
         # Run Claude CLI (print mode with JSON output)
         # Use empty configuration file and strict mode to disable MCP server
         # Double speed and reduce cost by one-third with Haiku 4.5 model
@@ -411,16 +781,14 @@ Summarize the key points of the above conversation within 5,000 characters. Remo
             '--output-format', 'json'
         ]
 
-        with open(temp_file, 'r', encoding='utf-8') as prompt_file:
-            result = subprocess.run(
-                cmd,
-                stdin=prompt_file,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
-
-        Path(temp_file).unlink(missing_ok=True)
+        # Pass the prompt through a stdin pipe (no temp file round-trip)
+        result = subprocess.run(
+            cmd,
+            input=prompt,
+            capture_output=True,
+            text=True,
+            timeout=180
+        )
 
         if result.returncode != 0:
             console.print(f"[yellow]WARNING: Claude CLI execution failed (exit code: {result.returncode})[/]")
@@ -429,26 +797,20 @@ Summarize the key points of the above conversation within 5,000 characters. Remo
             return None
 
         try:
-            output_data = json.loads(result.stdout)
+            output_data = fastjson.loads(result.stdout)
             summary = ""
 
             if isinstance(output_data, list):
+                # Single pass: the first result wins, else the first assistant text
+                fallback = None
                 for item in output_data:
-                    if isinstance(item, dict) and item.get('type') == 'result':
+                    item_type = item.get('type') if type(item) is dict else None
+                    if item_type == 'result':
                         summary = item.get('result', '')
                         break
-
-                if not summary:
-                    for item in output_data:
-                        if isinstance(item, dict) and item.get('type') == 'assistant':
-                            message = item.get('message', {})
-                            content = message.get('content', [])
-                            if isinstance(content, list):
-                                for content_item in content:
-                                    if isinstance(content_item, dict) and content_item.get('type') == 'text':
-                                        summary = content_item.get('text', '')
-                                        break
-                            break
+                    elif item_type == 'assistant' and fallback is None:
+                        fallback = _extract_assistant_text(item)
+                summary = summary or fallback or ''
             elif isinstance(output_data, dict):
                 summary = output_data.get('result', '')
                 if not summary:
@@ -471,7 +833,7 @@ Summarize the key points of the above conversation within 5,000 characters. Remo
                 console.print(f"   output_data preview: {str(output_data)[:500]}")
                 return None
 
-        except json.JSONDecodeError:
+        except fastjson.JSONDecodeError:
             if result.stdout.strip():
                 console.print("[green]OK[/] Claude CLI Summary Generation Complete (text mode)")
                 return result.stdout.strip()
@@ -479,7 +841,6 @@ Summarize the key points of the above conversation within 5,000 characters. Remo
 
     except subprocess.TimeoutExpired:
         console.print("[yellow]WARNING: Claude CLI execution timeout[/]")
-        Path(temp_file).unlink(missing_ok=True)
         return None
     except FileNotFoundError:
         console.print("[yellow]WARNING: Claude CLI cannot be found. Ensure the 'claude' command is in your PATH.[/]")
@@ -491,57 +852,70 @@ Summarize the key points of the above conversation within 5,000 characters. Remo
         return None
 
 
-def save_to_chromadb_direct(
-    summary: str,
-    backup_data: Dict[str, Any],
-    config: Dict[str, Any]
+def save_to_chromadb_client(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    chromadb_config: Dict[str, Any]
 ) -> tuple[bool, Optional[str]]:
     """
-    Saving to ChromaDB via MCP
+    Saving to ChromaDB via the Python HTTP client
 
-    Calls the claude CLI as a subprocess to save via the MCP chromadb server
-    More stable and faster than direct access via the Python client
+    Adds the documents with batched collection.add() calls instead of
+    starting a Claude CLI session to run a deterministic tool call
 
     Args:
-        summary: Summary
-        backup_data: Backup data
-        config: Settings
+        ids: Document IDs
+        documents: Documents
+        metadatas: Document metadata, parallel to documents
+        chromadb_config: chromadb_integration settings
 
     Returns:
-        (Success status, error message) tuple. True, None on success; False, "error details" on failure.
+        (Success status, error message) tuple
     """
-    metadata = backup_data.get('backup_metadata', {})
-    statistics = backup_data.get('statistics', {})
+    try:
+        client = get_client(chromadb_config)
+        collection = get_collection(chromadb_config)
+        batch_size = min(client.get_max_batch_size(), CHROMADB_MAX_BATCH_SIZE)
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            collection.add(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                # ChromaDB rejects None metadata values
+                metadatas=[
+                    {k: v for k, v in meta.items() if v is not None}
+                    for meta in metadatas[start:end]
+                ]
+            )
+        return True, None
+    except ImportError:
+        return False, "The chromadb package is not installed"
+    except Exception as e:
+        return False, f"ChromaDB client error: {e}"
 
-    doc_id = f"context_compact_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    # Get metadata template from chromadb_integration config
-    chromadb_config = config['chromadb_integration']
-    collection_name = chromadb_config['collection']
-    metadata_template = chromadb_config['metadata_template']
+def save_to_chromadb_mcp(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    collection_name: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Saving to ChromaDB via MCP
 
-    # Build doc_metadata from template, filling in dynamic values
-    doc_metadata = {
-        "project": metadata_template.get('project', 'example_project'),
-        "subproject": metadata_template.get('subproject', 'core'),
-        "type": metadata_template.get('type', 'context_compact'),
-        "date": datetime.now().strftime('%Y-%m-%d'),
-        "summary": f"Context compression - {statistics.get('total_messages', 0)} messages",
-        "tags": metadata_template.get('tags', 'auto-compact, summary'),
-        "status": metadata_template.get('status', 'completed'),
-        # Additional dynamic fields
-        "original_message_count": statistics.get('total_messages', 0),
-        "total_tokens": statistics.get('total_tokens', 0),
-        "session_id": metadata.get('session_id', ''),
-        "git_branch": metadata.get('git_branch', '') or 'unknown',
-        "timestamp": metadata.get('timestamp', '')
-    }
+    Calls the claude CLI as a subprocess to save via the MCP chromadb server
 
-    try:
-        console.print(f"\n[cyan]SAVE[/] Saving to ChromaDB via MCP...")
-        console.print(f"   Collection: {collection_name}")
-        console.print(f"   Document ID: {doc_id}")
+    Args:
+        ids: Document IDs
+        documents: Documents
+        metadatas: Document metadata, parallel to documents
+        collection_name: Collection name
 
+    Returns:
+        (Success status, error message) tuple
+    """
+    try:
         project_root = find_project_root()
         if not project_root:
             return False, "Project root cannot be found"
@@ -552,9 +926,9 @@ def save_to_chromadb_direct(
 
         mcp_request = {
             "collection_name": collection_name,
-            "documents": [summary],
-            "ids": [doc_id],
-            "metadatas": [doc_metadata]
+            "documents": documents,
+            "ids": ids,
+            "metadatas": metadatas
         }
 
         cmd = [
@@ -565,7 +939,7 @@ def save_to_chromadb_direct(
             "--strict-mcp-config",
             "--dangerously-skip-permissions",
             "--output-format", "json",
-            f"Add documents to Chromadb. Use the chroma_add_documents tool.: {json.dumps(mcp_request, ensure_ascii=False)}"
+            f"Add documents to Chromadb. Use the chroma_add_documents tool.: {fastjson.dumps(mcp_request).decode('utf-8')}"
         ]
 
         result = subprocess.run(
@@ -581,16 +955,6 @@ def save_to_chromadb_direct(
             console.print(f"   [yellow]WARNING: {error_detail}[/]")
             return False, error_detail
 
-        try:
-            output = json.loads(result.stdout) if result.stdout else {}
-        except json.JSONDecodeError:
-            output = {"raw": result.stdout}
-
-        console.print(f"   [green]OK[/] ChromaDB saved successfully!")
-        console.print(f"   Message: {statistics.get('total_messages', 0)}")
-        console.print(f"   Token: {statistics.get('total_tokens', 0):,}")
-        console.print(f"   Length: {len(summary)}\n")
-
         return True, None
 
     except subprocess.TimeoutExpired:
@@ -604,6 +968,79 @@ def save_to_chromadb_direct(
         return False, error_detail
 
 
+def save_to_chromadb_direct(
+    summary: str,
+    backup_data: Dict[str, Any],
+    config: Dict[str, Any]
+) -> tuple[bool, Optional[str]]:
+    """
+    Saving to ChromaDB
+
+    Writes through the ChromaDB HTTP client by default. The claude CLI + MCP
+    path is used when `use_mcp_cli` is set, or as a fallback when the client
+    is unavailable or the request fails.
+
+    Args:
+        summary: Summary
+        backup_data: Backup data
+        config: Settings
+
+    Returns:
+        (Success status, error message) tuple. True, None on success; False, "error details" on failure.
+    """
+    metadata = backup_data.get('backup_metadata', {})
+    statistics = backup_data.get('statistics', {})
+
+    now = datetime.now()
+    doc_id = f"context_compact_{now.strftime('%Y%m%d_%H%M%S')}"
+
+    # Get metadata template from chromadb_integration config
+    chromadb_config = config['chromadb_integration']
+    collection_name = chromadb_config['collection']
+    metadata_template = chromadb_config['metadata_template']
+
+    # Build doc_metadata from template, filling in dynamic values
+    doc_metadata = {
+        "project": metadata_template.get('project', 'example_project'),
+        "subproject": metadata_template.get('subproject', 'core'),
+        "type": metadata_template.get('type', 'context_compact'),
+        "date": now.strftime('%Y-%m-%d'),
+        "summary": f"Context compression - {statistics.get('total_messages', 0)} messages",
+        "tags": metadata_template.get('tags', 'auto-compact, summary'),
+        "status": metadata_template.get('status', 'completed'),
+        # Additional dynamic fields
+        "original_message_count": statistics.get('total_messages', 0),
+        "total_tokens": statistics.get('total_tokens', 0),
+        "session_id": metadata.get('session_id', ''),
+        "git_branch": metadata.get('git_branch', '') or 'unknown',
+        "timestamp": metadata.get('timestamp', '')
+    }
+
+    console.print(f"\n[cyan]SAVE[/] Saving to ChromaDB...")
+    console.print(f"   Collection: {collection_name}")
+    console.print(f"   Document ID: {doc_id}")
+
+    ids, documents, metadatas = [doc_id], [summary], [doc_metadata]
+
+    if chromadb_config.get('use_mcp_cli', False):
+        success, error_detail = save_to_chromadb_mcp(ids, documents, metadatas, collection_name)
+    else:
+        success, error_detail = save_to_chromadb_client(ids, documents, metadatas, chromadb_config)
+        if not success:
+            console.print(f"   [yellow]WARNING: {error_detail} - falling back to MCP[/]")
+            success, error_detail = save_to_chromadb_mcp(ids, documents, metadatas, collection_name)
+
+    if not success:
+        return False, error_detail
+
+    console.print(f"   [green]OK[/] ChromaDB saved successfully!")
+    console.print(f"   Message: {statistics.get('total_messages', 0)}")
+    console.print(f"   Token: {statistics.get('total_tokens', 0):,}")
+    console.print(f"   Length: {len(summary)}\n")
+
+    return True, None
+
+
 def save_summary_to_chromadb(
     summary: str,
     backup_data: Dict[str, Any],
@@ -661,6 +1098,90 @@ def remove_pid_file() -> None:
         console.print(f"[yellow]⚠ Failed to delete PID file: {e}[/yellow]")
 
 
+class StatusWriter:
+    """
+    Debounced, atomic writer for compact-status.json
+
+    Updates arriving within the debounce window of the previous write are
+    held in memory and written by a timer; stage changes, terminal states
+    (completed/error) and interpreter exit flush immediately, and terminal
+    states are fsynced. The file is written to a temp
+    file and renamed so the PostToolUse reader never sees partial JSON.
+    """
+
+    def __init__(self, debounce_seconds: float = STATUS_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self.base = {'pid': os.getpid()}
+        self.started_at: Optional[str] = None
+        self.status_file: Optional[Path] = None
+        self.pending: Optional[Dict[str, Any]] = None
+        self.written_stage: Optional[str] = None
+        self.last_write = 0.0
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _get_status_file(self) -> Path:
+        """Resolve the status file path once and create its directory"""
+        if self.status_file is None:
+            project_root = find_project_root()
+            if project_root:
+                status_file = project_root / ".claude" / "recovery" / "compact-status.json"
+            else:
+                status_file = Path(".claude/recovery/compact-status.json")
+            status_file.parent.mkdir(parents=True, exist_ok=True)
+            self.status_file = status_file
+        return self.status_file
+
+    def update(self, fields: Dict[str, Any]) -> None:
+        """Queue a status update and write it now or after the debounce window"""
+        with self.lock:
+            self.pending = {**self.base, **fields}
+            remaining = self.debounce_seconds - (time.monotonic() - self.last_write)
+            urgent = (
+                fields.get('status') in ('completed', 'error')
+                or fields.get('stage') != self.written_stage
+            )
+            if not urgent and remaining > 0:
+                if self.timer is None:
+                    self.timer = threading.Timer(remaining, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the pending status, if any, with an atomic rename"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            if self.pending is None:
+                return
+
+            try:
+                status_file = self._get_status_file()
+                tmp_file = status_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(fastjson.dumps(self.pending))
+                    # Terminal states must survive a crash right after the hook exits
+                    if self.pending.get('status') in ('completed', 'error'):
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_file, status_file)
+                self.written_stage = self.pending.get('stage')
+            except Exception as e:
+                console.print(f"[yellow]⚠ 진행 상태 업데이트 실패: {e}[/yellow]")
+            finally:
+                self.pending = None
+                self.last_write = time.monotonic()
+
+
+_status_writer = StatusWriter()
+
+
 def update_progress_status(
     status: str,
     stage: str,
@@ -680,39 +1201,23 @@ def update_progress_status(
         error: Error message if status is error
         started_at: ISO timestamp when started (for first call)
     """
-    try:
-        project_root = find_project_root()
-        if project_root:
-            status_file = project_root / ".claude" / "recovery" / "compact-status.json"
-        else:
-            status_file = Path(".claude/recovery/compact-status.json")
-
-        status_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Load existing data to preserve started_at
-        existing_started_at = started_at
-        if status_file.exists() and not started_at:
-            try:
-                existing_data = json.loads(status_file.read_text(encoding='utf-8'))
-                existing_started_at = existing_data.get('started_at')
-            except Exception:
-                pass
-
-        status_data = {
-            'pid': os.getpid(),
-            'status': status,
-            'stage': stage,
-            'progress': progress,
-            'message': message,
-            'started_at': existing_started_at or datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
-            'completed_at': datetime.now().isoformat() if status == 'completed' else None,
-            'error': error
-        }
-
-        status_file.write_text(json.dumps(status_data, indent=2, ensure_ascii=False), encoding='utf-8')
-    except Exception as e:
-        console.print(f"[yellow]⚠ 진행 상태 업데이트 실패: {e}[/yellow]")
+    now = datetime.now().isoformat()
+    # Keep started_at from the first call in memory
+    if started_at:
+        _status_writer.started_at = started_at
+    elif _status_writer.started_at is None:
+        _status_writer.started_at = now
+
+    _status_writer.update({
+        'status': status,
+        'stage': stage,
+        'progress': progress,
+        'message': message,
+        'started_at': _status_writer.started_at,
+        'updated_at': now,
+        'completed_at': now if status == 'completed' else None,
+        'error': error
+    })
 
 
 def save_compact_state(
@@ -754,8 +1259,8 @@ def save_compact_state(
             'conversation_duration': statistics.get('conversation_duration_seconds', 0)
         }
 
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    with open(recovery_file, 'wb') as f:
+        f.write(fastjson.dumps(state))
 
 
 def create_compact_marker(config: Dict[str, Any]) -> None:
@@ -776,24 +1281,26 @@ def create_compact_marker(config: Dict[str, Any]) -> None:
         'message': 'Automatic context compression has occurred. Summarize the conversation and save it to ChromaDB.'
     }
 
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    with open(recovery_file, 'wb') as f:
+        f.write(fastjson.dumps(state))
 
 
 def main():
     """Main Function"""
     init_sentry('auto-compact', additional_tags={'hook_type': 'pre_compact'})
+    # Deliver pending Sentry events at interpreter exit instead of on the hot path
+    atexit.register(flush, timeout=1.0)
 
     logger = HookLogger("auto-compact")
 
     try:
         logger.log_start()
 
-        add_breadcrumb("Hook execution started", category="lifecycle")
+        breadcrumb_buffer.record("Hook execution started", category="lifecycle")
 
         pid_file = create_pid_file()
         if pid_file:
-            add_breadcrumb("PID file created", category="progress", data={"pid": os.getpid()})
+            breadcrumb_buffer.record("PID file created", category="progress", data={"pid": os.getpid()})
             logger.log_info("PID File Creation", pid=os.getpid(), pid_file=str(pid_file))
 
         start_time = datetime.now().isoformat()
@@ -806,7 +1313,7 @@ def main():
         )
 
         config = load_auto_compact_config()
-        add_breadcrumb("Config loaded successfully", category="config", data={"collection": config['chromadb_integration']['collection']})
+        breadcrumb_buffer.record("Config loaded successfully", category="config", data={"collection": config['chromadb_integration']['collection']})
 
         update_progress_status(
             status="running",
@@ -817,14 +1324,21 @@ def main():
 
         conversation = ""
         try:
-            if select.select([sys.stdin], [], [], 5)[0]:
+            # Only block on stdin when something is piped in; a terminal means manual run
+            try:
+                stdin_mode = os.fstat(sys.stdin.fileno()).st_mode
+                piped = stat.S_ISFIFO(stdin_mode) or stat.S_ISSOCK(stdin_mode) or stat.S_ISREG(stdin_mode)
+            except OSError:
+                # In-memory stdin handed over by an in-process caller (hooks.py auto-compact)
+                piped = True
+            if piped:
                 conversation = sys.stdin.read()
                 logger.log_info(
                     "Reading dialogue content from stdin successful",
                     content_length=len(conversation) if conversation else 0
                 )
             else:
-                warning_msg = "stdin read timeout (5 seconds) - Manual compression or stdin not passed"
+                warning_msg = "stdin is not a pipe - Manual compression or stdin not passed"
                 console.print(f"[yellow]WARNING: {warning_msg}[/]")
                 logger.log_error(warning_msg)
         except Exception as e:
@@ -841,11 +1355,39 @@ def main():
                 progress=20,
                 message="Backing up conversation content..."
             )
-            add_breadcrumb("Starting backup creation", category="backup", data={"size": len(conversation)})
-            backup_file, backup_data = backup_conversation(conversation, config)
-            if backup_file:
-                stats = backup_data.get('statistics', {}) if backup_data else {}
-                add_breadcrumb("Backup created successfully", category="backup", data={
+            breadcrumb_buffer.record("Starting backup creation", category="backup", data={"size": len(conversation)})
+            backup_file, backup_data = prepare_backup(conversation, config)
+        else:
+            warning_msg = "Conversation content not delivered - either manually compressed or empty conversation"
+            breadcrumb_buffer.record(warning_msg, category="backup", level="warning")
+            logger.log_error(warning_msg)
+
+        create_compact_marker(config)
+        breadcrumb_buffer.record("Compact marker created", category="marker")
+        logger.log_info("압축 마커 생성 완료")
+
+        summary = ""
+        if backup_data:
+            # The summary only needs the most recent messages
+            keep_recent = config['compact_strategy'].get('keep_recent_messages', 10)
+            summary_input = clean_backup_for_summary(backup_data, keep_recent=keep_recent)
+
+            # Once the transcript is parsed, the backup write and the Claude CLI
+            # summary are independent, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                backup_future = executor.submit(backup_conversation, backup_data, config)
+                summary_future = executor.submit(generate_claude_cli_summary, summary_input, config)
+                breadcrumb_buffer.record("Starting summary generation", category="summary")
+
+                backup_file = backup_future.result()
+                # Past this point only metadata and statistics are used; drop the
+                # full transcript so it is not held during the Claude CLI call
+                backup_data = {
+                    key: value for key, value in backup_data.items()
+                    if key not in ('conversation', 'file_history')
+                }
+                stats = backup_data.get('statistics', {})
+                breadcrumb_buffer.record("Backup created successfully", category="backup", data={
                     "file": str(backup_file),
                     "messages": stats.get('total_messages', 0),
                     "tokens": stats.get('total_tokens', 0)
@@ -862,28 +1404,17 @@ def main():
                     progress=40,
                     message=f"Backup complete ({stats.get('total_messages', 0)} messages)"
                 )
-        else:
-            warning_msg = "Conversation content not delivered - either manually compressed or empty conversation"
-            add_breadcrumb(warning_msg, category="backup", level="warning")
-            logger.log_error(warning_msg)
-
-        create_compact_marker(config)
-        add_breadcrumb("Compact marker created", category="marker")
-        logger.log_info("압축 마커 생성 완료")
+                update_progress_status(
+                    status="running",
+                    stage="summary",
+                    progress=50,
+                    message="Generating a summary using Claude CLI..."
+                )
 
-        summary = ""
-        if backup_data:
-            update_progress_status(
-                status="running",
-                stage="summary",
-                progress=50,
-                message="Generating a summary using Claude CLI..."
-            )
-            add_breadcrumb("Starting summary generation", category="summary")
-            summary = generate_claude_cli_summary(backup_data, config)
+                summary = summary_future.result()
 
             if summary:
-                add_breadcrumb("Summary generated successfully", category="summary", data={"length": len(summary)})
+                breadcrumb_buffer.record("Summary generated successfully", category="summary", data={"length": len(summary)})
                 logger.log_info("Summary generation complete", summary_length=len(summary))
                 update_progress_status(
                     status="running",
@@ -898,11 +1429,11 @@ def main():
                     progress=80,
                     message="Saving to ChromaDB..."
                 )
-                add_breadcrumb("Saving to ChromaDB", category="chromadb")
+                breadcrumb_buffer.record("Saving to ChromaDB", category="chromadb")
                 success, error_msg = save_summary_to_chromadb(summary, backup_data, config)
 
                 if success:
-                    add_breadcrumb("ChromaDB save successful", category="chromadb")
+                    breadcrumb_buffer.record("ChromaDB save successful", category="chromadb")
                     logger.log_info("ChromaDB saved successfully")
                     update_progress_status(
                         status="running",
@@ -911,10 +1442,11 @@ def main():
                         message="ChromaDB saved successfully"
                     )
                 else:
-                    add_breadcrumb("ChromaDB save failed", category="chromadb", level="error",
-                                 data={"error": error_msg})
+                    breadcrumb_buffer.record("ChromaDB save failed", category="chromadb", level="error",
+                                             data={"error": error_msg})
                     logger.log_error(f"ChromaDB storage failure: {error_msg}")
 
+                    breadcrumb_buffer.replay()
                     capture_exception(
                         Exception(f"ChromaDB save failed: {error_msg}"),
                         context={
@@ -925,7 +1457,7 @@ def main():
                         }
                     )
             else:
-                add_breadcrumb("Summary generation failed", category="summary", level="error")
+                breadcrumb_buffer.record("Summary generation failed", category="summary", level="error")
                 logger.log_error("Summary generation failed")
         else:
             logger.log_error("No backup data")
@@ -938,7 +1470,7 @@ def main():
                 message="Saving compressed state..."
             )
             save_compact_state(backup_file, summary, config, backup_data)
-            add_breadcrumb("Compact state saved", category="state")
+            breadcrumb_buffer.record("Compact state saved", category="state")
             logger.log_info("Compression state saved successfully")
 
         update_progress_status(
@@ -949,7 +1481,7 @@ def main():
         )
 
         remove_pid_file()
-        add_breadcrumb("PID file removed", category="progress")
+        breadcrumb_buffer.record("PID file removed", category="progress")
         logger.log_info("PID file deletion complete")
 
         logger.log_end(
@@ -958,14 +1490,14 @@ def main():
             summary_generated=bool(summary)
         )
 
-        # Sentry flush before exit
-        flush()
         sys.exit(0)
 
     except Exception as e:
         error_msg = f"Error occurred: {e}"
         console.print(f"[red]ERROR: {error_msg}[/]")
-        traceback.print_exc(file=sys.stderr)
+        # Full traceback goes to Sentry; print it locally only when debugging
+        if os.environ.get("CLAUDE_HOOK_DEBUG"):
+            traceback.print_exc(file=sys.stderr)
 
         update_progress_status(
             status="error",
@@ -978,6 +1510,7 @@ def main():
         remove_pid_file()
 
         # Capture exception to Sentry
+        breadcrumb_buffer.replay()
         capture_exception(e, context={
             "hook": "auto-compact",
             "error_message": error_msg
@@ -985,8 +1518,8 @@ def main():
 
         logger.log_end(success=False, error=str(e))
 
-        # Flush Sentry before exit
-        flush()
+        # Flush Sentry before exit so the error report is delivered
+        flush(timeout=2.0)
         sys.exit(1)
 
 
@@ -7,27 +7,53 @@ This package contains shared utilities used across different hook scripts:
 - formatting: Rich terminal formatting utilities
 - sentry: Sentry monitoring and error tracking
 - servers: Server management utilities
+- fastjson: orjson-backed JSON helpers with stdlib fallback
+- chroma_client: Cached ChromaDB HTTP client and collections
+- breadcrumb_buffer: Sentry breadcrumbs deferred until an exception is captured
 """
 
-from .config import load_config, load_auto_compact_config, load_settings
-from .logger import HookLogger
-from .formatting import (
-    console,
-    print_rule,
-    create_info_table,
-    create_rules_table,
-)
-from .sentry import (
-    init_sentry,
-    capture_exception,
-    capture_message,
-    add_breadcrumb,
-    flush,
-)
-from .servers import (
-    get_server_status_internal,
-    SERVER_CONFIG,
-)
+import importlib
+
+# Re-exported names and the submodule defining each. Submodules are imported
+# on first access, so hooks that only need e.g. `common.fastjson` don't pay
+# for rich, typer and sentry_sdk at startup.
+_EXPORTS = {
+    # Config
+    'load_config': 'config',
+    'load_auto_compact_config': 'config',
+    'load_settings': 'config',
+
+    # Logger
+    'HookLogger': 'logger',
+
+    # Formatting
+    'console': 'formatting',
+    'print_rule': 'formatting',
+    'create_info_table': 'formatting',
+    'create_rules_table': 'formatting',
+
+    # Sentry
+    'init_sentry': 'sentry',
+    'capture_exception': 'sentry',
+    'capture_message': 'sentry',
+    'add_breadcrumb': 'sentry',
+    'flush': 'sentry',
+
+    # Servers
+    'get_server_status_internal': 'servers',
+    'SERVER_CONFIG': 'servers',
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Config
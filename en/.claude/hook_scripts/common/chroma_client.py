@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+ChromaDB Client Utility for Claude Code Hooks
+
+Process-wide cached ChromaDB HTTP client and collections. The ChromaDB
+server configured in `chromadb_integration` is the long-lived process that
+keeps the index resident; hooks only reuse their connection to it.
+
+chromadb is imported lazily so hooks that never store documents don't pay
+for the import.
+"""
+from functools import cache
+from typing import Any, Dict
+
+
+DEFAULT_HOST = 'localhost'
+DEFAULT_PORT = 8000
+
+
+@cache
+def _get_http_client(host: str, port: int):
+    """Create the HTTP client once per host/port"""
+    import chromadb
+
+    return chromadb.HttpClient(host=host, port=port)
+
+
+@cache
+def _get_collection(host: str, port: int, name: str):
+    """Resolve a collection once per host/port/name"""
+    return _get_http_client(host, port).get_or_create_collection(name)
+
+
+def get_client(chromadb_config: Dict[str, Any]):
+    """
+    Get the cached ChromaDB HTTP client.
+
+    Args:
+        chromadb_config: chromadb_integration settings (host, port)
+
+    Returns:
+        chromadb HttpClient
+
+    Raises:
+        ImportError: If the chromadb package is not installed
+    """
+    return _get_http_client(
+        chromadb_config.get('host', DEFAULT_HOST),
+        chromadb_config.get('port', DEFAULT_PORT)
+    )
+
+
+def get_collection(chromadb_config: Dict[str, Any]):
+    """
+    Get the cached collection named by `chromadb_config['collection']`.
+
+    Args:
+        chromadb_config: chromadb_integration settings (host, port, collection)
+
+    Returns:
+        chromadb Collection
+
+    Raises:
+        ImportError: If the chromadb package is not installed
+    """
+    return _get_collection(
+        chromadb_config.get('host', DEFAULT_HOST),
+        chromadb_config.get('port', DEFAULT_PORT),
+        chromadb_config['collection']
+    )
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Fast JSON Utilities for Claude Code Hooks
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise, so hooks keep working on a bare python3.
+"""
+import json
+import mmap
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are parsed straight from a read-only mapping
+MMAP_THRESHOLD = 1 << 20
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: JSON document (UTF-8 bytes or str)
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a JSON file.
+
+    With orjson, files of MMAP_THRESHOLD bytes or more are memory-mapped
+    and parsed from the mapping instead of being copied into a bytes
+    object first.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed Python object
+    """
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Non-ASCII characters are written as-is (never escaped), and compact
+    output has no whitespace after separators, as with orjson.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -10,7 +10,6 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.rule import Rule
 from rich.theme import Theme
-from rich.syntax import Syntax
 from typing import List, Dict, Any, Optional, Tuple
 
 
@@ -181,6 +180,8 @@ def print_git_status(
 def print_metadata_template(metadata: Dict[str, Any], title: str = "Metadata Template") -> None:
     """Output metadata template in JSON format"""
     json_str = json.dumps(metadata, indent=2, ensure_ascii=False)
+    from rich.syntax import Syntax
+
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
 
     console.print(f"\n[bold cyan]{title}[/bold cyan]")
@@ -194,6 +195,8 @@ def print_code_example(
     title: Optional[str] = None
 ) -> None:
     """Output code examples with syntax highlighting"""
+    from rich.syntax import Syntax
+
     syntax = Syntax(code, language, theme="monokai", line_numbers=False)
 
     if title:
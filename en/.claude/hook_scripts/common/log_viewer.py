@@ -6,30 +6,83 @@ Context-Aware Efficient Log Analysis Tool
 """
 
 import json
+import os
 import sys
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.syntax import Syntax
-from rich import box
+try:
+    import orjson
+    _loads = orjson.loads
 
-app = typer.Typer(help="Hook Logs Viewer - Hook Script Log Viewing and Analysis")
-console = Console()
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Block size for reading log files backwards from the end
+TAIL_READ_BLOCK = 128 * 1024
+
+# end-event fields shown in the "Additional information" column, in display order
+EXTRA_KEYS = (
+    "backup_created", "summary_generated", "summary_length",
+    "action", "status", "reason", "skipped", "sections_printed", "error",
+)
+
+
+@cache
+def get_console():
+    """Rich console for terminal output (rich is imported on first use)"""
+    from rich.console import Console
+
+    return Console(highlight=False, soft_wrap=True)
+
+
+@cache
+def _find_log_dir_cached(cwd: str) -> Optional[Path]:
+    """Walk up from cwd looking for .claude/logs/hooks (cached per cwd)"""
+    current = cwd
+    while True:
+        log_dir = os.path.join(current, ".claude", "logs", "hooks")
+        if os.path.isdir(log_dir):
+            return Path(log_dir)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def find_log_dir() -> Optional[Path]:
     """Finding the Log Directory"""
-    current = Path.cwd()
-    for parent in [current] + list(current.parents):
-        log_dir = parent / ".claude" / "logs" / "hooks"
-        if log_dir.exists():
-            return log_dir
-    return None
+    return _find_log_dir_cached(os.getcwd())
+
+
+def _tail_lines(path: Path, n: int, block: int = TAIL_READ_BLOCK) -> List[bytes]:
+    """Return the last n lines of a file, reading backwards in blocks"""
+    if n <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b''
+        newlines = 0
+        while pos > 0 and newlines <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b'\n')
+            buf = chunk + buf
+
+    lines = buf.split(b'\n')
+    if lines[-1] == b'':
+        lines.pop()
+    return lines[-n:]
 
 
 def read_logs(script_name: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -44,15 +97,13 @@ def read_logs(script_name: str, limit: int = 20) -> List[Dict[str, Any]]:
 
     logs = []
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            for line in lines[-limit:]:
-                line = line.strip()
-                if line:
-                    try:
-                        logs.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
+        for line in _tail_lines(log_file, limit):
+            line = line.strip()
+            if line:
+                try:
+                    logs.append(_loads(line))
+                except ValueError:
+                    pass
     except Exception:
         pass
 
@@ -61,6 +112,10 @@ def read_logs(script_name: str, limit: int = 20) -> List[Dict[str, Any]]:
 
 def format_timestamp(ts: str) -> str:
     """Convert timestamps to a readable format"""
+    # Fast path for the fixed-width ISO 8601 timestamps HookLogger writes
+    if len(ts) >= 19 and ts[4] == '-' and ts[10] in ('T', ' ') and ts[13] == ':' and ts[16] == ':':
+        return f"{ts[5:10]} {ts[11:19]}"
+
     try:
         dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
         return dt.strftime('%m-%d %H:%M:%S')
@@ -68,7 +123,32 @@ def format_timestamp(ts: str) -> str:
         return ts
 
 
-def analyze_logs(script_name: str, limit: int = 20, errors_only: bool = False) -> Dict[str, Any]:
+def _build_run_info(
+    start_log: Dict[str, Any],
+    end_log: Optional[Dict[str, Any]],
+    fmt: Callable[[str], str] = format_timestamp
+) -> Dict[str, Any]:
+    """Build a recent-run row from a start log and its matching end log"""
+    run_info = {
+        "timestamp": fmt(start_log.get('timestamp', '')),
+        "success": end_log.get('success') if end_log else None,
+        "duration": end_log.get('duration_seconds') if end_log else None,
+    }
+
+    if end_log:
+        for key, value in end_log.items():
+            if key not in ['timestamp', 'event', 'script', 'success', 'duration_seconds']:
+                run_info[key] = value
+
+    return run_info
+
+
+def analyze_logs(
+    script_name: str,
+    limit: int = 20,
+    errors_only: bool = False,
+    compact: bool = False
+) -> Dict[str, Any]:
     """Log Analysis and Summary"""
     logs = read_logs(script_name, limit)
 
@@ -79,48 +159,53 @@ def analyze_logs(script_name: str, limit: int = 20, errors_only: bool = False) -
             "message": f"{script_name} The log file is missing or empty."
         }
 
-    total_runs = sum(1 for log in logs if log.get('event') == 'start')
-    successful_runs = sum(1 for log in logs if log.get('event') == 'end' and log.get('success'))
-    failed_runs = sum(1 for log in logs if log.get('event') == 'end' and not log.get('success'))
-    errors = [log for log in logs if log.get('event') == 'error']
-
-    recent_runs = []
-    for i, log in enumerate(logs):
-        if log.get('event') == 'start':
-            start_log = log
-            end_log = None
-            for j in range(i + 1, len(logs)):
-                if logs[j].get('event') == 'end':
-                    end_log = logs[j]
-                    break
-
-            run_info = {
-                "timestamp": format_timestamp(start_log.get('timestamp', '')),
-                "success": end_log.get('success') if end_log else None,
-                "duration": end_log.get('duration_seconds') if end_log else None,
-            }
-
-            if end_log:
-                for key, value in end_log.items():
-                    if key not in ['timestamp', 'event', 'script', 'success', 'duration_seconds']:
-                        run_info[key] = value
-
-            recent_runs.append(run_info)
+    # Compact (JSON) output keeps raw ISO timestamps
+    fmt = (lambda ts: ts) if compact else format_timestamp
 
     if errors_only:
+        errors = [
+            {
+                "timestamp": fmt(err.get('timestamp', '')),
+                "error": err.get('error', err.get('message', 'Unknown error'))
+            }
+            for err in logs
+            if err.get('event') == 'error'
+        ]
         return {
             "status": "errors",
             "script": script_name,
             "total_errors": len(errors),
-            "errors": [
-                {
-                    "timestamp": format_timestamp(err.get('timestamp', '')),
-                    "error": err.get('error', err.get('message', 'Unknown error'))
-                }
-                for err in errors
-            ]
+            "errors": errors
         }
 
+    total_runs = 0
+    successful_runs = 0
+    failed_runs = 0
+    errors = []
+    # (start, end) pairs; rows are only built for the runs that are returned
+    run_pairs = []
+    # Starts waiting for the next end event (consecutive starts share that end)
+    pending_starts = []
+
+    for log in logs:
+        event = log.get('event')
+        if event == 'start':
+            total_runs += 1
+            pending_starts.append(log)
+        elif event == 'end':
+            if log.get('success'):
+                successful_runs += 1
+            else:
+                failed_runs += 1
+            for start_log in pending_starts:
+                run_pairs.append((start_log, log))
+            pending_starts.clear()
+        elif event == 'error':
+            errors.append(log)
+
+    for start_log in pending_starts:
+        run_pairs.append((start_log, None))
+
     return {
         "status": "ok",
         "script": script_name,
@@ -130,10 +215,10 @@ def analyze_logs(script_name: str, limit: int = 20, errors_only: bool = False) -
             "failed_runs": failed_runs,
             "error_count": len(errors)
         },
-        "recent_runs": recent_runs[-5:],
+        "recent_runs": [_build_run_info(start, end, fmt) for start, end in run_pairs[-5:]],
         "errors": [
             {
-                "timestamp": format_timestamp(err.get('timestamp', '')),
+                "timestamp": fmt(err.get('timestamp', '')),
                 "error": err.get('error', err.get('message', 'Unknown error'))
             }
             for err in errors[-3:]
@@ -147,43 +232,59 @@ def get_all_scripts() -> List[str]:
     if not log_dir:
         return []
 
-    scripts = []
-    for log_file in log_dir.glob("*.log"):
-        scripts.append(log_file.stem)
-    return sorted(scripts)
+    with os.scandir(log_dir) as it:
+        return sorted(
+            entry.name[:-4] for entry in it
+            if entry.name.endswith('.log') and entry.is_file()
+        )
 
 
-@app.command()
 def view(
-    script: Optional[str] = typer.Argument(None, help="Script name (e.g., session_start)"),
-    limit: int = typer.Option(20, "--limit", "-n", help="Number of logs to query"),
-    errors: bool = typer.Option(False, "--errors", "-e", help="Display only errors"),
-    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
-):
+    script: Optional[str] = None,
+    limit: int = 20,
+    errors: bool = False,
+    json_output: bool = False,
+    color: bool = False,
+) -> int:
     """Hook Script Log View"""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    console = get_console()
 
     if not script:
         console.print("[yellow]WARNING[/] Specify the script name.", style="bold")
         console.print("\nExample: [cyan]python view_logs.py session_start[/]")
         console.print("or: [cyan]python view_logs.py --list[/]")
-        raise typer.Exit(1)
-
-    result = analyze_logs(script, limit, errors)
+        return 1
 
     if json_output:
-        console.print(Syntax(json.dumps(result, indent=2, ensure_ascii=False), "json"))
-        return
+        result = analyze_logs(script, limit, errors, compact=True)
+        data = _dumps(result)
+        if color:
+            from rich.syntax import Syntax
+            console.print(Syntax(data.decode('utf-8'), "json"))
+        else:
+            sys.stdout.buffer.write(data + b'\n')
+        return 0
+
+    result = analyze_logs(script, limit, errors)
+    renderables = []
 
-    console.print(Panel(f"LOG ANALYSIS: {result['script']}", style="cyan bold", box=box.DOUBLE))
-    console.print()
+    renderables.append(Panel(f"LOG ANALYSIS: {result['script']}", style="cyan bold", box=box.DOUBLE))
+    renderables.append("")
 
     if result['status'] == 'no_logs':
-        console.print(f"[yellow]WARNING[/] {result['message']}", style="bold")
-        return
+        renderables.append(Text.from_markup(f"[yellow]WARNING[/] {result['message']}", style="bold"))
+        console.print(Group(*renderables))
+        return 0
 
     if result['status'] == 'errors':
-        console.print(f"[red]ERROR[/] Total {result['total_errors']} errors", style="bold")
-        console.print()
+        renderables.append(Text.from_markup(f"[red]ERROR[/] Total {result['total_errors']} errors", style="bold"))
+        renderables.append("")
 
         error_table = Table(show_header=True, header_style="bold red", box=box.ROUNDED)
         error_table.add_column("Time", style="cyan")
@@ -192,8 +293,9 @@ def view(
         for err in result['errors']:
             error_table.add_row(err['timestamp'], err['error'])
 
-        console.print(error_table)
-        return
+        renderables.append(error_table)
+        console.print(Group(*renderables))
+        return 0
 
     stats = result['statistics']
 
@@ -206,8 +308,8 @@ def view(
     stats_table.add_row("Failure", f"[red]{stats['failed_runs']}회[/]")
     stats_table.add_row("Error", f"[yellow]{stats['error_count']}개[/]")
 
-    console.print(Panel(stats_table, title="STATISTICS", border_style="cyan"))
-    console.print()
+    renderables.append(Panel(stats_table, title="STATISTICS", border_style="cyan"))
+    renderables.append("")
 
     if result['recent_runs']:
         runs_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
@@ -226,31 +328,34 @@ def view(
 
             duration = f"{run['duration']:.3f}s" if run.get('duration') else "N/A"
 
-            extra_info = []
-            for key, value in run.items():
-                if key not in ['timestamp', 'success', 'duration']:
-                    extra_info.append(f"{key}: {value}")
-            extra_str = ", ".join(extra_info) if extra_info else "-"
+            extra_str = ", ".join(f"{key}: {run[key]}" for key in EXTRA_KEYS if key in run) or "-"
 
             runs_table.add_row(status, run['timestamp'], duration, extra_str)
 
-        console.print(Panel(runs_table, title="RECENT RUNS", border_style="cyan"))
-        console.print()
+        renderables.append(Panel(runs_table, title="RECENT RUNS", border_style="cyan"))
+        renderables.append("")
 
     if result['errors']:
-        console.print("[red bold]RECENT ERRORS:[/]")
+        renderables.append("[red bold]RECENT ERRORS:[/]")
         for err in result['errors']:
-            console.print(Panel(
+            renderables.append(Panel(
                 f"[red]{err['error']}[/]",
                 title=f"[red]{err['timestamp']}[/]",
                 border_style="red"
             ))
-        console.print()
+        renderables.append("")
+
+    console.print(Group(*renderables))
+    return 0
 
 
-@app.command("list")
-def list_scripts():
+def list_scripts() -> None:
     """Display list of available scripts"""
+    from rich.table import Table
+    from rich import box
+
+    console = get_console()
+
     scripts = get_all_scripts()
 
     if not scripts:
@@ -267,5 +372,32 @@ def list_scripts():
     console.print(table)
 
 
+def _get_app():
+    """Build the Typer CLI (typer is only imported when run as a command)"""
+    import typer
+
+    app = typer.Typer(help="Hook Logs Viewer - Hook Script Log Viewing and Analysis")
+
+    @app.command("view")
+    def view_command(
+        script: Optional[str] = typer.Argument(None, help="Script name (e.g., session_start)"),
+        limit: int = typer.Option(20, "--limit", "-n", help="Number of logs to query"),
+        errors: bool = typer.Option(False, "--errors", "-e", help="Display only errors"),
+        json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+        color: bool = typer.Option(False, "--color", help="Colorize JSON output"),
+    ):
+        """Hook Script Log View"""
+        exit_code = view(script, limit, errors, json_output, color)
+        if exit_code:
+            raise typer.Exit(exit_code)
+
+    @app.command("list")
+    def list_command():
+        """Display list of available scripts"""
+        list_scripts()
+
+    return app
+
+
 if __name__ == "__main__":
-    app()
+    _get_app()()
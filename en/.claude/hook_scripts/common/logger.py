@@ -2,13 +2,18 @@
 """
 Hook Logger - Hook Script Logging System
 """
+import atexit
 import json
 import os
+import signal
 import sys
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 
+from . import fastjson
 from .config import load_settings
 from rich.console import Console
 
@@ -23,6 +28,44 @@ LOG_LEVELS = {
     'CRITICAL': 50
 }
 
+# Pending JSONL records are written out once they would exceed this size;
+# a typical hook run fits in one write
+LOG_BUFFER_SIZE = 8192
+
+# Loggers with an open file sink, flushed at exit and on SIGTERM
+_open_loggers: "weakref.WeakSet[HookLogger]" = weakref.WeakSet()
+_sigterm_handler_installed = False
+
+
+def _flush_open_loggers() -> None:
+    """Flush every logger that still has buffered records"""
+    for hook_logger in list(_open_loggers):
+        hook_logger.flush()
+
+
+def _handle_sigterm(signum, frame) -> None:
+    """Flush buffered records, then terminate with the default SIGTERM action"""
+    _flush_open_loggers()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _install_sigterm_handler() -> None:
+    """Install the flushing SIGTERM handler unless the script set its own"""
+    global _sigterm_handler_installed
+    if _sigterm_handler_installed:
+        return
+    _sigterm_handler_installed = True
+    try:
+        if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, _handle_sigterm)
+    except ValueError:
+        # Not called from the main thread
+        pass
+
+
+atexit.register(_flush_open_loggers)
+
 
 class HookLogger:
     """Hook Script Logger"""
@@ -58,6 +101,15 @@ class HookLogger:
         self.rotation_enabled = rotation_config.get('enabled', True)
         self.max_size_mb = rotation_config.get('max_size_mb', 10)
 
+        # Guards the log file sink when worker threads log concurrently
+        self._file_lock = threading.RLock()
+        # Unbuffered append handle, opened on the first write
+        self._file = None
+        # Encoded JSONL records not yet written; only whole records are written, so
+        # concurrent runs appending to the same log never interleave half-lines
+        self._pending_records: List[bytes] = []
+        self._pending_size = 0
+
     def _get_log_dir(self) -> Path:
         """Return and Create Log Directory Path"""
         project_root = self._find_project_root()
@@ -130,6 +182,7 @@ class HookLogger:
             **kwargs
         }
         self._write_log(log_entry, level=level)
+        self.flush()
 
     def log_info(self, message: str, **kwargs) -> None:
         """Information Log"""
@@ -158,6 +211,7 @@ class HookLogger:
             **kwargs
         }
         self._write_log(log_entry, level='ERROR')
+        self.flush()
 
     def log_warning(self, message: str, **kwargs) -> None:
         """Warning Log"""
@@ -176,14 +230,17 @@ class HookLogger:
     def _write_log(self, log_entry: Dict[str, Any], level: str = 'INFO') -> None:
         """Log records (output varies by handler)"""
         try:
-            # Check rotation before writing
-            if self.rotation_enabled and 'file' in self.handlers:
-                self._check_rotation()
-
             # Write to file handler (JSON format)
             if 'file' in self.handlers:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+                record = fastjson.dumps(log_entry) + b'\n'
+                # Serialize rotation + append across threads sharing this logger
+                with self._file_lock:
+                    if self._pending_size + len(record) > LOG_BUFFER_SIZE:
+                        self._write_records()
+                    self._pending_records.append(record)
+                    self._pending_size += len(record)
+                _open_loggers.add(self)
+                _install_sigterm_handler()
 
             # Write to console handler (formatted)
             if 'console' in self.handlers:
@@ -197,6 +254,33 @@ class HookLogger:
         except Exception as e:
             console.print(f"[yellow]WARNING: Log write failed: {e}[/]")
 
+    def _open_file(self) -> None:
+        """Open the unbuffered O_APPEND log file sink (rotation is checked once per run)"""
+        if self.rotation_enabled:
+            self._check_rotation()
+        self._file = open(self.log_file, 'ab', buffering=0)
+
+    def _write_records(self) -> None:
+        """Append pending records to the log file in whole-record writes (caller holds _file_lock)"""
+        if not self._pending_records:
+            return
+        if self._file is None:
+            self._open_file()
+
+        data = memoryview(b''.join(self._pending_records))
+        self._pending_records.clear()
+        self._pending_size = 0
+        while data:
+            data = data[self._file.write(data):]
+
+    def flush(self) -> None:
+        """Write buffered log records to the log file"""
+        with self._file_lock:
+            try:
+                self._write_records()
+            except Exception as e:
+                console.print(f"[yellow]WARNING: Log flush failed: {e}[/]")
+
     def _format_message(self, log_entry: Dict[str, Any], level: str) -> str:
         """Format log message according to config format string"""
         timestamp_str = datetime.fromisoformat(log_entry['timestamp']).strftime(self.timestamp_format)
@@ -247,11 +331,12 @@ class HookLogger:
         try:
             # Import here to avoid circular imports
             from .sentry import capture_message, add_breadcrumb, _sentry_initialized
-            import sentry_sdk
 
             if not _sentry_initialized:
                 return
 
+            import sentry_sdk
+
             # Add project description to Sentry context
             if self.description:
                 sentry_sdk.set_context('project_info', {
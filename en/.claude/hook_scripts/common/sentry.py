@@ -3,24 +3,20 @@
 Sentry Integration Utilities
 """
 import sys
-from typing import Dict, Any, Optional, Literal
-
-import sentry_sdk
-from rich.console import Console
-from sentry_sdk.integrations.argv import ArgvIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-from sentry_sdk.integrations.modules import ModulesIntegration
-from sentry_sdk.integrations.threading import ThreadingIntegration
-from sentry_sdk.types import Event, Hint
+from typing import TYPE_CHECKING, Dict, Any, Optional, Literal
 
 from .config import load_settings
 
-console = Console(stderr=True)
+if TYPE_CHECKING:
+    from sentry_sdk.types import Event, Hint
+
+# sentry_sdk module, imported by init_sentry only when Sentry is enabled
+sentry_sdk = None
 
 _sentry_initialized = False
 
 
-def filter_sensitive_data(event: Event, hint: Hint) -> Optional[Event]:
+def filter_sensitive_data(event: "Event", hint: "Hint") -> Optional["Event"]:
     """
     Filter sensitive data from Sentry events before sending.
 
@@ -74,7 +70,7 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
     Returns:
         True if Sentry was initialized, False otherwise
     """
-    global _sentry_initialized
+    global _sentry_initialized, sentry_sdk
 
     # Return early if already initialized
     if _sentry_initialized:
@@ -94,6 +90,12 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
         return False
 
     try:
+        import sentry_sdk
+        from sentry_sdk.integrations.argv import ArgvIntegration
+        from sentry_sdk.integrations.logging import LoggingIntegration
+        from sentry_sdk.integrations.modules import ModulesIntegration
+        from sentry_sdk.integrations.threading import ThreadingIntegration
+
         # Prepare tags
         tags = {
             'script': script_name,
@@ -164,7 +166,9 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
 
     except Exception as e:
         # Sentry initialization failed, but don't crash the hook
-        console.print(f"[yellow]WARNING: Sentry initialization failed: {e}[/]")
+        from rich.console import Console
+
+        Console(stderr=True).print(f"[yellow]WARNING: Sentry initialization failed: {e}[/]")
         return False
 
 
@@ -11,36 +11,44 @@ Automatically restore compressed context:
 """
 
 import gzip
-import json
 import os
-import signal
 import subprocess
 import sys
 import tempfile
+import time
 import traceback
-from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
+from common import breadcrumb_buffer, fastjson
 from common.logger import HookLogger
-from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
+from common.sentry import init_sentry, capture_exception, flush
 from common.config import load_config
 from common.formatting import console
 
 # token_manager import 추가
 from token_manager import is_continued_session
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
+# The project name sits in [project] at the top of pyproject.toml
+PYPROJECT_SCAN_BYTES = 4096
 
+# Backup file name suffixes written by auto_compact (JSON, gzip, zstd, txt)
+BACKUP_SUFFIXES = ('.json', '.json.gz', '.json.zst', '.txt')
 
+# Read buffer for compressed backups (the gzip reader otherwise pulls small chunks)
+BACKUP_READ_BUFFER = 1 << 20
+
+
+@cache
 def find_project_root() -> Optional[Path]:
     """
     Example Project Automatically detects project root
     Finds the root directory containing `pyproject.toml` with `project_sample`
+
+    The result is cached: every helper below resolves paths from it, and
+    CLAUDE_PROJECT_DIR and the cwd stay fixed for the life of the hook.
     """
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
     if project_dir:
@@ -53,11 +61,12 @@ def find_project_root() -> Optional[Path]:
         pyproject = parent / "pyproject.toml"
         if pyproject.exists():
             try:
-                content = pyproject.read_text(encoding='utf-8')
-                if 'project_sample' in content.lower() or 'example_project' in content:
+                with pyproject.open('rb') as f:
+                    head = f.read(PYPROJECT_SCAN_BYTES)
+                if b'project_sample' in head.lower() or b'example_project' in head:
                     if (parent / ".claude").exists():
                         return parent
-            except Exception:
+            except OSError:
                 pass
 
         if (parent / ".git").exists() and (parent / ".claude").exists():
@@ -66,28 +75,39 @@ def find_project_root() -> Optional[Path]:
     return None
 
 
-def load_recovery_state() -> Optional[Dict[str, Any]]:
-    """Load Recovery State File"""
-    project_root = find_project_root()
-
-    candidates = []
+@cache
+def get_claude_dirs() -> Tuple[Path, ...]:
+    """
+    .claude directories holding recovery state and backups, in priority order
 
+    Once the project root is known only its .claude directory is used;
+    otherwise CLAUDE_PROJECT_DIR, the cwd and the home directory are tried.
+    """
+    project_root = find_project_root()
     if project_root:
-        candidates.append(project_root / ".claude" / "recovery" / "compact-recovery.json")
+        return (project_root / ".claude",)
+
+    claude_dirs = []
 
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
     if project_dir:
-        candidates.append(Path(project_dir) / ".claude" / "recovery" / "compact-recovery.json")
+        claude_dirs.append(Path(project_dir) / ".claude")
 
-    candidates.extend([
-        Path.cwd() / ".claude" / "recovery" / "compact-recovery.json",
-        Path.home() / ".claude" / "recovery" / "compact-recovery.json",
+    claude_dirs.extend([
+        Path.cwd() / ".claude",
+        Path.home() / ".claude",
     ])
 
-    for candidate in candidates:
+    return tuple(dict.fromkeys(claude_dirs))
+
+
+def load_recovery_state() -> Optional[Dict[str, Any]]:
+    """Load Recovery State File"""
+    for claude_dir in get_claude_dirs():
+        candidate = claude_dir / "recovery" / "compact-recovery.json"
         if candidate.exists():
-            with open(candidate, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(candidate, 'rb') as f:
+                return fastjson.loads(f.read())
 
     return None
 
@@ -99,70 +119,53 @@ def save_recovery_state(state: Dict[str, Any]) -> None:
     Args:
         state: State data to save
     """
-    project_root = find_project_root()
-
-    if project_root:
-        recovery_file = project_root / ".claude" / "recovery" / "compact-recovery.json"
-    else:
-        project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
-        if project_dir:
-            recovery_file = Path(project_dir) / ".claude" / "recovery" / "compact-recovery.json"
-        else:
-            recovery_file = Path.cwd() / ".claude" / "recovery" / "compact-recovery.json"
+    recovery_file = get_claude_dirs()[0] / "recovery" / "compact-recovery.json"
 
     recovery_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    recovery_file.write_bytes(fastjson.dumps(state))
 
 
-def list_backups() -> List[tuple[Path, datetime]]:
-    """Backup File List Inquiry (Includes JSON, gzip, and txt files)"""
-    project_root = find_project_root()
-
-    backup_dirs = []
-
-    if project_root:
-        backup_dirs.append(project_root / ".claude" / "backups")
-
-    project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
-    if project_dir:
-        backup_dirs.append(Path(project_dir) / ".claude" / "backups")
-
-    backup_dirs.extend([
-        Path.cwd() / ".claude" / "backups",
-        Path.home() / ".claude" / "backups",
-    ])
+def list_backups() -> List[tuple[Path, float, int]]:
+    """Backup File List Inquiry (Includes JSON, gzip, zstd, and txt files) as (path, mtime, size)"""
+    backup_dirs = [claude_dir / "backups" for claude_dir in get_claude_dirs()]
 
     backups = []
-    seen_files = set()
+    seen_dirs = set()
     for backup_dir in backup_dirs:
-        if not backup_dir.exists():
+        # The fallback candidates can point at the same directory
+        real_dir = os.path.realpath(backup_dir)
+        if real_dir in seen_dirs or not os.path.isdir(real_dir):
             continue
+        seen_dirs.add(real_dir)
 
-        patterns = ['conversation_*.json', 'conversation_*.json.gz', 'conversation_*.txt']
-        for pattern in patterns:
-            for backup_file in backup_dir.glob(pattern):
-                abs_path = backup_file.resolve()
-                if abs_path in seen_files:
+        with os.scandir(backup_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith('conversation_') and name.endswith(BACKUP_SUFFIXES)):
+                    continue
+                if not entry.is_file():
                     continue
-                seen_files.add(abs_path)
 
-                mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-                backups.append((backup_file, mtime))
+                st = entry.stat()
+                backups.append((Path(entry.path), st.st_mtime, st.st_size))
 
     return sorted(backups, key=lambda x: x[1], reverse=True)
 
 
 def load_backup_file(backup_path: Path) -> Optional[Dict[str, Any]]:
-    """Load Backup File (JSON or gzip)"""
+    """Load Backup File (JSON, gzip or zstd)"""
     try:
         if backup_path.suffix == '.gz':
-            with gzip.open(backup_path, 'rt', encoding='utf-8') as f:  # type: ignore[assignment]
-                return json.load(f)
+            with open(backup_path, 'rb', buffering=BACKUP_READ_BUFFER) as raw, gzip.GzipFile(fileobj=raw) as gz:
+                return fastjson.loads(gz.read())
+        elif backup_path.suffix == '.zst':
+            import zstandard
+            with open(backup_path, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                return fastjson.loads(reader.read())
         elif backup_path.suffix == '.json':
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(backup_path, 'rb') as f:
+                return fastjson.loads(f.read())
         else:
             return None
     except Exception as e:
@@ -188,6 +191,9 @@ def load_summary_from_state(state: Dict[str, Any]) -> Optional[str]:
 
 def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: str) -> None:
     """Context Recovery Guide Output"""
+    from rich.panel import Panel
+    from rich import box
+
     guide_parts = []
 
     if recovery_state:
@@ -220,10 +226,9 @@ def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: s
     backups = list_backups()
     if backups:
         guide_parts.append("[cyan]Recent backup files:[/]")
-        for i, (backup_path, mtime) in enumerate(backups[:5], 1):
-            size = backup_path.stat().st_size
+        for i, (backup_path, mtime, size) in enumerate(backups[:5], 1):
             guide_parts.append(f"   {i}. {backup_path.name}")
-            guide_parts.append(f"      Time: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+            guide_parts.append(f"      Time: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))}")
             guide_parts.append(f"      Size: {size:,} bytes")
             guide_parts.append(f"      Path: {backup_path}\n")
     else:
@@ -248,6 +253,9 @@ def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: s
 
 def check_recent_compacts(config: Dict[str, Any], days: int = 7) -> None:
     """Recent Compression History"""
+    from rich.panel import Panel
+    from rich import box
+
     collection = config.get('collection', 'example_project_context')
 
     start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -275,7 +283,11 @@ def check_recent_compacts(config: Dict[str, Any], days: int = 7) -> None:
 
 def list_recovery_files() -> None:
     """Verify Recovery-Related Files"""
-    project_root = find_project_root()
+    from rich.table import Table
+    from rich import box
+
+    # Same base directory that save_recovery_state writes under
+    base_dir = get_claude_dirs()[0].parent
 
     files = [
         (".claude/recovery/compact-recovery.json", "Recovery Status File"),
@@ -296,16 +308,14 @@ def list_recovery_files() -> None:
     table.add_column("Information", style="yellow")
 
     for filepath, description in files:
-        if project_root:
-            full_path = project_root / filepath
-        else:
-            full_path = Path.cwd() / filepath
+        full_path = base_dir / filepath
 
         if full_path.exists():
             if full_path.is_file():
-                size = full_path.stat().st_size
-                mtime = datetime.fromtimestamp(full_path.stat().st_mtime)
-                info = f"Size: {size:,} bytes\nRevision: {mtime.strftime('%Y-%m-%d %H:%M:%S')}"
+                st = full_path.stat()
+                size = st.st_size
+                mtime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(st.st_mtime))
+                info = f"Size: {size:,} bytes\nRevision: {mtime}"
                 table.add_row("[green]Existence[/]", str(filepath), description, info)
             else:
                 table.add_row("[green]Existence[/]", str(filepath), description, "Directory")
@@ -315,74 +325,71 @@ def list_recovery_files() -> None:
     console.print(table)
 
 
-def check_recent_compact(state: Optional[Dict[str, Any]], threshold_hours: int = 24) -> bool:
+def parse_compact_time(state: Optional[Dict[str, Any]]) -> Optional[datetime]:
     """
-    Check if automatic compaction has occurred recently
+    Parse the compaction time of a recovery state that still needs recovering
 
     Args:
         state: Recovery state data
-        threshold_hours: Threshold for displaying recovery messages (in hours, default 24 hours)
 
     Returns:
-        Whether recent compaction occurred
+        Compaction time, or None if there is no state, it was already
+        recovered, or the timestamp is missing or invalid
     """
     if not state:
-        return False
+        return None
 
     if state.get('recovered', False):
-        return False
+        return None
 
     timestamp_str = state.get('timestamp', '')
     if not timestamp_str:
-        return False
+        return None
 
     try:
-        compact_time = datetime.fromisoformat(timestamp_str)
-
-        if compact_time.tzinfo is not None:
-            now = datetime.now(timezone.utc)
-        else:
-            now = datetime.now()
-
-        diff = now - compact_time
-        return diff.total_seconds() < (threshold_hours * 3600)
-    except Exception:
-        return False
-
-
-def print_quiet_status():
-    """Quiet status message when no recovery is needed"""
-    console.print("[green]✓[/green] Normal session start (no compression history)")
+        return datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError):
+        return None
 
 
-@contextmanager
-def timeout_context(seconds: int):
+def check_recent_compact(compact_time: Optional[datetime], threshold_hours: int = 24) -> bool:
     """
-    Implementing Timeout with Context Manager
+    Check if automatic compaction has occurred recently
 
     Args:
-        seconds: Timeout in seconds
+        compact_time: Compaction time from parse_compact_time()
+        threshold_hours: Threshold for displaying recovery messages (in hours, default 24 hours)
 
-    Raises:
-        TimeoutError: When a timeout occurs
+    Returns:
+        Whether recent compaction occurred
     """
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"The operation did not complete within {seconds} seconds.")
-
-    if hasattr(signal, 'SIGALRM'):
-        original_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        try:
-            yield
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, original_handler)
+    if compact_time is None:
+        return False
+
+    if compact_time.tzinfo is not None:
+        now = datetime.now(timezone.utc)
     else:
-        yield
+        now = datetime.now()
+
+    diff = now - compact_time
+    return diff.total_seconds() < (threshold_hours * 3600)
+
+
+def print_quiet_status():
+    """Quiet status message when no recovery is needed"""
+    console.print("[green]✓[/green] Normal session start (no compression history)")
 
 
 def main():
     """Main Function - Automatic Context Recovery"""
+    # Continued sessions need no recovery; exit before Sentry and logger setup
+    try:
+        if is_continued_session():
+            sys.exit(0)
+    except Exception:
+        # Treat an unreadable session state as a new session
+        pass
+
     init_sentry('context-recovery-helper', additional_tags={'hook_type': 'session_start'})
 
     logger = HookLogger("context-recovery-helper") if HookLogger else None
@@ -391,32 +398,21 @@ def main():
         if logger:
             logger.log_start()
 
-        add_breadcrumb("Recovery hook execution started", category="lifecycle")
-
-        is_new_session = not is_continued_session()
-        add_breadcrumb("Session continuity check", category="session", data={"is_new_session": is_new_session})
-
-        if logger:
-            logger.log_info("Session Continuity Check", is_new_session=is_new_session)
-
-        if not is_new_session:
-            if logger:
-                logger.log_end(success=True, status="continued_session")
-            sys.exit(0)
+        breadcrumb_buffer.record("Recovery hook execution started", category="lifecycle")
 
         config = load_config('auto-compact.json')
-        add_breadcrumb("Config loaded", category="config")
+        breadcrumb_buffer.record("Config loaded", category="config")
 
         state = load_recovery_state()
-        add_breadcrumb("Recovery state loaded", category="state", data={"has_state": bool(state)})
+        breadcrumb_buffer.record("Recovery state loaded", category="state", data={"has_state": bool(state)})
 
         recovery_config = config.get('recovery', {})
         threshold_hours = int(recovery_config.get('threshold_hours', 12))
-        is_recent_compact = check_recent_compact(state, threshold_hours=threshold_hours)
-        add_breadcrumb("Recent compact check", category="compact", data={"is_recent": is_recent_compact})
+        is_recent_compact = check_recent_compact(parse_compact_time(state), threshold_hours=threshold_hours)
+        breadcrumb_buffer.record("Recent compact check", category="compact", data={"is_recent": is_recent_compact})
 
-        summary = state.get('summary') if state else None
-        has_summary = bool(summary and summary.strip())
+        summary = load_summary_from_state(state) if state else None
+        has_summary = summary is not None
 
         if logger:
             logger.log_info(
@@ -431,10 +427,9 @@ def main():
                 logger.log_end(success=True, status="no_recent_compact")
             sys.exit(0)
 
-        add_breadcrumb("Attempting to load summary from state", category="recovery")
-        summary = load_summary_from_state(state)
+        breadcrumb_buffer.record("Using summary from state", category="recovery", data={"has_summary": has_summary})
 
-        if not summary:
+        if summary is None:
             console.print("[yellow]WARNING: There is no summary in the compressed file.[/]")
             console.print("[yellow]A summary will be generated again in the next session.[/]")
             print_quiet_status()
@@ -443,7 +438,7 @@ def main():
             flush()
             sys.exit(0)
 
-        add_breadcrumb("Summary output", category="recovery", data={"length": len(summary)})
+        breadcrumb_buffer.record("Summary output", category="recovery", data={"length": len(summary)})
 
         console.print("\n" + "="*80)
         console.print("[bold yellow]IMPORTANT: The summary below is the official context for this session.[/bold yellow]")
@@ -458,7 +453,7 @@ def main():
         state['recovered_at'] = datetime.now().isoformat()
         save_recovery_state(state)
 
-        add_breadcrumb("Recovery completed successfully", category="recovery")
+        breadcrumb_buffer.record("Recovery completed successfully", category="recovery")
 
         if logger:
             logger.log_end(success=True, status="recovery_completed", summary_length=len(summary))
@@ -470,9 +465,12 @@ def main():
         error_msg = f"Recovery Helper Error During Execution: {e}"
         console.print(f"[yellow]WARNING: {error_msg}[/]")
         console.print("Continue the session....\n")
-        traceback.print_exc(file=sys.stderr)
+        # Sentry gets the full traceback; print it only for a terminal or when debugging
+        if os.environ.get("CLAUDE_HOOK_DEBUG") or sys.stderr.isatty():
+            traceback.print_exc(file=sys.stderr)
 
         # Capture exception to Sentry
+        breadcrumb_buffer.replay()
         capture_exception(e, context={
             "hook": "context-recovery-helper",
             "error_message": error_msg
@@ -7,9 +7,11 @@ Detects task completion keywords in user prompts to automatically suggest execut
 Hook Event: UserPromptSubmit
 """
 import json
+import re
 import sys
 from typing import List
 
+from common import fastjson
 from common.logger import HookLogger
 from common.sentry import init_sentry, add_breadcrumb, flush
 
@@ -24,6 +26,14 @@ FINISH_KEYWORDS: List[str] = [
     "세션종료",
 ]
 
+# All keywords in one pattern so the prompt is scanned once; matching is
+# case-insensitive, so the prompt is never lowercased into a copy
+_FINISH_RE = re.compile('|'.join(re.escape(keyword) for keyword in FINISH_KEYWORDS), re.IGNORECASE)
+
+# Prompts that are just a keyword (e.g. "done") resolve with a set lookup
+_FINISH_SET = frozenset(keyword.lower() for keyword in FINISH_KEYWORDS)
+_FINISH_SET_MAX_LEN = max(len(keyword) for keyword in FINISH_KEYWORDS)
+
 
 def detect_finish_keyword(prompt: str) -> bool:
     """
@@ -35,13 +45,11 @@ def detect_finish_keyword(prompt: str) -> bool:
     Returns:
         True if keywords are detected
     """
-    prompt_lower = prompt.lower().strip()
-
-    for keyword in FINISH_KEYWORDS:
-        if keyword.lower() in prompt_lower:
-            return True
+    stripped = prompt.strip()
+    if len(stripped) <= _FINISH_SET_MAX_LEN and stripped.lower() in _FINISH_SET:
+        return True
 
-    return False
+    return _FINISH_RE.search(prompt) is not None
 
 
 def create_finish_context() -> str:
@@ -71,6 +79,13 @@ Upon user approval, it displays Git status, ChromaDB save status, and the comple
 
 def main():
     """Main Function"""
+    raw_input = sys.stdin.buffer.read()
+
+    # Other events can't contain the event name, so skip them before parsing
+    # and before any logger or Sentry setup
+    if b'"UserPromptSubmit"' not in raw_input:
+        sys.exit(0)
+
     logger = HookLogger('detect-session-finish')
     logger.log_start()
 
@@ -83,9 +98,9 @@ def main():
         add_breadcrumb("Hook execution started", category="lifecycle")
 
         try:
-            input_data = json.load(sys.stdin)
+            input_data = fastjson.loads(raw_input)
             add_breadcrumb("Input data loaded", category="input")
-        except json.JSONDecodeError as e:
+        except fastjson.JSONDecodeError as e:
             logger.log_error("JSON decode error", error=str(e))
             logger.log_end(success=False)
             flush()
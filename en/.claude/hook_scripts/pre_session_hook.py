@@ -9,12 +9,15 @@ Executed at session start to display the following:
 4. Completion checklist
 """
 
+import heapq
 import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from common.config import load_config
@@ -25,6 +28,7 @@ from common.formatting import (
     create_info_table,
     create_rules_table,
 )
+from rich.console import Group
 from rich.panel import Panel
 from rich.padding import Padding
 from rich.table import Table
@@ -33,67 +37,97 @@ from rich import box
 from common.servers import SERVER_CONFIG, get_server_status_internal
 from token_manager import is_continued_session, should_reset_token_usage
 
+# Paths resolved once: this hook lives in <project>/.claude/hook_scripts
+CLAUDE_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = CLAUDE_DIR.parent
 
-def detect_work_context() -> str:
+# Token usage file shared with token_manager
+TOKEN_USAGE_PATH = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
+
+# Icon prefixes that message strings may carry; the info table drops them
+ICON_PREFIX_RE = re.compile('[📅🕐📍📁🎯] ')
+
+# Time zone for the session header date/time
+HEADER_TZ = ZoneInfo('UTC')
+
+# Specialized rules by project type (built once)
+PROJECT_RULES: Dict[str, Tuple[str, ...]] = {
+    'python_fastapi': (
+        "FastAPI dependency injection Make full use of",
+        "Pydantic schema validation is essential (schemas package)",
+        "Compliance with the Repository/Service Pattern",
+        "mypy strict mode must pass",
+        "Alembic Migration Synchronization Verification",
+    ),
+}
+
+# Work context indicators (directory names, extensions, file names)
+FRONTEND_DIRS = frozenset({'app', 'components', 'pages', 'features'})  # React
+FRONTEND_EXTS = frozenset({'.tsx', '.jsx', '.ts', '.css', '.scss'})
+FRONTEND_FILES = ('vite.config', 'tsconfig.json')
+
+BACKEND_DIRS = frozenset({'example_project', 'alembic', 'migrations'})
+BACKEND_EXTS = frozenset({'.py'})
+BACKEND_FILES = ('pyproject.toml', 'poetry.lock')
+BACKEND_PATH_PARTS = ('tests/integration/', 'tests/unit/')
+
+
+def _scan_work_context() -> str:
     """
     Automatic detection of current work context (frontend/backend).
     Determined by analyzing modified files via `git status`.
     """
     try:
-        project_root = Path(__file__).parent.parent.parent
-
         result = subprocess.run(
-            ['git', 'status', '--short'],
+            ['git', 'status', '--porcelain=v1', '-z'],
             capture_output=True,
             text=True,
             timeout=5,
-            cwd=str(project_root)
+            cwd=str(PROJECT_ROOT),
+            check=False
         )
 
         if result.returncode != 0:
             return 'backend'
 
-        modified_files = result.stdout.strip().split('\n')
-        if not modified_files or modified_files == ['']:
+        entries = result.stdout.split('\0')
+        if not any(entries):
             return 'backend'
 
-        frontend_indicators = [
-            'app/',  # React
-            'components/',
-            'pages/',
-            'features/',
-            '.tsx', '.jsx', '.ts', '.css', '.scss',
-            'vite.config', 'tsconfig.json'
-        ]
-
-        backend_indicators = [
-            'example_project/',
-            '.py',
-            'pyproject.toml', 'poetry.lock',
-            'alembic/', 'migrations/',
-            'tests/integration/', 'tests/unit/'
-        ]
-
         frontend_count = 0
         backend_count = 0
 
-        for line in modified_files:
-            if not line.strip():
+        entries_iter = iter(entries)
+        for entry in entries_iter:
+            if len(entry) <= 3:
                 continue
-            filepath = line[3:].strip() if len(line) > 3 else ''
+            # Renames and copies are followed by the original path
+            status = entry[:2]
+            if 'R' in status or 'C' in status:
+                next(entries_iter, None)
+            filepath = entry[3:]
 
             if '.claude/' in filepath:
                 continue
 
-            for indicator in frontend_indicators:
-                if indicator in filepath:
-                    frontend_count += 1
-                    break
-
-            for indicator in backend_indicators:
-                if indicator in filepath:
-                    backend_count += 1
-                    break
+            dirs = filepath.split('/')
+            filename = dirs.pop()
+            ext = os.path.splitext(filename)[1]
+
+            if (
+                ext in FRONTEND_EXTS
+                or filename.startswith(FRONTEND_FILES)
+                or not FRONTEND_DIRS.isdisjoint(dirs)
+            ):
+                frontend_count += 1
+
+            if (
+                ext in BACKEND_EXTS
+                or filename in BACKEND_FILES
+                or not BACKEND_DIRS.isdisjoint(dirs)
+                or any(part in filepath for part in BACKEND_PATH_PARTS)
+            ):
+                backend_count += 1
 
         if frontend_count > backend_count:
             return 'frontend'
@@ -104,7 +138,7 @@ def detect_work_context() -> str:
         return 'backend'
 
 
-def detect_environment(config: Dict[str, Any]) -> tuple[str, str]:
+def _probe_environment(config: Dict[str, Any]) -> tuple[str, str]:
     """Current Environment Detection (Docker/Mac/WSL)"""
     paths = config['project_paths']
 
@@ -128,7 +162,7 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
     messages = config['messages']
 
     # Current Date and Time
-    now = datetime.now(tz=ZoneInfo('UTC'))
+    now = datetime.now(tz=HEADER_TZ)
     current_date = now.strftime("%Y-%m-%d (%A)")
     current_time = now.strftime("%H:%M:%S")
 
@@ -136,11 +170,14 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
     print_rule(messages['session_start'], style="bold magenta")
 
     info_data = {
-        messages['date_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): current_date,
-        messages['time_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): current_time,
-        messages['environment_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): env,
-        messages['project_path_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): project_path,
-        messages['work_context_prefix'].replace('🎯 ', ''): work_context.upper(),
+        ICON_PREFIX_RE.sub('', messages[key]): value
+        for key, value in (
+            ('date_prefix', current_date),
+            ('time_prefix', current_time),
+            ('environment_prefix', env),
+            ('project_path_prefix', project_path),
+            ('work_context_prefix', work_context.upper()),
+        )
     }
     table = create_info_table(info_data)
     console.print(table)
@@ -158,16 +195,24 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
     server_table.add_column("Status", justify="center")
     server_table.add_column("PID", justify="right")
 
+    # Probe all servers concurrently; rows below keep SERVER_CONFIG order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = {
+            (category, server_type): executor.submit(get_server_status_internal, category, server_type)
+            for category in ("backend", "frontend")
+            for server_type in SERVER_CONFIG[category]
+        }
+
     # Backend servers
     for backend_type, config in SERVER_CONFIG["backend"].items():
-        is_running, _, pid = get_server_status_internal("backend", backend_type)
+        is_running, _, pid = statuses[("backend", backend_type)].result()
         status = "[green]RUNNING[/]" if is_running else "[yellow]STOPPED[/]"
         pid_str = str(pid) if pid else "-"
         server_table.add_row("Backend", backend_type, str(config["port"]), status, pid_str)
 
     # Frontend servers
     for frontend_type, config in SERVER_CONFIG["frontend"].items():
-        is_running, _, pid = get_server_status_internal("frontend", frontend_type)
+        is_running, _, pid = statuses[("frontend", frontend_type)].result()
         status = "[green]RUNNING[/]" if is_running else "[yellow]STOPPED[/]"
         pid_str = str(pid) if pid else "-"
         server_table.add_row("Frontend", frontend_type, str(config["port"]), status, pid_str)
@@ -237,19 +282,7 @@ def get_project_specific_rules(config: Dict[str, Any]) -> list[str]:
     Return specialized rules by project type.
     Supports both backend and frontend in monorepo environments.
     """
-    project_type = config.get('project_type', '')
-    rules = []
-
-    if project_type == 'python_fastapi':
-        rules.extend([
-            "FastAPI dependency injection Make full use of",
-            "Pydantic schema validation is essential (schemas package)",
-            "Compliance with the Repository/Service Pattern",
-            "mypy strict mode must pass",
-            "Alembic Migration Synchronization Verification",
-        ])
-
-    return rules
+    return list(PROJECT_RULES.get(config.get('project_type', ''), ()))
 
 
 def print_guidelines(config: Dict[str, Any]) -> None:
@@ -456,37 +489,49 @@ def get_current_token_usage() -> Optional[int]:
             pass
 
     # Try temporary file
-    token_file = Path('/tmp/claude-token-usage.txt')
-    if token_file.exists():
-        try:
-            content = token_file.read_text().strip()
-            return int(content)
-        except (ValueError, OSError):
-            pass
+    try:
+        with open('/tmp/claude-token-usage.txt', 'rb') as f:
+            return int(f.read().strip())
+    except (ValueError, OSError):
+        pass
 
     return None
 
 
-def print_token_status(config: Dict[str, Any]) -> None:
+def _usage_bar(completed: int, total: int, color: str) -> Table:
+    """Static usage bar row: indent, 40-column bar and percentage"""
+    from rich.progress_bar import ProgressBar
+
+    row = Table.grid(padding=(0, 1))
+    row.add_row(
+        "  ",
+        ProgressBar(total=total, completed=completed, width=40, complete_style=color),
+        f"[progress.percentage]{min(100.0, completed * 100 / total):>3.0f}%"
+    )
+    return row
+
+
+def print_token_status(config: Dict[str, Any]) -> bool:
     """
     Token Usage Status Display (JSON-based).
 
     - Current session tokens
     - Total accumulated tokens
     - Warning and reset guide
-    """
-    import json
 
+    Returns True when the section was displayed.
+    """
     # token-usage.json 로드
-    usage_path = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
+    usage_path = TOKEN_USAGE_PATH
     if not usage_path.exists():
-        return
+        return False
+
+    from common import fastjson
 
     try:
-        with open(usage_path, 'r') as f:
-            usage_data = json.load(f)
+        usage_data = fastjson.load_file(usage_path)
     except Exception:
-        return
+        return False
 
     try:
         limits_config = load_config('token-limits.json')
@@ -497,13 +542,13 @@ def print_token_status(config: Dict[str, Any]) -> None:
         }
 
     if not limits_config.get('enabled', True):
-        return
+        return False
 
     current_session_id = usage_data.get('current_session', '')
     sessions = usage_data.get('sessions', {})
 
     if current_session_id not in sessions:
-        return
+        return False
 
     session_data = sessions[current_session_id]
     current_tokens = session_data.get('tokens', 0)
@@ -518,69 +563,63 @@ def print_token_status(config: Dict[str, Any]) -> None:
     total_warning = total_limits.get('warning', 400000)
     total_critical = total_limits.get('critical', 500000)
 
-    show_warning = False
-    is_critical = False
+    session_over_critical = current_tokens >= session_critical
+    session_over_warning = current_tokens >= session_warning
+    total_over_critical = total_accumulated >= total_critical
+    total_over_warning = total_accumulated >= total_warning
 
-    if current_tokens >= session_critical or total_accumulated >= total_critical:
-        is_critical = True
+    is_critical = session_over_critical or total_over_critical
+    if is_critical:
         show_warning = display.get('show_on_critical', True)
-    elif current_tokens >= session_warning or total_accumulated >= total_warning:
+    elif session_over_warning or total_over_warning:
         show_warning = display.get('show_on_warning', True)
+    else:
+        show_warning = False
 
     if not show_warning:
-        return
-
-    from rich.progress import Progress, BarColumn, TextColumn
-    from rich.panel import Panel
+        return False
 
     style = "red bold" if is_critical else "yellow"
     title = "🚨 Token Usage Warning" if is_critical else "⚠️  Token Usage Notification"
 
     print_rule(title, style=style)
-    console.print()
-
-    session_pct = min(100, int(current_tokens * 100 / session_critical))
-    session_color = "red" if current_tokens >= session_critical else "yellow" if current_tokens >= session_warning else "green"
-
-    console.print(f"  [bold]Current session:[/bold] {current_tokens:,} / {session_critical:,} tokens ({session_pct}%)")
 
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40, complete_style=session_color),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("", total=session_critical, completed=current_tokens)
+    # Collect the section and print it in one go
+    renderables: list = [""]
 
-    console.print()
-
-    total_pct = min(100, int(total_accumulated * 100 / total_critical))
-    total_color = "red" if total_accumulated >= total_critical else "yellow" if total_accumulated >= total_warning else "green"
+    session_pct = 100 if session_over_critical else current_tokens * 100 // session_critical
+    session_color = "red" if session_over_critical else "yellow" if session_over_warning else "green"
 
-    console.print(f"  [bold]Total Cumulative:[/bold] {total_accumulated:,} / {total_critical:,} tokens ({total_pct}%)")
+    renderables.extend([
+        f"  [bold]Current session:[/bold] {current_tokens:,} / {session_critical:,} tokens ({session_pct}%)",
+        _usage_bar(current_tokens, session_critical, session_color),
+        ""
+    ])
 
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40, complete_style=total_color),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("", total=total_critical, completed=total_accumulated)
+    total_pct = 100 if total_over_critical else total_accumulated * 100 // total_critical
+    total_color = "red" if total_over_critical else "yellow" if total_over_warning else "green"
 
-    console.print()
+    renderables.extend([
+        f"  [bold]Total Cumulative:[/bold] {total_accumulated:,} / {total_critical:,} tokens ({total_pct}%)",
+        _usage_bar(total_accumulated, total_critical, total_color),
+        ""
+    ])
 
     # 리셋 가이드
-    if is_critical or total_accumulated >= total_warning:
-        console.print(Panel(
+    if is_critical or total_over_warning:
+        renderables.append(Panel(
             "[yellow]💡 To reset the token,:[/yellow]\n"
             "  • Natural language: [cyan]\"Please reset the token.\"[/cyan] or [cyan]\"Token Initialization\"[/cyan]\n"
             "  • CLI: [cyan]python3 .claude/hook_scripts/reset_tokens.py[/cyan]",
             border_style="yellow",
             padding=(0, 1)
         ))
-        console.print()
+        renderables.append("")
+
+    console.print(Group(*renderables))
 
     print_rule("", style="dim")
+    return True
 
 
 def check_context_recovery_needed() -> Dict[str, Any]:
@@ -588,52 +627,66 @@ def check_context_recovery_needed() -> Dict[str, Any]:
     Check if context recovery is needed and available.
     Returns dictionary with recovery options.
     """
-    project_root = Path(__file__).parent.parent.parent
-    recovery_dir = project_root / ".claude" / "recovery"
-    backup_dir = project_root / ".claude" / "backups"
+    recovery_dir = CLAUDE_DIR / "recovery"
+    backup_dir = CLAUDE_DIR / "backups"
 
     recovery_options: Dict[str, Any] = {
         "has_recovery": False,
         "compressed_file": None,
         "latest_backup": None,
-        "backup_files": []
+        "backup_files": [],
+        "compact_recovery_data": None
     }
 
+    # One readdir of .claude tells which of recovery/ and backups/ exist
+    try:
+        with os.scandir(CLAUDE_DIR) as it:
+            subdirs = {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
+        return recovery_options
+
+    compact_recovery = recovery_dir / "compact-recovery.json"
     compact_recovery_exists = False
 
     # 1. Check for compressed context data
-    if recovery_dir.exists():
-        compact_recovery = recovery_dir / "compact-recovery.json"
-        if compact_recovery.exists():
-            compact_recovery_exists = True
-            # Check if recovery has already been completed
-            try:
-                import json
-                with open(compact_recovery, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-
-                # Only show guidance if NOT already recovered
-                if not state.get('recovered', False):
-                    recovery_options["has_recovery"] = True
-                    recovery_options["compressed_file"] = str(compact_recovery)
-            except Exception:
-                # If can't read file, assume recovery needed
+    # Check if recovery has already been completed
+    if "recovery" in subdirs:
+        compact_recovery_exists = True
+        try:
+            from common import fastjson
+            with open(compact_recovery, 'rb') as f:
+                state = fastjson.loads(f.read())
+            recovery_options["compact_recovery_data"] = state
+
+            # Only show guidance if NOT already recovered
+            if not state.get('recovered', False):
                 recovery_options["has_recovery"] = True
                 recovery_options["compressed_file"] = str(compact_recovery)
+        except (FileNotFoundError, NotADirectoryError):
+            compact_recovery_exists = False
+        except Exception:
+            # If can't read file, assume recovery needed
+            recovery_options["has_recovery"] = True
+            recovery_options["compressed_file"] = str(compact_recovery)
 
     # 2. Check for backup files ONLY if compact-recovery.json does NOT exist
-    if not compact_recovery_exists and backup_dir.exists():
-        # Find all conversation backup files
-        backup_files = sorted(
-            backup_dir.glob("conversation_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True  # Most recent first
-        )
+    if not compact_recovery_exists and "backups" in subdirs:
+        # Find all conversation backup files (DirEntry.stat() reuses the scandir result)
+        entries = []
+        try:
+            with os.scandir(backup_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('conversation_') and name.endswith('.json'):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        latest = heapq.nlargest(5, entries)  # Top 5 most recent, newest first
 
-        if backup_files:
+        if latest:
             recovery_options["has_recovery"] = True
-            recovery_options["latest_backup"] = str(backup_files[0])
-            recovery_options["backup_files"] = [str(f) for f in backup_files[:5]]  # Top 5 most recent
+            recovery_options["latest_backup"] = latest[0][1]
+            recovery_options["backup_files"] = [path for _, path in latest]
 
     return recovery_options
 
@@ -646,7 +699,6 @@ def print_context_recovery_guidance(recovery_options: Dict[str, Any]):
         return  # No recovery options available, skip
 
     print_rule("Step 1: Context Recovery Verification", style="bold cyan")
-    console.print()
 
     # Priority message for Claude
     priority_msg = """[bold yellow]
@@ -656,9 +708,6 @@ Prioritize the content below over Claude's auto-generated summaries.
 ================================================================================
 [/bold yellow]"""
 
-    console.print(priority_msg)
-    console.print()
-
     # Build recovery guidance content
     guidance_lines = []
 
@@ -671,19 +720,14 @@ Prioritize the content below over Claude's auto-generated summaries.
         )
         guidance_lines.append("")
 
-    # Check for compact-recovery.json (saved context from critical token state)
-    compact_recovery = Path(".claude/recovery/compact-recovery.json")
-    if compact_recovery.exists():
+    # compact-recovery.json (saved context from critical token state), already parsed by check_context_recovery_needed
+    recovery_data = recovery_options.get("compact_recovery_data")
+    if isinstance(recovery_data, dict):
         try:
-            import json
-            with open(compact_recovery, 'r') as f:
-                recovery_data = json.load(f)
-
             timestamp = recovery_data.get('timestamp', '')
             summary_length = recovery_data.get('summary_length', 0)
 
             if timestamp and summary_length > 0:
-                from datetime import datetime
                 saved_time = datetime.fromisoformat(timestamp)
                 time_diff = datetime.now() - saved_time
                 hours_ago = int(time_diff.total_seconds() / 3600)
@@ -741,16 +785,21 @@ Prioritize the content below over Claude's auto-generated summaries.
 
     guidance_content = "\n".join(guidance_lines)
 
-    # Display guidance panel
+    # Priority message and guidance panel in a single print
     console.print(
-        Panel(
-            guidance_content,
-            title="[bold green]Context Recovery Guide[/bold green]",
-            border_style="green",
-            padding=(1, 2),
+        Group(
+            "",
+            priority_msg,
+            "",
+            Panel(
+                guidance_content,
+                title="[bold green]Context Recovery Guide[/bold green]",
+                border_style="green",
+                padding=(1, 2),
+            ),
+            ""
         )
     )
-    console.print()
 
 
 def main():
@@ -765,11 +814,12 @@ def main():
         # Step 0: Session Continuity Check and Token Initialization
         # ========================================
         if should_reset_token_usage():
-            import json
-            from datetime import datetime, UTC
+            from datetime import UTC
+            from common import fastjson
 
-            usage_path = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
-            usage_path.parent.mkdir(parents=True, exist_ok=True)
+            usage_path = TOKEN_USAGE_PATH
+            if not usage_path.parent.is_dir():
+                usage_path.parent.mkdir(parents=True, exist_ok=True)
 
             new_data = {
                 "current_session": "",
@@ -779,8 +829,9 @@ def main():
                 "reset_count": 0
             }
 
-            with open(usage_path, 'w') as f:
-                json.dump(new_data, f, indent=2)
+            tmp_path = usage_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(fastjson.dumps(new_data, indent=True))
+            os.replace(tmp_path, usage_path)
 
             if logger:
                 logger.log_info("New session detected - token-usage.json initialization complete")
@@ -794,9 +845,9 @@ def main():
                 primary_collection=config.get('primary_collection', 'example_project_context')
             )
 
-        env, project_path = detect_environment(config)
+        env, project_path = _probe_environment(config)
 
-        work_context = detect_work_context()
+        work_context = _scan_work_context()
 
         if logger:
             logger.log_info(
@@ -806,50 +857,52 @@ def main():
                 work_context=work_context
             )
 
-        # ========================================
-        # Step 1: Context Recovery Verification
-        # ========================================
-        recovery_options = check_context_recovery_needed()
-        if recovery_options["has_recovery"]:
-            print_context_recovery_guidance(recovery_options)
-
-            if logger:
-                logger.log_info(
-                    "Context Recovery Guide Display Complete",
-                    has_compressed=recovery_options["compressed_file"] is not None,
-                    has_backup=recovery_options["latest_backup"] is not None,
-                    backup_count=len(recovery_options["backup_files"])
-                )
-
-        # ========================================
-        # Step 2: Project Information and Work Guide
-        # ========================================
-        if recovery_options["has_recovery"]:
-            print_rule("Step 2: Project Information and Work Guide", style="bold cyan")
-            console.print()
-
-        print_token_status(config)
-
-        print_header(config, env, project_path, work_context)
-        print_mcp_priority(config)
-        print_context_search_guide(config)
-        print_guidelines(config)
-        print_work_rules(config)
-        print_code_style_rules(config)
-        print_completion_checklist(config)
-        print_footer(config)
+        # Buffer the whole banner in the console and write it out once
+        with console:
+            # ========================================
+            # Step 1: Context Recovery Verification
+            # ========================================
+            recovery_options = check_context_recovery_needed()
+            if recovery_options["has_recovery"]:
+                print_context_recovery_guidance(recovery_options)
+
+                if logger:
+                    logger.log_info(
+                        "Context Recovery Guide Display Complete",
+                        has_compressed=recovery_options["compressed_file"] is not None,
+                        has_backup=recovery_options["latest_backup"] is not None,
+                        backup_count=len(recovery_options["backup_files"])
+                    )
+
+            # ========================================
+            # Step 2: Project Information and Work Guide
+            # ========================================
+            if recovery_options["has_recovery"]:
+                print_rule("Step 2: Project Information and Work Guide", style="bold cyan")
+                console.print()
+
+            token_status_printed = print_token_status(config)
+
+            print_header(config, env, project_path, work_context)
+            print_mcp_priority(config)
+            print_context_search_guide(config)
+            print_guidelines(config)
+            print_work_rules(config)
+            print_code_style_rules(config)
+            print_completion_checklist(config)
+            print_footer(config)
 
         if logger:
             logger.log_end(
                 success=True,
                 sections_printed=[
                     "context_recovery" if recovery_options["has_recovery"] else None,
-                    "token_status" if get_current_token_usage() else None,
+                    "token_status" if token_status_printed else None,
                     "header",
                     "mcp_priority" if config.get('mcp_tools_priority') else None,
                     "context_search" if config['context_search']['enabled'] else None,
                     "guidelines" if config.get('guidelines') else None,
-                    "project_rules" if get_project_specific_rules(config) else None,
+                    "project_rules" if config.get('project_type', '') in PROJECT_RULES else None,
                     "work_rules" if config.get('work_rules') else None,
                     "code_style_rules" if config.get('code_style_rules') else None,
                     "checklist" if config.get('completion_checklist') else None,
@@ -11,8 +11,8 @@ Usage:
     python .claude/session-start.py
 """
 
+import importlib
 import os
-import subprocess
 import sys
 from pathlib import Path
 
@@ -25,6 +25,29 @@ def get_script_dir() -> Path:
     return Path(__file__).parent
 
 
+def _has_any_recovery_artifacts() -> bool:
+    """Whether a .claude directory context_recovery_helper reads holds recovery state or backups"""
+    # Same candidates context_recovery_helper falls back to, plus this project
+    claude_dirs = [str(get_script_dir().parent)]
+    project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
+    if project_dir:
+        claude_dirs.append(os.path.join(project_dir, '.claude'))
+    claude_dirs.append(os.path.join(os.getcwd(), '.claude'))
+    claude_dirs.append(os.path.join(os.path.expanduser('~'), '.claude'))
+
+    for claude_dir in dict.fromkeys(claude_dirs):
+        if os.path.isfile(os.path.join(claude_dir, 'recovery', 'compact-recovery.json')):
+            return True
+        try:
+            with os.scandir(os.path.join(claude_dir, 'backups')) as it:
+                if any(entry.name.startswith('conversation_') for entry in it):
+                    return True
+        except OSError:
+            pass
+
+    return False
+
+
 def run_script(script_name: str, description: str, logger=None) -> bool:
     """
     Script Execution
@@ -51,27 +74,26 @@ def run_script(script_name: str, description: str, logger=None) -> bool:
         return False
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=False,
-            capture_output=True,
-            text=True
-        )
-
-        if result.stdout:
-            print(result.stdout, end='', flush=True)
-
-        if result.stderr:
-            print(result.stderr, end='', file=sys.stderr, flush=True)
-
-        if result.returncode != 0:
+        # Run main() in this interpreter instead of spawning a new one;
+        # sys.exit() from the hook becomes the return code
+        module = importlib.import_module(script_path.stem)
+        try:
+            module.main()
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        if returncode != 0:
             error_msg = f"Error occurred while executing {script_name} (proceeding)"
             console.print(f"\n[yellow][WARNING] {error_msg}[/yellow]")
             if logger:
-                logger.log_error(error_msg, script=script_name, returncode=result.returncode)
+                logger.log_error(error_msg, script=script_name, returncode=returncode)
         else:
             if logger:
-                logger.log_info(f"Script execution complete", script=script_name, returncode=result.returncode)
+                logger.log_info(f"Script execution complete", script=script_name, returncode=returncode)
 
         return True
 
@@ -97,12 +119,15 @@ def main():
             except Exception:
                 pass
 
-        # 1. Context Recovery Helper 실행
-        run_script(
-            "context_recovery_helper.py",
-            "Step 1: Context Recovery Verification",
-            logger
-        )
+        # 1. Context Recovery Helper 실행 (복구 파일이 없으면 생략)
+        if _has_any_recovery_artifacts():
+            run_script(
+                "context_recovery_helper.py",
+                "Step 1: Context Recovery Verification",
+                logger
+            )
+        elif logger:
+            logger.log_info("No recovery artifacts - context recovery helper skipped")
 
         # 2. Pre-Session Hook 실행
         run_script(
@@ -14,23 +14,29 @@ Commands:
 import json
 import os
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn
+from rich.progress_bar import ProgressBar
 from rich.table import Table
 from rich import box
 
+from common import fastjson
+
 app = typer.Typer(
     name="token-manager",
     help="Token management utilities for Claude Code sessions"
 )
 console = Console()
 
+# Inactive sessions older than this are dropped from token-usage.json;
+# their tokens are already counted in total_accumulated
+SESSION_RETENTION_DAYS = 30
+
 
 # ============================================================================
 # Shared Utilities
@@ -81,8 +87,7 @@ def load_token_usage() -> Dict[str, Any]:
         }
 
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return fastjson.load_file(config_path)
     except Exception:
         return {
             "current_session": "",
@@ -99,8 +104,7 @@ def save_token_usage(data: Dict[str, Any]) -> bool:
 
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        config_path.write_bytes(fastjson.dumps(data, indent=True))
         return True
     except Exception as e:
         console.print(f"[red]Error saving token-usage.json: {e}[/red]")
@@ -220,6 +224,21 @@ def get_latest_token_usage() -> Optional[Dict[str, int]]:
         return None
 
 
+def prune_sessions(usage_data: Dict[str, Any]) -> None:
+    """Drop sessions other than the current one not updated within SESSION_RETENTION_DAYS."""
+    sessions = usage_data.get('sessions')
+    if not sessions:
+        return
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=SESSION_RETENTION_DAYS)).isoformat()
+    current_session_id = usage_data.get('current_session', '')
+    usage_data['sessions'] = {
+        session_id: session
+        for session_id, session in sessions.items()
+        if session_id == current_session_id or session.get('updated', cutoff) >= cutoff
+    }
+
+
 def update_token_usage(current_tokens: int) -> Dict[str, Any]:
     """Update token usage and return updated data."""
     usage_data = load_token_usage()
@@ -250,6 +269,7 @@ def update_token_usage(current_tokens: int) -> Dict[str, Any]:
         'status': 'active'
     }
 
+    prune_sessions(usage_data)
     save_token_usage(usage_data)
     return usage_data
 
@@ -676,6 +696,17 @@ def check_continuity():
 # Command: status
 # ============================================================================
 
+def progress_row(completed: int, total: int) -> Table:
+    """Static progress bar row (indent, 40-column bar, percentage)."""
+    row = Table.grid(padding=(0, 1))
+    row.add_row(
+        "  ",
+        ProgressBar(total=total, completed=completed, width=40),
+        f"[progress.percentage]{min(100.0, completed * 100 / total):>3.0f}%"
+    )
+    return row
+
+
 @app.command()
 def status():
     """
@@ -747,22 +778,10 @@ def status():
 
     # Progress bars
     console.print("\n[bold]Session Progress:[/bold]")
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        progress.add_task("", total=session_critical, completed=current_tokens)
+    console.print(progress_row(current_tokens, session_critical))
 
     console.print("\n[bold]Total Progress:[/bold]")
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        progress.add_task("", total=total_critical, completed=total_accumulated)
+    console.print(progress_row(total_accumulated, total_critical))
 
     # Check and display warnings/critical messages
     session_auto_stop = session_limits.get('auto_stop', False)
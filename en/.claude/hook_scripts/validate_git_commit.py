@@ -6,16 +6,47 @@ Enforces commit message conventions and quality standards.
 import json
 import re
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-
-from rich.console import Console
-
-console = Console(stderr=True)
+from typing import Dict, Any, FrozenSet, List, Tuple, Optional
 
 from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
 
-
+# Past tense forms of imperative verbs (others fall back to verb + 'ed')
+VERB_CONJUGATIONS = {
+    'add': 'added', 'fix': 'fixed', 'update': 'updated',
+    'remove': 'removed', 'refactor': 'refactored',
+    'implement': 'implemented', 'improve': 'improved',
+    'optimize': 'optimized', 'enhance': 'enhanced',
+    'resolve': 'resolved', 'delete': 'deleted',
+    'change': 'changed', 'create': 'created', 'modify': 'modified'
+}
+
+# Word tokens for the imperative mood check (same boundaries as \b)
+_WORD_RE = re.compile(r'\w+')
+
+# Forbidden git option patterns, one named group each
+FORBIDDEN_GIT_OPTION_PATTERNS = {
+    'no_verify': r'--no-verify',
+    'no_gpg_sign': r'--no-gpg-sign',
+    'git_c': r'git\s+-C\s+',
+    'hooks_path': r'-c\s+core\.hooksPath',
+    'gpgsign_false': r'-c\s+commit\.gpgsign=false',
+}
+_FORBIDDEN_GIT_OPTION_RE = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in FORBIDDEN_GIT_OPTION_PATTERNS.items())
+)
+
+
+@cache
+def get_console():
+    """Rich stderr console (rich is imported only when an error is reported)"""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@cache
 def load_git_hooks_config() -> Dict[str, Any]:
     """
     Load git-hooks.json configuration file.
@@ -26,12 +57,11 @@ def load_git_hooks_config() -> Dict[str, Any]:
     ]
 
     for candidate in candidates:
-        if candidate.exists():
-            try:
-                with open(candidate, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                continue
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
 
     # Default fallback configuration
     return {
@@ -49,6 +79,58 @@ def load_git_hooks_config() -> Dict[str, Any]:
     }
 
 
+@cache
+def _build_forbidden_patterns(
+    patterns: Tuple[str, ...],
+    block_co_authored: bool
+) -> Tuple[re.Pattern, Tuple[Tuple[re.Pattern, str], ...]]:
+    """
+    Compile forbidden commit message patterns once per configuration.
+
+    Args:
+        patterns: forbidden_patterns from git-hooks.json
+        block_co_authored: Whether Co-Authored-By is checked separately
+
+    Returns:
+        Tuple of (combined alternation of all patterns, (pattern, error message) pairs)
+    """
+    # Build forbidden pattern tuples with messages (excluding Co-Authored-By if block_co_authored is separate)
+    forbidden_pattern_tuples = []
+    for pattern in patterns:
+        # Skip Co-Authored-By patterns if block_co_authored setting exists separately
+        if block_co_authored and pattern.lower() in ['co-authored-by', 'co-authored-by:']:
+            continue
+        forbidden_pattern_tuples.append(
+            (r"\b" + re.escape(pattern) + r"\b", f"커밋 메시지에서 '{pattern}'를 제거하세요")
+        )
+
+    # Add Claude signature patterns
+    forbidden_pattern_tuples.extend([
+        (r"🤖 Generated with \[Claude Code\]", "Remove Claude signatures from commit messages."),
+        (r"🤖 Generated with Claude", "Remove Claude signatures from commit messages."),
+        (r"claude\.com|Claude Code", "Remove Claude-related content from the commit message."),
+        (r"noreply@anthropic\.com", "Remove Anthropic emails from commit messages."),
+    ])
+
+    compiled = tuple(
+        (re.compile(pattern, re.IGNORECASE), error_msg)
+        for pattern, error_msg in forbidden_pattern_tuples
+    )
+    combined = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern, _ in forbidden_pattern_tuples),
+        re.IGNORECASE
+    )
+    return combined, compiled
+
+
+@cache
+def _build_past_tense_forms(verbs: Tuple[str, ...]) -> FrozenSet[str]:
+    """
+    Build the lowercase past tense forms of the configured imperative verbs.
+    """
+    return frozenset(VERB_CONJUGATIONS.get(verb, verb + 'ed').lower() for verb in verbs)
+
+
 class CommitMessageValidator:
     """
     Example Project project commit message validator.
@@ -83,40 +165,16 @@ class CommitMessageValidator:
         self.max_body_line_length = validation_config.get('max_body_line_length', 100)
         self.imperative_verbs = validation_config.get('imperative_verbs', [])
 
-        # Build forbidden pattern tuples with messages (excluding Co-Authored-By if block_co_authored is separate)
-        self.forbidden_pattern_tuples = []
-        for pattern in self.forbidden_patterns:
-            # Skip Co-Authored-By patterns if block_co_authored setting exists separately
-            if self.block_co_authored and pattern.lower() in ['co-authored-by', 'co-authored-by:']:
-                continue
-            self.forbidden_pattern_tuples.append(
-                (r"\b" + re.escape(pattern) + r"\b", f"커밋 메시지에서 '{pattern}'를 제거하세요")
-            )
-
-        # Add Claude signature patterns
-        self.forbidden_pattern_tuples.extend([
-            (r"🤖 Generated with \[Claude Code\]", "Remove Claude signatures from commit messages."),
-            (r"🤖 Generated with Claude", "Remove Claude signatures from commit messages."),
-            (r"claude\.com|Claude Code", "Remove Claude-related content from the commit message."),
-            (r"noreply@anthropic\.com", "Remove Anthropic emails from commit messages."),
-        ])
-
-        # Build past tense patterns from imperative verbs
-        past_tense_forms = []
-        verb_conjugations = {
-            'add': 'added', 'fix': 'fixed', 'update': 'updated',
-            'remove': 'removed', 'refactor': 'refactored',
-            'implement': 'implemented', 'improve': 'improved',
-            'optimize': 'optimized', 'enhance': 'enhanced',
-            'resolve': 'resolved', 'delete': 'deleted',
-            'change': 'changed', 'create': 'created', 'modify': 'modified'
-        }
+        self.combined_forbidden_pattern, self.forbidden_pattern_tuples = _build_forbidden_patterns(
+            tuple(self.forbidden_patterns), self.block_co_authored
+        )
+        self.co_author_pattern = re.compile(r"Co-Authored-By:", re.IGNORECASE)
 
-        for verb in self.imperative_verbs:
-            past_form = verb_conjugations.get(verb, verb + 'ed')
-            past_tense_forms.append(past_form)
+        types_pattern = '|'.join(self.conventional_types) if self.conventional_types else 'feat|fix'
+        self.conventional_pattern = re.compile(f'^({types_pattern})' + r'(\([^)]+\))?: .+')
+        self.conventional_extract_pattern = re.compile(r'^([a-z]+)(\(([^)]+)\))?: (.+)')
 
-        self.past_tense_pattern = re.compile(r'\b(' + '|'.join(past_tense_forms) + r')\b', re.IGNORECASE) if past_tense_forms else None
+        self.past_tense_forms = _build_past_tense_forms(tuple(self.imperative_verbs))
 
     def validate(self) -> Tuple[List[str], List[str]]:
         """Run Full Verification"""
@@ -136,22 +194,17 @@ class CommitMessageValidator:
         """
         # Check Co-Authored-By separately if block_co_authored is enabled
         if self.block_co_authored:
-            co_author_patterns = [
-                r"Co-Authored-By:",
-                r"Co-authored-by:",
-                r"co-authored-by:"
-            ]
-            for pattern in co_author_patterns:
-                if re.search(pattern, self.message, re.IGNORECASE):
-                    self.errors.append(
-                        "Co-authored commits are prohibited under project policy. "
-                        "Please write it as a single commit."
-                    )
-                    break
-
-        # Check other forbidden patterns
+            if self.co_author_pattern.search(self.message):
+                self.errors.append(
+                    "Co-authored commits are prohibited under project policy. "
+                    "Please write it as a single commit."
+                )
+
+        # Check other forbidden patterns (one combined scan rules out clean messages)
+        if not self.combined_forbidden_pattern.search(self.message):
+            return
         for pattern, error_msg in self.forbidden_pattern_tuples:
-            if re.search(pattern, self.message, re.IGNORECASE):
+            if pattern.search(self.message):
                 self.errors.append(error_msg)
 
     def _validate_first_line(self) -> None:
@@ -177,10 +230,7 @@ class CommitMessageValidator:
         """
         Validate Conventional Commits format.
         """
-        types_pattern = '|'.join(self.conventional_types) if self.conventional_types else 'feat|fix'
-        pattern = f'^({types_pattern})' + r'(\([^)]+\))?: .+'
-
-        if not re.match(pattern, line):
+        if not self.conventional_pattern.match(line):
             self.warnings.append(
                 "We recommend using the Conventional Commits format: "
                 "type(scope)?: description\n"
@@ -188,7 +238,7 @@ class CommitMessageValidator:
             )
             return
 
-        match = re.match(r'^([a-z]+)(\(([^)]+)\))?: (.+)', line)
+        match = self.conventional_extract_pattern.match(line)
         if match:
             commit_type, _, scope, description = match.groups()
 
@@ -213,7 +263,8 @@ class CommitMessageValidator:
         """
         Check for imperative mood in commit message.
         """
-        if self.past_tense_pattern and self.past_tense_pattern.search(line):
+        # Whole-word lookup: each \w run is tested against the past tense set
+        if self.past_tense_forms and not self.past_tense_forms.isdisjoint(_WORD_RE.findall(line.lower())):
             self.warnings.append(
                 "Use imperative verbs (e.g., 'Add feature' [GOOD], 'Added feature' [BAD])"
             )
@@ -227,9 +278,45 @@ class CommitMessageValidator:
             self.errors.append("Add a blank line after the commit message summary.")
 
 
+def _scan_quoted_messages(command: str) -> List[str]:
+    """
+    Collect quoted -m arguments in a single left-to-right pass.
+
+    Each message runs to its matching unescaped quote, so the scan stays
+    linear regardless of message length or quoting.
+    """
+    messages = []
+    length = len(command)
+    pos = command.find('-m')
+    while pos != -1:
+        start = pos + 2
+        i = start
+        while i < length and command[i].isspace():
+            i += 1
+
+        if i == start or i >= length or command[i] not in '"\'':
+            pos = command.find('-m', start)
+            continue
+
+        quote = command[i]
+        i += 1
+        end = i
+        while end < length and command[end] != quote:
+            # Single quotes have no escapes in the shell
+            end += 2 if quote == '"' and command[end] == '\\' else 1
+
+        if end >= length:
+            break
+        if end > i:
+            messages.append(command[i:end])
+        pos = command.find('-m', end + 1)
+
+    return messages
+
+
 def extract_commit_message(command: str) -> Optional[str]:
     """Extracting Commit Messages from Git Commands (Combining All -m Flags)"""
-    messages = re.findall(r'-m\s+["\'](.+?)["\']', command, re.DOTALL)
+    messages = _scan_quoted_messages(command)
     if messages:
         return '\n\n'.join(messages)
 
@@ -270,23 +357,24 @@ def check_forbidden_git_options(command: str, config: Optional[Dict[str, Any]] =
     ])
     git_usage_rules = validation_config.get('git_usage_rules', [])
 
-    # Build forbidden option patterns with messages
-    forbidden_patterns = [
-        (r'--no-verify', "git commit --no-verify is prohibited for security reasons."),
-        (r'--no-gpg-sign', "Bypassing GPG signatures is prohibited."),
-        (r'git\s+-C\s+', "The use of the `git -C` option is prohibited (bypassing the project directory)."),
-        (r'-c\s+core\.hooksPath', "Changing the core.hooksPath setting is prohibited."),
-        (r'-c\s+commit\.gpgsign=false', "Disabling GPG signatures is prohibited."),
-    ]
+    # Error messages per forbidden option group
+    error_messages = {
+        'no_verify': "git commit --no-verify is prohibited for security reasons.",
+        'no_gpg_sign': "Bypassing GPG signatures is prohibited.",
+        'git_c': "The use of the `git -C` option is prohibited (bypassing the project directory).",
+        'hooks_path': "Changing the core.hooksPath setting is prohibited.",
+        'gpgsign_false': "Disabling GPG signatures is prohibited.",
+    }
 
     # Check only patterns that are in config
-    for pattern, error_msg in forbidden_patterns:
-        # Extract simple option name from pattern
-        for forbidden_option in forbidden_git_options:
-            if forbidden_option in pattern:
-                if re.search(pattern, command):
-                    errors.append(error_msg)
-                break
+    enabled = {
+        name for name, pattern in FORBIDDEN_GIT_OPTION_PATTERNS.items()
+        if any(forbidden_option in pattern for forbidden_option in forbidden_git_options)
+    }
+    found = {match.lastgroup for match in _FORBIDDEN_GIT_OPTION_RE.finditer(command)}
+    for name in FORBIDDEN_GIT_OPTION_PATTERNS:
+        if name in enabled and name in found:
+            errors.append(error_messages[name])
 
     return errors, git_usage_rules
 
@@ -322,7 +410,7 @@ def main():
         error_msg = f"Invalid JSON input: {e}"
         sys.stderr.write(f"\n❌ Error: {error_msg}\n")
         sys.stderr.flush()
-        console.print(f"[red]Error: {error_msg}[/]")
+        get_console().print(f"[red]Error: {error_msg}[/]")
 
         capture_exception(e, context={
             "hook": "validate-git-commit",
@@ -335,7 +423,7 @@ def main():
         error_msg = f"Unexpected error during input processing: {e}"
         sys.stderr.write(f"\n❌ Error: {error_msg}\n")
         sys.stderr.flush()
-        console.print(f"[red]Error: {error_msg}[/]")
+        get_console().print(f"[red]Error: {error_msg}[/]")
 
         capture_exception(e, context={
             "hook": "validate-git-commit",
@@ -3,14 +3,14 @@
 Example Project Hook Scripts CLI Manager
 """
 import sys
+from functools import cache
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 HOOK_SCRIPTS_DIR = Path(__file__).parent / "hook_scripts"
 sys.path.insert(0, str(HOOK_SCRIPTS_DIR))
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 app = typer.Typer(
     name="hooks",
@@ -19,7 +19,105 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-console = Console()
+@cache
+def get_console():
+    """Rich console for terminal output (rich is imported on first use)"""
+    from rich.console import Console
+
+    return Console()
+
+
+def _run_hook_main(
+    hook_main, stdin_text: str, argv: List[str], stream_stdout: bool = False
+) -> Tuple[int, str, str]:
+    """
+    Run a hook script's main() in-process.
+
+    Swaps stdin/argv and captures stdout/stderr so the result matches what a
+    child Python process used to produce, as (exit code, stdout, stderr).
+    With stream_stdout the hook writes straight to the terminal as it runs
+    and the returned stdout is empty.
+    """
+    import contextlib
+    import io
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_stdin, saved_argv = sys.stdin, sys.argv
+    sys.stdin, sys.argv = io.StringIO(stdin_text), argv
+    returncode = 0
+    try:
+        redirect = contextlib.nullcontext() if stream_stdout else contextlib.redirect_stdout(stdout)
+        with redirect, contextlib.redirect_stderr(stderr):
+            hook_main()
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        else:
+            returncode = e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.stdin, sys.argv = saved_stdin, saved_argv
+
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+# PreToolUse Write payload the check hooks read from stdin; only tool_input varies
+_PRETOOL_WRITE_ENVELOPE = '{"hook_event_name": "PreToolUse", "tool_name": "Write", "tool_input": %s}'
+
+
+def _pretool_write_input(file_path: Optional[str] = None) -> str:
+    """Serialize the PreToolUse Write hook input for file_path (empty tool_input if None)"""
+    if file_path is None:
+        return _PRETOOL_WRITE_ENVELOPE % "{}"
+
+    from hook_scripts.common import fastjson
+
+    return _PRETOOL_WRITE_ENVELOPE % fastjson.dumps({"file_path": file_path}).decode()
+
+
+# Preflight check -> (hook module, argv[0]) for the hooks preflight runs together
+_CHECK_HOOKS = {
+    "scan_secrets": ("hook_scripts.secret_scanner", "secret_scanner.py"),
+    "check_mocks": ("hook_scripts.no_mock_code", "no_mock_code.py"),
+    "validate_timestamp": ("hook_scripts.timestamp_validator", "timestamp_validator.py"),
+}
+
+
+def _run_check_hook(check: str, file_path: Optional[str]) -> Tuple[int, str, str]:
+    """
+    Run a check hook's main() on a PreToolUse Write payload.
+
+    Module-level so it can be submitted to a process pool.
+    """
+    import importlib
+
+    module_name, script_name = _CHECK_HOOKS[check]
+
+    return _run_hook_main(
+        importlib.import_module(module_name).main, _pretool_write_input(file_path), [script_name]
+    )
+
+
+# Session lifecycle phase -> (hook module, status message)
+_SESSION_PHASES = {
+    "session_start": ("hook_scripts.session_start", "[cyan]세션 시작 중...[/cyan]"),
+    "context_recovery": ("hook_scripts.context_recovery_helper", "[cyan]Recovering context...[/cyan]"),
+    "pre_session": ("hook_scripts.pre_session_hook", "[cyan]Project Guide Display...[/cyan]"),
+    "post_session": ("hook_scripts.post_session_hook", "[cyan]Processing session termination...[/cyan]"),
+}
+
+
+def _run_session_phase(phase: str) -> None:
+    """Import the phase's hook module, announce it and run its main()"""
+    import importlib
+
+    module_name, message = _SESSION_PHASES[phase]
+    hook_main = importlib.import_module(module_name).main
+
+    get_console().print(message)
+    try:
+        hook_main()
+    except SystemExit:
+        pass
 
 
 @app.command()
@@ -42,13 +140,7 @@ def session_start(
     1. Context Recovery Helper
     2. Pre-Session Hook (Project Information and Guide)
     """
-    from hook_scripts.session_start import main as session_start_main
-
-    console.print("[cyan]세션 시작 중...[/cyan]")
-    try:
-        session_start_main()
-    except SystemExit:
-        pass
+    _run_session_phase("session_start")
 
 
 @app.command()
@@ -61,13 +153,7 @@ def context_recovery():
     - Automatically load recent backup files
     - Automatically provide context to new sessions
     """
-    from hook_scripts.context_recovery_helper import main as recovery_main
-
-    console.print("[cyan]Recovering context...[/cyan]")
-    try:
-        recovery_main()
-    except SystemExit:
-        pass
+    _run_session_phase("context_recovery")
 
 
 @app.command()
@@ -81,26 +167,15 @@ def pre_session():
     - Task rules and instructions
     - Completion checklist
     """
-    from hook_scripts.pre_session_hook import main as pre_session_main
-
-    console.print("[cyan]Project Guide Display...[/cyan]")
-    try:
-        pre_session_main()
-    except SystemExit:
-        pass
+    _run_session_phase("pre_session")
 
 
 @app.command()
 def auto_compact(
-    threshold: float = typer.Option(
-        None,
-        "--threshold",
-        help="Compression threshold (0.0-1.0)"
-    ),
     force: bool = typer.Option(
         False,
         "--force",
-        help="Force Compression Execution"
+        help="Run compaction even without a PreCompact payload on stdin"
     )
 ):
     """
@@ -111,9 +186,41 @@ def auto_compact(
     - Generates an AI summary
     - Saves to ChromaDB
     - Creates a recovery file
+
+    Runs only when stdin carries the PreCompact hook payload, or with --force.
     """
-    console.print("[cyan]Checking context compression...[/cyan]")
-    console.print("[yellow]Note: Must be executed using the PreCompact hook to function properly.[/yellow]")
+    import json
+    import os
+    import stat
+
+    # Only compact for a PreCompact payload on stdin (or --force); a bare manual
+    # run must not overwrite the last compaction's recovery state
+    payload = ""
+    try:
+        stdin_mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError):
+        stdin_mode = 0
+    if stat.S_ISFIFO(stdin_mode) or stat.S_ISSOCK(stdin_mode) or stat.S_ISREG(stdin_mode):
+        payload = sys.stdin.read()
+
+    try:
+        is_pre_compact = json.loads(payload).get("hook_event_name") == "PreCompact"
+    except (ValueError, AttributeError):
+        is_pre_compact = False
+
+    get_console().print("[cyan]Checking context compression...[/cyan]")
+    if not (is_pre_compact or force):
+        get_console().print("[yellow]Note: Must be executed using the PreCompact hook to function properly.[/yellow]")
+        return
+
+    from hook_scripts.auto_compact import main as auto_compact_main
+
+    _, _, stderr = _run_hook_main(
+        auto_compact_main, payload, ["auto_compact.py"], stream_stdout=True
+    )
+
+    if stderr:
+        get_console().print(stderr, style="dim")
 
 
 @app.command()
@@ -126,13 +233,7 @@ def post_session():
     - Clean up logs
     - Save state
     """
-    from hook_scripts.post_session_hook import main as post_session_main
-
-    console.print("[cyan]Processing session termination...[/cyan]")
-    try:
-        post_session_main()
-    except SystemExit:
-        pass
+    _run_session_phase("post_session")
 
 
 @app.command()
@@ -153,18 +254,21 @@ def validate_commit(
     """
     from hook_scripts.validate_git_commit import main as validate_main
 
-    if message:
-        import io
-        sys.stdin = io.StringIO(message)
+    get_console().print("[cyan]Verifying commit message...[/cyan]")
 
-    console.print("[cyan]Verifying commit message...[/cyan]")
-    try:
-        validate_main()
-    except SystemExit as e:
-        if e.code != 0:
-            console.print("[red]Verification failed[/red]")
-        else:
-            console.print("[green]Verification passed[/green]")
+    # Without a message argument, hand our own stdin to the hook
+    stdin_text = message if message else sys.stdin.read()
+    returncode, _, stderr = _run_hook_main(
+        validate_main, stdin_text, ["validate_git_commit.py"], stream_stdout=True
+    )
+
+    if stderr:
+        get_console().print(stderr, style="dim")
+
+    if returncode != 0:
+        get_console().print("[red]Verification failed[/red]")
+    else:
+        get_console().print("[green]Verification passed[/green]")
 
 
 @app.command()
@@ -181,34 +285,22 @@ def scan_secrets(
     - Token Patterns
     - Sensitive File Names
     """
-    import subprocess
-    import json
-
-    console.print(f"[cyan]Secret scan in progress: {path}[/cyan]")
-
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {"file_path": path}
-    }
+    get_console().print(f"[cyan]Secret scan in progress: {path}[/cyan]")
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "secret_scanner.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from hook_scripts.secret_scanner import main as secret_scanner_main
+
+        returncode, _, stderr = _run_hook_main(
+            secret_scanner_main, _pretool_write_input(path), ["secret_scanner.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]Warning: An error occurred during scanning. (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]Warning: An error occurred during scanning. (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        get_console().print(f"[red]Error: {e}[/red]")
 
 
 @app.command()
@@ -224,34 +316,22 @@ def check_mocks(
     - Placeholder code
     - Unimplemented functions
     """
-    import subprocess
-    import json
-
-    console.print(f"[cyan]Checking mock code: {path}[/cyan]")
-
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {"file_path": path}
-    }
+    get_console().print(f"[cyan]Checking mock code: {path}[/cyan]")
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "no_mock_code.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from hook_scripts.no_mock_code import main as no_mock_code_main
+
+        returncode, _, stderr = _run_hook_main(
+            no_mock_code_main, _pretool_write_input(path), ["no_mock_code.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]Warning: Error occurred during check (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]Warning: Error occurred during check (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        get_console().print(f"[red]Error: {e}[/red]")
 
 
 @app.command()
@@ -264,34 +344,74 @@ def validate_timestamp():
     - Outdated timestamps
     - Expired time values
     """
-    import subprocess
-    import json
-
-    console.print("[cyan]Timestamp verification in progress...[/cyan]")
-
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {}
-    }
+    get_console().print("[cyan]Timestamp verification in progress...[/cyan]")
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "timestamp_validator.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from hook_scripts.timestamp_validator import main as timestamp_validator_main
+
+        returncode, _, stderr = _run_hook_main(
+            timestamp_validator_main, _pretool_write_input(), ["timestamp_validator.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]Warning: An error occurred during verification. (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]Warning: An error occurred during verification. (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        get_console().print(f"[red]Error: {e}[/red]")
+
+
+@app.command()
+def preflight(
+    path: str = typer.Argument(".", help="Path to inspect")
+):
+    """
+    Run the secret scan, mock code check and timestamp verification together
+
+    Each check runs in its own worker process (the hooks read stdin and
+    write stdout, so they cannot share one process concurrently) and its
+    output is printed as soon as it finishes.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    get_console().print(f"[cyan]Running preflight checks: {path}[/cyan]")
+
+    file_paths = {
+        "scan_secrets": path,
+        "check_mocks": path,
+        "validate_timestamp": None,
+    }
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=len(file_paths)) as executor:
+        futures = {
+            executor.submit(_run_check_hook, check, file_path): check
+            for check, file_path in file_paths.items()
+        }
+        for future in as_completed(futures):
+            check = futures[future]
+            try:
+                returncode, stdout, stderr = future.result()
+            except Exception as e:
+                get_console().print(f"[red]{check}: Error: {e}[/red]")
+                failed.append(check)
+                continue
+
+            if stdout:
+                get_console().print(stdout)
+            if stderr:
+                get_console().print(stderr, style="dim")
+
+            if returncode != 0:
+                get_console().print(f"[yellow]Warning: {check} exited with code {returncode}[/yellow]")
+                failed.append(check)
+
+    if failed:
+        get_console().print(f"[red]Preflight failed: {', '.join(failed)}[/red]")
+        raise typer.Exit(1)
+
+    get_console().print("[green]All preflight checks passed[/green]")
 
 
 @app.command()
@@ -302,18 +422,23 @@ def view_logs(
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format")
 ):
     """Hook Log Inquiry"""
-    import subprocess
+    from hook_scripts.common.log_viewer import view as view_logs_cmd
+
+    # Call common/log_viewer's view directly in-process
+    view_logs_cmd(script, limit, errors, json_output)
 
-    cmd = [sys.executable, str(HOOK_SCRIPTS_DIR / "view_logs.py"), "view"]
-    if script:
-        cmd.append(script)
-    cmd.extend(["--limit", str(limit)])
-    if errors:
-        cmd.append("--errors")
-    if json_output:
-        cmd.append("--json")
 
-    subprocess.run(cmd)
+# server action -> (required, accepted) positional arguments after the action.
+# start-* takes the server type as its category argument; unknown actions are
+# passed through for common/servers.py to reject.
+_SERVER_ACTIONS = {
+    "list": (0, 0),
+    "status": (2, 2),
+    "start-backend": (0, 1),
+    "start-frontend": (0, 1),
+    "stop": (2, 2),
+    "stop-all": (0, 0),
+}
 
 
 @app.command()
@@ -342,23 +467,43 @@ def server(
         .claude/hooks server stop backend auth-example
         .claude/hooks server stop-all
     """
-    import subprocess
+    from hook_scripts.common.servers import app as servers_app
 
-    cmd = [sys.executable, str(HOOK_SCRIPTS_DIR / "common" / "servers.py"), action]
+    # Run the common/servers.py Typer app in-process
+    required, accepted = _SERVER_ACTIONS.get(action, (0, 0))
+    args = [category, server_type][:accepted]
+    if not all(args[:required]):
+        get_console().print(f"[red]Error: {action} requires the format <category> <type>[/red]")
+        get_console().print(f"[yellow]Example: .claude/hooks server {action} backend auth-example[/yellow]")
+        raise typer.Exit(1)
 
-    if action in ["start-backend", "start-frontend"]:
-        if category:
-            cmd.append(category)
+    cmd = [action, *(arg for arg in args if arg)]
 
-    elif action in ["status", "stop"]:
-        if not category or not server_type:
-            console.print(f"[red]Error: {action} requires the format <category> <type>[/red]")
-            console.print(f"[yellow]Example: .claude/hooks server {action} backend auth-example[/yellow]")
-            raise typer.Exit(1)
-        cmd.append(category)
-        cmd.append(server_type)
+    try:
+        servers_app(args=cmd, prog_name="hooks server")
+    except SystemExit:
+        pass
 
-    subprocess.run(cmd)
+
+# list-hooks rows: (command, description, type)
+_HOOK_ROWS = (
+    ("session-start", "Session Start (Recovery + Guide)", "Lifecycle"),
+    ("context-recovery", "Context Recovery", "Lifecycle"),
+    ("pre-session", "Project Guide Display", "Lifecycle"),
+    ("auto-compact", "Automatic Context Compression", "Lifecycle"),
+    ("post-session", "Session End Cleanup", "Lifecycle"),
+    ("validate-commit", "Commit Message Verification", "Git"),
+    ("scan-secrets", "Secret Scan", "Security"),
+    ("check-mocks", "Mock Code Check", "Quality"),
+    ("validate-timestamp", "Timestamp Verification", "Quality"),
+    ("preflight", "Secret + Mock + Timestamp Checks (parallel)", "Quality"),
+    ("view-logs", "Hook Log Inquiry", "Utility"),
+    ("server", "Development Server Management", "Dev"),
+    ("token-status", "Token Usage Status", "Token"),
+    ("token-reset", "Token Counter Reset", "Token"),
+    ("token-extract", "Token extraction (PostToolUse Hook)", "Token"),
+    ("token-check", "Session Continuity Check", "Token"),
+)
 
 
 @app.command()
@@ -366,34 +511,18 @@ def list_hooks():
     """
     Display a list of all available hook scripts
     """
+    from rich.table import Table
+
     table = Table(title="Hook Scripts", show_header=True, header_style="bold cyan")
     table.add_column("Command", style="green")
     table.add_column("Description", style="white")
     table.add_column("Type", style="yellow")
 
-    hooks = [
-        ("session-start", "Session Start (Recovery + Guide)", "Lifecycle"),
-        ("context-recovery", "Context Recovery", "Lifecycle"),
-        ("pre-session", "Project Guide Display", "Lifecycle"),
-        ("auto-compact", "Automatic Context Compression", "Lifecycle"),
-        ("post-session", "Session End Cleanup", "Lifecycle"),
-        ("validate-commit", "Commit Message Verification", "Git"),
-        ("scan-secrets", "Secret Scan", "Security"),
-        ("check-mocks", "Mock Code Check", "Quality"),
-        ("validate-timestamp", "Timestamp Verification", "Quality"),
-        ("view-logs", "Hook Log Inquiry", "Utility"),
-        ("server", "Development Server Management", "Dev"),
-        ("token-status", "Token Usage Status", "Token"),
-        ("token-reset", "Token Counter Reset", "Token"),
-        ("token-extract", "Token extraction (PostToolUse Hook)", "Token"),
-        ("token-check", "Session Continuity Check", "Token"),
-    ]
-
-    for cmd, desc, type_ in hooks:
+    for cmd, desc, type_ in _HOOK_ROWS:
         table.add_row(cmd, desc, type_)
 
-    console.print(table)
-    console.print("\n[dim]Detailed information: .claude/hooks [command] --help[/dim]")
+    get_console().print(table)
+    get_console().print("\n[dim]Detailed information: .claude/hooks [command] --help[/dim]")
 
 
 @app.command()
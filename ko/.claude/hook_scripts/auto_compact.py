@@ -9,17 +9,24 @@ Example Project Auto-Compact Script
 4. 복구 정보 저장
 """
 
+import atexit
 import gzip
-import json
+import hashlib
+import heapq
+import mmap
 import os
-import select
+import stat
 import subprocess
 import sys
-import tempfile
+import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -27,18 +34,40 @@ from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
+from common import fastjson
+from common.chroma_client import get_client, get_collection
 from common.config import load_auto_compact_config
 from common.logger import HookLogger
-from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
+from common import breadcrumb_buffer
+from common.sentry import init_sentry, capture_exception, flush
 
 console = Console(stderr=True)
 
+# Transcript 읽기 버퍼 크기 (1 MiB)
+TRANSCRIPT_READ_CHUNK = 1 << 20
 
+# Transcript 증분 파싱 캐시
+TRANSCRIPT_CACHE_VERSION = 2
+TRANSCRIPT_CACHE_MAX_FILES = 10
+
+# 커진 transcript가 캐시를 재사용하려면 캐시 오프셋 직전의 이 바이트 수가 그대로여야 함
+TRANSCRIPT_CACHE_CHECK_BYTES = 4096
+
+# 상태 파일 기록 최소 간격 (초)
+STATUS_DEBOUNCE_SECONDS = 0.2
+
+# collection.add() 1회 호출 최대 문서 수 (ChromaDB 기본 최대 배치 크기)
+CHROMADB_MAX_BATCH_SIZE = 5461
+
+
+@cache
 def find_project_root() -> Optional[Path]:
     """
     Example Project 프로젝트 루트 자동 탐지
 
     pyproject.toml에 example_project가 있는 루트 디렉토리를 찾음
+
+    훅은 작업 디렉토리를 변경하지 않으므로 프로세스 동안 결과를 캐시함
     """
     # 1. 환경변수 우선
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
@@ -50,76 +79,338 @@ def find_project_root() -> Optional[Path]:
     # 2. 현재 디렉토리부터 상위로 탐색
     current = Path.cwd()
     for parent in [current] + list(current.parents):
+        # 아래 두 조건 모두 .claude 디렉토리가 필요하므로 먼저 확인
+        if not (parent / ".claude").exists():
+            continue
+
         # pyproject.toml 체크
-        pyproject = parent / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text(encoding='utf-8')
-                if 'example_project' in content.lower() or 'example_project' in content:
-                    # .claude 디렉토리가 있는지 확인
-                    if (parent / ".claude").exists():
-                        return parent
-            except Exception:
-                pass
-
-        # .git 디렉토리가 있고 .claude 디렉토리가 있는 경우
-        if (parent / ".git").exists() and (parent / ".claude").exists():
+        try:
+            data = (parent / "pyproject.toml").read_bytes()
+        except OSError:
+            data = b''
+        if b'example_project' in data.lower():
+            return parent
+
+        # .git 디렉토리가 있는 경우
+        if (parent / ".git").exists():
             return parent
 
     return None
 
 
-def parse_transcript_jsonl(transcript_path: Path) -> Dict[str, Any]:
-    """jsonl 파일 파싱하여 구조화된 데이터 반환"""
-    messages = []
-    file_history = {'snapshots': [], 'tracked_files': {}}
+def iter_jsonl_lines(f, include_tail: bool = True) -> Iterator[bytes]:
+    """
+    바이너리 파일 객체에서 원시 라인 단위로 반환
+
+    텍스트 모드 라인 순회 대신 큰 청크로 읽고 b'\\n' 기준으로 분리하여
+    디코딩은 각 JSON 라인 파싱 시점으로 미룸
+
+    Args:
+        f: 바이너리 모드로 연 파일 객체
+        include_tail: 개행으로 끝나지 않는 마지막 줄도 반환할지 여부
+    """
+    buf = bytearray()
+    while True:
+        chunk = f.read(TRANSCRIPT_READ_CHUNK)
+        if not chunk:
+            break
+        buf.extend(chunk)
+
+        start = 0
+        while True:
+            newline = buf.find(b'\n', start)
+            if newline == -1:
+                break
+            yield bytes(buf[start:newline])
+            start = newline + 1
+        del buf[:start]
+
+    # 마지막 줄에 개행이 없는 경우
+    if buf and include_tail:
+        yield bytes(buf)
+
+
+def iter_transcript_lines(f, start: int = 0) -> Iterator[bytes]:
+    """
+    지정한 바이트 오프셋부터 개행으로 끝나는 transcript 라인 반환
 
+    파일을 mmap으로 매핑하여 개행 위치를 직접 탐색하므로 추가 복사 없이
+    커널이 필요한 페이지만 읽어옴. 매핑할 수 없는 경우(빈 파일, 파이프)는
+    청크 단위 리더로 폴백
+    """
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                entry_type = entry.get('type')
-
-                if entry_type == 'user':
-                    msg = entry.get('message', {})
-                    messages.append({
-                        'uuid': entry.get('uuid'),
-                        'type': 'user',
-                        'timestamp': entry.get('timestamp'),
-                        'content': msg.get('content', ''),
-                        'metadata': {
-                            'cwd': entry.get('cwd'),
-                            'git_branch': entry.get('git_branch'),
-                            'is_sidechain': entry.get('isSidechain', False)
-                        }
-                    })
-
-                elif entry_type == 'assistant':
-                    msg = entry.get('message', {})
-                    messages.append({
-                        'uuid': entry.get('uuid'),
-                        'type': 'assistant',
-                        'timestamp': entry.get('timestamp'),
-                        'content': msg.get('content', []),
-                        'model': msg.get('model'),
-                        'usage': msg.get('usage', {}),
-                        'stop_reason': msg.get('stop_reason')
-                    })
-
-                elif entry_type == 'file-history-snapshot':
-                    snapshot = entry.get('snapshot', {})
-                    file_history['snapshots'].append({
-                        'message_id': snapshot.get('messageId'),
-                        'timestamp': snapshot.get('timestamp'),
-                        'tracked_files': snapshot.get('trackedFileBackups', {})
-                    })
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        f.seek(start)
+        yield from iter_jsonl_lines(f, include_tail=False)
+        return
+
+    with mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        pos = start
+        while True:
+            newline = mm.find(b'\n', pos)
+            if newline == -1:
+                break
+            yield mm[pos:newline]
+            pos = newline + 1
+
+
+def new_message_counters() -> Dict[str, Any]:
+    """대화 통계용 누적 카운터 생성"""
+    return {
+        'total_messages': 0,
+        'user_messages': 0,
+        'assistant_messages': 0,
+        'total_tokens': 0,
+        'file_snapshots': 0,
+        'first_timestamp': None,
+        'last_timestamp': None,
+    }
+
+
+def count_message(counters: Dict[str, Any], msg: Dict[str, Any]) -> None:
+    """파싱된 메시지 하나를 누적 카운터에 반영"""
+    counters['total_messages'] += 1
+    msg_type = msg.get('type')
+    if msg_type == 'user':
+        counters['user_messages'] += 1
+    elif msg_type == 'assistant':
+        counters['assistant_messages'] += 1
+        usage = msg.get('usage', {})
+        counters['total_tokens'] += (
+            usage.get('input_tokens', 0)
+            + usage.get('output_tokens', 0)
+            + usage.get('cache_read_input_tokens', 0)
+        )
+
+    timestamp = msg.get('timestamp', '')
+    if counters['total_messages'] == 1:
+        counters['first_timestamp'] = timestamp
+    counters['last_timestamp'] = timestamp
+
+
+def new_transcript_state(keep_recent: Optional[int] = None) -> Dict[str, Any]:
+    """빈 파싱 상태 생성 (메시지, 파일 히스토리, 카운터)"""
+    return {
+        'messages': deque(maxlen=keep_recent) if keep_recent else [],
+        'file_history': {'snapshots': [], 'tracked_files': {}},
+        'counters': new_message_counters(),
+    }
+
+
+def _handle_user(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """user 메시지 항목 추가"""
+    msg = entry.get('message', {})
+    message = {
+        'uuid': entry.get('uuid'),
+        'type': 'user',
+        'timestamp': entry.get('timestamp'),
+        'content': msg.get('content', ''),
+        'metadata': {
+            'cwd': entry.get('cwd'),
+            'git_branch': entry.get('git_branch'),
+            'is_sidechain': entry.get('isSidechain', False)
+        }
+    }
+    state['messages'].append(message)
+    count_message(state['counters'], message)
+
+
+def _handle_assistant(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """assistant 메시지 항목 추가"""
+    msg = entry.get('message', {})
+    message = {
+        'uuid': entry.get('uuid'),
+        'type': 'assistant',
+        'timestamp': entry.get('timestamp'),
+        'content': msg.get('content', []),
+        'model': msg.get('model'),
+        'usage': msg.get('usage', {}),
+        'stop_reason': msg.get('stop_reason')
+    }
+    state['messages'].append(message)
+    count_message(state['counters'], message)
+
+
+def _handle_snapshot(entry: Dict[str, Any], state: Dict[str, Any], keep_recent: Optional[int]) -> None:
+    """파일 히스토리 스냅샷 집계 (최근 메시지만 유지할 때는 저장 생략)"""
+    state['counters']['file_snapshots'] += 1
+    if keep_recent:
+        return
+    snapshot = entry.get('snapshot', {})
+    state['file_history']['snapshots'].append({
+        'message_id': snapshot.get('messageId'),
+        'timestamp': snapshot.get('timestamp'),
+        'tracked_files': snapshot.get('trackedFileBackups', {})
+    })
+
+
+# Transcript 항목 type -> 핸들러
+_DISPATCH = {
+    'user': _handle_user,
+    'assistant': _handle_assistant,
+    'file-history-snapshot': _handle_snapshot,
+}
+
+
+def parse_transcript_line(line: bytes, state: Dict[str, Any], keep_recent: Optional[int] = None) -> None:
+    """jsonl 한 줄을 파싱하여 파싱 상태에 반영"""
+    if not line.strip():
+        return
+
+    try:
+        entry = fastjson.loads(line)
+    except (fastjson.JSONDecodeError, UnicodeDecodeError):
+        return
+
+    handler = _DISPATCH.get(entry.get('type'))
+    if handler:
+        handler(entry, state, keep_recent)
+
+
+def get_transcript_cache_file(transcript_path: Path) -> Path:
+    """transcript 파싱 캐시 파일 경로 반환"""
+    project_root = find_project_root()
+    if project_root:
+        cache_dir = project_root / ".claude" / "cache"
+    else:
+        cache_dir = Path(".claude/cache")
+
+    key = hashlib.sha1(str(transcript_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir / f"transcript-{key}.json"
+
+
+def transcript_boundary_digest(f, offset: int) -> str:
+    """offset 직전 바이트의 해시 (이미 파싱한 앞부분이 제자리에서 바뀌었는지 확인)"""
+    start = max(0, offset - TRANSCRIPT_CACHE_CHECK_BYTES)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+def load_transcript_cache(
+    cache_file: Path,
+    transcript_path: Path,
+    transcript_stat: os.stat_result,
+    keep_recent: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """
+    transcript의 유효한 앞부분에 해당하는 캐시된 파싱 상태 로드
+
+    transcript가 교체되었거나(inode 변경), 캐시된 크기보다 짧아졌거나,
+    다른 keep_recent로 파싱된 경우 캐시를 사용하지 않음. 크기가 같으면
+    mtime도 같아야 하고, 커졌으면 캐시 오프셋 직전 바이트가 그대로여야 함
+    """
+    try:
+        cached = fastjson.load_file(cache_file)
+
+        valid = (
+            cached['version'] == TRANSCRIPT_CACHE_VERSION
+            and cached['keep_recent'] == keep_recent
+            and cached['inode'] == transcript_stat.st_ino
+            and cached['offset'] <= cached['size'] <= transcript_stat.st_size
+        )
+        if valid and cached['size'] == transcript_stat.st_size:
+            valid = cached['mtime_ns'] == transcript_stat.st_mtime_ns
+        elif valid:
+            with open(transcript_path, 'rb') as f:
+                valid = transcript_boundary_digest(f, cached['offset']) == cached['boundary_digest']
+        if not valid:
+            return None
+
+        # JSON에는 deque가 없으므로 길이 제한 메시지 버퍼 복원
+        if keep_recent:
+            state = cached['state']
+            state['messages'] = deque(state['messages'], maxlen=keep_recent)
+    except Exception:
+        return None
+
+    return cached
+
+
+def save_transcript_cache(cache_file: Path, cached: Dict[str, Any]) -> None:
+    """파싱 상태를 JSON으로 저장 및 최근 캐시 파일만 유지"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        state = cached['state']
+        data = fastjson.dumps({**cached, 'state': {**state, 'messages': list(state['messages'])}})
+        tmp_file = cache_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+
+        cache_files = sorted(
+            cache_file.parent.glob('transcript-*.json'),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True
+        )
+        for old_file in cache_files[TRANSCRIPT_CACHE_MAX_FILES:]:
+            old_file.unlink(missing_ok=True)
+    except Exception as e:
+        console.print(f"[yellow]WARNING: Transcript 캐시 저장 실패: {e}[/]")
+
+
+def parse_transcript_jsonl(
+    transcript_path: Path,
+    keep_recent: Optional[int] = None,
+    use_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    jsonl 파일 파싱하여 구조화된 데이터 반환
+
+    Args:
+        transcript_path: Transcript jsonl 경로
+        keep_recent: 최근 N개 메시지만 보존 (None이면 전체 보존).
+            오래된 메시지와 파일 히스토리 스냅샷은 생성하지 않으며,
+            통계는 전체 transcript 기준으로 집계됨
+        use_cache: 이전 실행에서 캐시된 바이트 오프셋부터 이어서
+            새로 추가된 줄만 파싱
+    """
+    state = new_transcript_state(keep_recent)
+
+    try:
+        transcript_stat = transcript_path.stat()
+
+        cache_file = None
+        cached = None
+        offset = 0
+        if use_cache:
+            cache_file = get_transcript_cache_file(transcript_path)
+            cached = load_transcript_cache(cache_file, transcript_path, transcript_stat, keep_recent)
+            if cached:
+                state = cached['state']
+                offset = cached['offset']
+
+        with open(transcript_path, 'rb') as f:
+            for line in iter_transcript_lines(f, offset):
+                offset += len(line) + 1
+                parse_transcript_line(line, state, keep_recent)
+
+            # 개행 없는 마지막 줄은 아직 기록 중일 수 있으므로
+            # 캐시 오프셋은 진행하지 않고 파싱만 수행
+            f.seek(offset)
+            tail = f.read()
+
+            save_cache = cache_file is not None and (cached is None or cached['offset'] != offset)
+            if save_cache:
+                end_stat = os.fstat(f.fileno())
+                boundary_digest = transcript_boundary_digest(f, offset)
+
+        if save_cache:
+            save_transcript_cache(cache_file, {
+                'version': TRANSCRIPT_CACHE_VERSION,
+                'transcript_path': str(transcript_path),
+                'keep_recent': keep_recent,
+                'inode': transcript_stat.st_ino,
+                'size': end_stat.st_size,
+                'mtime_ns': end_stat.st_mtime_ns,
+                'offset': offset,
+                'boundary_digest': boundary_digest,
+                'state': state,
+            })
+
+        parse_transcript_line(tail, state, keep_recent)
 
     except FileNotFoundError:
         console.print(f"[yellow]WARNING: Transcript 파일을 찾을 수 없습니다: {transcript_path}[/]")
@@ -127,29 +418,25 @@ def parse_transcript_jsonl(transcript_path: Path) -> Dict[str, Any]:
         console.print(f"[yellow]WARNING: Transcript 파싱 중 오류: {e}[/]")
 
     return {
-        'messages': messages,
-        'file_history': file_history
+        'messages': list(state['messages']),
+        'file_history': state['file_history'],
+        'counters': state['counters']
     }
 
 
 def calculate_statistics(conversation_data: Dict[str, Any]) -> Dict[str, Any]:
     """대화 통계 계산"""
-    messages = conversation_data.get('messages', [])
-
-    user_messages = [m for m in messages if m.get('type') == 'user']
-    assistant_messages = [m for m in messages if m.get('type') == 'assistant']
-
-    total_tokens = 0
-    for msg in assistant_messages:
-        usage = msg.get('usage', {})
-        total_tokens += usage.get('input_tokens', 0)
-        total_tokens += usage.get('output_tokens', 0)
-        total_tokens += usage.get('cache_read_input_tokens', 0)
+    counters = conversation_data.get('counters')
+    if counters is None:
+        counters = new_message_counters()
+        for msg in conversation_data.get('messages', []):
+            count_message(counters, msg)
+        counters['file_snapshots'] = len(conversation_data.get('file_history', {}).get('snapshots', []))
 
     # 대화 시간 계산
-    if messages:
-        first_ts = messages[0].get('timestamp', '')
-        last_ts = messages[-1].get('timestamp', '')
+    if counters['total_messages']:
+        first_ts = counters['first_timestamp']
+        last_ts = counters['last_timestamp']
         try:
             first_dt = datetime.fromisoformat(first_ts.replace('Z', '+00:00'))
             last_dt = datetime.fromisoformat(last_ts.replace('Z', '+00:00'))
@@ -160,47 +447,52 @@ def calculate_statistics(conversation_data: Dict[str, Any]) -> Dict[str, Any]:
         duration_seconds = 0
 
     return {
-        'total_messages': len(messages),
-        'user_messages': len(user_messages),
-        'assistant_messages': len(assistant_messages),
-        'total_tokens': total_tokens,
+        'total_messages': counters['total_messages'],
+        'user_messages': counters['user_messages'],
+        'assistant_messages': counters['assistant_messages'],
+        'total_tokens': counters['total_tokens'],
         'conversation_duration_seconds': int(duration_seconds),
-        'file_snapshots': len(conversation_data.get('file_history', {}).get('snapshots', []))
+        'file_snapshots': counters['file_snapshots']
     }
 
 
-def backup_conversation(
+def get_backup_location(backup_config: Dict[str, Any]) -> Path:
+    """백업 디렉토리 경로 계산 및 생성"""
+    # 프로젝트 루트 기준 백업 경로 사용
+    project_root = find_project_root()
+    if project_root:
+        backup_location = project_root / ".claude" / "backups"
+    else:
+        backup_location = Path(backup_config['backup_location'])
+
+    backup_location.mkdir(parents=True, exist_ok=True)
+    return backup_location
+
+
+def prepare_backup(
     conversation: str,
     config: Dict[str, Any]
 ) -> tuple[Optional[Path], Optional[Dict[str, Any]]]:
     """
-    대화 내용 완전 백업 (jsonl 파싱 포함)
+    세션 메타데이터와 transcript를 파싱하여 백업 데이터 생성 (파일 기록 없음)
 
     Returns:
-        (backup_file, backup_data) 튜플
+        (backup_file, backup_data) 튜플. backup_file은 stdin이 JSON이 아니어서
+        원문 텍스트를 그대로 백업한 경우에만 설정
     """
     backup_config = config['backup']
 
     if not backup_config['enabled']:
         return None, None
 
-    # 프로젝트 루트 기준 백업 경로 사용
-    project_root = find_project_root()
-    if project_root:
-        backup_location = project_root / ".claude" / "backups"
-    else:
-        backup_location = Path(backup_config['backup_location'])
-
-    backup_location.mkdir(parents=True, exist_ok=True)
-
     # stdin JSON 파싱
     try:
-        session_meta = json.loads(conversation)
-    except json.JSONDecodeError:
+        session_meta = fastjson.loads(conversation)
+    except fastjson.JSONDecodeError:
         console.print("[yellow]WARNING: 세션 메타데이터 파싱 실패, 텍스트로 백업합니다.[/]")
         # 기존 방식으로 폴백
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_file = backup_location / f"conversation_{timestamp}.txt"
+        backup_file = get_backup_location(backup_config) / f"conversation_{timestamp}.txt"
         with open(backup_file, 'w', encoding='utf-8') as f:
             f.write(conversation)
         return backup_file, None
@@ -212,7 +504,14 @@ def backup_conversation(
         console.print(f"[yellow]WARNING: Transcript 파일이 존재하지 않습니다: {transcript_path}[/]")
         conversation_data = {'messages': [], 'file_history': {}}
     else:
-        conversation_data = parse_transcript_jsonl(transcript_path)
+        keep_recent = None
+        if not backup_config.get('keep_full_conversation', True):
+            keep_recent = config['compact_strategy'].get('keep_recent_messages', 10)
+        conversation_data = parse_transcript_jsonl(
+            transcript_path,
+            keep_recent=keep_recent,
+            use_cache=backup_config.get('transcript_cache', True)
+        )
 
     # 완전한 백업 구조 생성
     backup_data = {
@@ -231,20 +530,48 @@ def backup_conversation(
         'statistics': calculate_statistics(conversation_data)
     }
 
+    return None, backup_data
+
+
+def backup_conversation(backup_data: Dict[str, Any], config: Dict[str, Any]) -> Path:
+    """
+    파싱된 백업 데이터를 백업 디렉토리에 기록
+
+    Returns:
+        기록된 백업 파일 경로
+    """
+    backup_config = config['backup']
+    backup_location = get_backup_location(backup_config)
+
     # JSON으로 저장
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    created_at = datetime.fromisoformat(backup_data['backup_metadata']['timestamp'])
+    timestamp = created_at.strftime('%Y%m%d_%H%M%S')
 
     # 압축 옵션 확인
     use_compression = backup_config['compress']
 
-    if use_compression:
+    zstd = None
+    if use_compression and backup_config.get('compress_format', 'gzip') == 'zstd':
+        try:
+            import zstandard as zstd
+        except ImportError:
+            console.print("[yellow]WARNING: zstandard 패키지가 설치되어 있지 않습니다 - gzip으로 폴백합니다[/]")
+
+    if zstd is not None:
+        backup_file = backup_location / f"conversation_{timestamp}.json.zst"
+        compressor = zstd.ZstdCompressor(level=backup_config.get('zstd_level', 3), threads=-1)
+        with open(backup_file, 'wb') as raw, compressor.stream_writer(raw) as writer:
+            writer.write(fastjson.dumps(backup_data))
+    elif use_compression:
         backup_file = backup_location / f"conversation_{timestamp}.json.gz"
-        with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)  # type: ignore[arg-type]
+        compress_level = backup_config.get('compress_level', 1)
+        with open(backup_file, 'wb') as raw, \
+                gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=compress_level) as gz:
+            gz.write(fastjson.dumps(backup_data))
     else:
         backup_file = backup_location / f"conversation_{timestamp}.json"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)
+        with open(backup_file, 'wb') as f:
+            f.write(fastjson.dumps(backup_data, indent=True))
 
     console.print(f"[green]OK[/] 백업 생성: {backup_file}")
     console.print(f"   메시지: {backup_data['statistics']['total_messages']}개")
@@ -255,18 +582,24 @@ def backup_conversation(
     max_backups = backup_config['max_backups']
     cleanup_old_backups(backup_location, max_backups)
 
-    return backup_file, backup_data
+    return backup_file
 
 
 def cleanup_old_backups(backup_dir: Path, max_backups: int) -> None:
     """오래된 백업 파일 정리"""
-    # JSON과 압축 파일 모두 찾기
-    backups = sorted(backup_dir.glob('conversation_*.*'))
+    # JSON과 압축 파일 모두 찾기 (파일명에 %Y%m%d_%H%M%S 포함 → 이름순이 시간순)
+    with os.scandir(backup_dir) as it:
+        backups = [
+            entry for entry in it
+            if entry.name.startswith('conversation_') and '.' in entry.name and entry.is_file()
+        ]
 
-    if len(backups) > max_backups:
-        for backup in backups[:-max_backups]:
-            backup.unlink()
-            console.print(f"삭제: {backup.name}")
+    if len(backups) <= max_backups:
+        return
+
+    for backup in heapq.nsmallest(len(backups) - max_backups, backups, key=lambda e: e.name):
+        os.unlink(backup.path)
+        console.print(f"삭제: {backup.name}")
 
 
 def clean_backup_for_summary(backup_data: Dict[str, Any], keep_recent: int = 10) -> Dict[str, Any]:
@@ -305,7 +638,9 @@ def clean_backup_for_summary(backup_data: Dict[str, Any], keep_recent: int = 10)
 
 def format_conversation_for_claude(messages: List[Dict[str, Any]]) -> str:
     """Claude CLI에 전달할 대화 내용 포맷팅"""
-    formatted = []
+    out: List[str] = []
+    append = out.append
+    dumps = fastjson.dumps
 
     for msg in messages:
         msg_type = msg.get('type')
@@ -313,30 +648,88 @@ def format_conversation_for_claude(messages: List[Dict[str, Any]]) -> str:
 
         if msg_type == 'user':
             content = msg.get('content', '')
-            if isinstance(content, str) and content.strip():
-                formatted.append(f"[User - {timestamp}]\n{content}\n")
+            if type(content) is str and content.strip():
+                if out:
+                    append('\n---\n')
+                append(f"[User - {timestamp}]\n{content}\n")
 
         elif msg_type == 'assistant':
             content = msg.get('content', [])
-            text_parts = []
-
-            if isinstance(content, str):
-                text_parts.append(content)
-            elif isinstance(content, list):
+            block_start = len(out)
+            if out:
+                append('\n---\n')
+            append(f"[Assistant - {timestamp}]\n")
+            body_start = len(out)
+
+            if type(content) is str:
+                append(content)
+            elif type(content) is list:
                 for item in content:
-                    if isinstance(item, dict):
-                        if item.get('type') == 'text':
-                            text_parts.append(item.get('text', ''))
-                        elif item.get('type') == 'tool_use':
-                            tool_name = item.get('name', '')
-                            tool_input = item.get('input', {})
-                            text_parts.append(f"[Tool: {tool_name}]\n{tool_input}")
+                    if type(item) is not dict:
+                        continue
+                    item_type = item.get('type')
+                    if item_type == 'text':
+                        if len(out) > body_start:
+                            append('\n')
+                        append(item.get('text', ''))
+                    elif item_type == 'tool_use':
+                        if len(out) > body_start:
+                            append('\n')
+                        append(f"[Tool: {item.get('name', '')}]\n")
+                        append(dumps(item.get('input', {})).decode('utf-8'))
+
+            if len(out) == body_start:
+                # 표시할 내용이 없는 메시지는 제거
+                del out[block_start:]
+            else:
+                append('\n')
+
+    return ''.join(out)
+
+
+def _extract_assistant_text(item: Dict[str, Any]) -> str:
+    """Claude CLI 출력의 assistant 항목에서 첫 텍스트 블록 반환"""
+    content = item.get('message', {}).get('content', [])
+    if isinstance(content, list):
+        for content_item in content:
+            if isinstance(content_item, dict) and content_item.get('type') == 'text':
+                return content_item.get('text', '')
+    return ''
+
+
+# Claude CLI 요약 프롬프트 (format_map으로 채움)
+_PROMPT_TMPL = """다음 개발 세션을 **5000자 이내로 간결하게** 요약해주세요.
+
+## 세션 정보
+[{focus_areas}] | 세션: {session_id}... | 브랜치: {branch} | 메시지: {total_messages}개 | 시간: {duration_min}분
 
-            if text_parts:
-                text = '\n'.join(text_parts)
-                formatted.append(f"[Assistant - {timestamp}]\n{text}\n")
+## 요약 규칙 (중요!)
+1. **5000자 이내 필수** - 불렛포인트 위주, 간결하게
+2. 핵심만: 작업 목적 → 주요 변경 → 결정사항 → 미완료
+3. 코드는 파일명:라인만 (코드 블록 최소화)
+4. 불필요한 설명, 반복, 배경 제거
+
+## 요약 형식
+# 이전 세션 요약 (작업 디렉토리: {cwd})
+
+## 작업 목적
+[1-2줄로 핵심 목표]
+
+## 주요 변경사항
+- 파일명:라인 - [변경 내용 1줄]
 
-    return '\n---\n'.join(formatted)
+## 주요 결정
+- [결정사항 1줄]
+
+## 미완료/다음 단계
+- [TODO 항목]
+
+---
+
+## 대화 내용
+{conversation_text}
+
+위 대화의 핵심만 추출하여 5000자 이내로 요약하세요. 불필요한 설명은 제거하고 작업 컨텍스트 복구에 필요한 정보만 남기세요."""
 
 
 def generate_claude_cli_summary(
@@ -376,48 +769,20 @@ def generate_claude_cli_summary(
     conversation_text = format_conversation_for_claude(messages)
 
     # Claude CLI에 전달할 프롬프트 생성
-    prompt = f"""다음 개발 세션을 **5000자 이내로 간결하게** 요약해주세요.
-
-## 세션 정보
-[{focus_areas}] | 세션: {metadata.get('session_id', 'N/A')[:8]}... | 브랜치: {metadata.get('git_branch', 'N/A')} | 메시지: {statistics.get('total_messages', 0)}개 | 시간: {statistics.get('conversation_duration_seconds', 0)//60}분
-
-## 요약 규칙 (중요!)
-1. **5000자 이내 필수** - 불렛포인트 위주, 간결하게
-2. 핵심만: 작업 목적 → 주요 변경 → 결정사항 → 미완료
-3. 코드는 파일명:라인만 (코드 블록 최소화)
-4. 불필요한 설명, 반복, 배경 제거
-
-## 요약 형식
-# 이전 세션 요약 (작업 디렉토리: {metadata.get('cwd', 'N/A')})
-
-## 작업 목적
-[1-2줄로 핵심 목표]
-
-## 주요 변경사항
-- 파일명:라인 - [변경 내용 1줄]
-
-## 주요 결정
-- [결정사항 1줄]
-
-## 미완료/다음 단계
-- [TODO 항목]
-
----
-
-## 대화 내용
-{conversation_text}
-
-위 대화의 핵심만 추출하여 5000자 이내로 요약하세요. 불필요한 설명은 제거하고 작업 컨텍스트 복구에 필요한 정보만 남기세요."""
+    prompt = _PROMPT_TMPL.format_map({
+        'focus_areas': focus_areas,
+        'session_id': metadata.get('session_id', 'N/A')[:8],
+        'branch': metadata.get('git_branch', 'N/A'),
+        'total_messages': statistics.get('total_messages', 0),
+        'duration_min': statistics.get('conversation_duration_seconds', 0) // 60,
+        'cwd': metadata.get('cwd', 'N/A'),
+        'conversation_text': conversation_text
+    })
 
     try:
         # Claude CLI 실행 (Haiku 4.5 모델 사용)
         console.print("[cyan]AI[/] Claude Haiku 4.5로 빠른 요약 생성 중...")
 
-        # 임시 파일에 프롬프트 저장
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-            f.write(prompt)
-            temp_file = f.name
-
         # Claude CLI 실행 (print mode with JSON output)
         # MCP 서버 비활성화를 위해 빈 설정 파일과 strict 모드 사용
         # Haiku 4.5 모델로 속도 2배 향상, 비용 1/3 절감
@@ -432,18 +797,14 @@ def generate_claude_cli_summary(
             '--output-format', 'json'
         ]
 
-        # 프롬프트를 stdin으로 전달
-        with open(temp_file, 'r', encoding='utf-8') as prompt_file:
-            result = subprocess.run(
-                cmd,
-                stdin=prompt_file,
-                capture_output=True,
-                text=True,
-                timeout=180  # 3분 타임아웃으로 단축
-            )
-
-        # 임시 파일 삭제
-        Path(temp_file).unlink(missing_ok=True)
+        # 프롬프트를 stdin 파이프로 직접 전달 (임시 파일 미사용)
+        result = subprocess.run(
+            cmd,
+            input=prompt,
+            capture_output=True,
+            text=True,
+            timeout=180  # 3분 타임아웃으로 단축
+        )
 
         if result.returncode != 0:
             console.print(f"[yellow]WARNING: Claude CLI 실행 실패 (exit code: {result.returncode})[/]")
@@ -453,29 +814,21 @@ def generate_claude_cli_summary(
 
         # JSON 출력 파싱
         try:
-            output_data = json.loads(result.stdout)
+            output_data = fastjson.loads(result.stdout)
             # Claude CLI 응답 추출
             summary = ""
 
             if isinstance(output_data, list):
-                # 배열에서 type='result'인 항목 찾기
+                # 한 번만 순회: 첫 result 항목 우선, 없으면 첫 assistant 메시지 텍스트
+                fallback = None
                 for item in output_data:
-                    if isinstance(item, dict) and item.get('type') == 'result':
+                    item_type = item.get('type') if type(item) is dict else None
+                    if item_type == 'result':
                         summary = item.get('result', '')
                         break
-
-                # result 타입이 없으면 assistant 메시지에서 추출
-                if not summary:
-                    for item in output_data:
-                        if isinstance(item, dict) and item.get('type') == 'assistant':
-                            message = item.get('message', {})
-                            content = message.get('content', [])
-                            if isinstance(content, list):
-                                for content_item in content:
-                                    if isinstance(content_item, dict) and content_item.get('type') == 'text':
-                                        summary = content_item.get('text', '')
-                                        break
-                            break
+                    elif item_type == 'assistant' and fallback is None:
+                        fallback = _extract_assistant_text(item)
+                summary = summary or fallback or ''
             elif isinstance(output_data, dict):
                 # 폴백: 단일 객체인 경우
                 summary = output_data.get('result', '')
@@ -499,7 +852,7 @@ def generate_claude_cli_summary(
                 console.print(f"   output_data preview: {str(output_data)[:500]}")
                 return None
 
-        except json.JSONDecodeError:
+        except fastjson.JSONDecodeError:
             # JSON 파싱 실패 시 stdout을 그대로 사용
             if result.stdout.strip():
                 console.print("[green]OK[/] Claude CLI 요약 생성 완료 (text mode)")
@@ -508,7 +861,6 @@ def generate_claude_cli_summary(
 
     except subprocess.TimeoutExpired:
         console.print("[yellow]WARNING: Claude CLI 실행 타임아웃[/]")
-        Path(temp_file).unlink(missing_ok=True)
         return None
     except FileNotFoundError:
         console.print("[yellow]WARNING: Claude CLI를 찾을 수 없습니다. 'claude' 명령어가 PATH에 있는지 확인하세요.[/]")
@@ -520,57 +872,70 @@ def generate_claude_cli_summary(
         return None
 
 
-def save_to_chromadb_direct(
-    summary: str,
-    backup_data: Dict[str, Any],
-    config: Dict[str, Any]
+def save_to_chromadb_client(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    chromadb_config: Dict[str, Any]
 ) -> tuple[bool, Optional[str]]:
     """
-    MCP를 통한 ChromaDB 저장
+    Python HTTP 클라이언트를 통한 ChromaDB 저장
 
-    claude CLI를 subprocess로 호출하여 MCP chromadb 서버를 통해 저장
-    Python 클라이언트 직접 접근보다 안정적이고 빠름
+    결정적인 도구 호출을 위해 Claude CLI 세션을 띄우지 않고
+    배치 단위 collection.add() 호출로 문서를 추가
 
     Args:
-        summary: 요약 내용
-        backup_data: 백업 데이터
-        config: 설정
+        ids: 문서 ID 목록
+        documents: 문서 목록
+        metadatas: documents와 같은 순서의 문서 메타데이터 목록
+        chromadb_config: chromadb_integration 설정
 
     Returns:
-        (성공 여부, 오류 메시지) 튜플. 성공 시 (True, None), 실패 시 (False, "오류 상세")
+        (성공 여부, 오류 메시지) 튜플
     """
-    metadata = backup_data.get('backup_metadata', {})
-    statistics = backup_data.get('statistics', {})
+    try:
+        client = get_client(chromadb_config)
+        collection = get_collection(chromadb_config)
+        batch_size = min(client.get_max_batch_size(), CHROMADB_MAX_BATCH_SIZE)
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            collection.add(
+                ids=ids[start:end],
+                documents=documents[start:end],
+                # ChromaDB는 None 메타데이터 값을 허용하지 않음
+                metadatas=[
+                    {k: v for k, v in meta.items() if v is not None}
+                    for meta in metadatas[start:end]
+                ]
+            )
+        return True, None
+    except ImportError:
+        return False, "chromadb 패키지가 설치되어 있지 않습니다"
+    except Exception as e:
+        return False, f"ChromaDB 클라이언트 오류: {e}"
 
-    doc_id = f"context_compact_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    # Get metadata template from chromadb_integration config
-    chromadb_config = config['chromadb_integration']
-    collection_name = chromadb_config['collection']
-    metadata_template = chromadb_config['metadata_template']
+def save_to_chromadb_mcp(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    collection_name: str
+) -> tuple[bool, Optional[str]]:
+    """
+    MCP를 통한 ChromaDB 저장
 
-    # Build doc_metadata from template, filling in dynamic values
-    doc_metadata = {
-        "project": metadata_template.get('project', 'example_project'),
-        "subproject": metadata_template.get('subproject', 'core'),
-        "type": metadata_template.get('type', 'context_compact'),
-        "date": datetime.now().strftime('%Y-%m-%d'),
-        "summary": f"컨텍스트 압축 - {statistics.get('total_messages', 0)}개 메시지",
-        "tags": metadata_template.get('tags', 'auto-compact, summary'),
-        "status": metadata_template.get('status', 'completed'),
-        # Additional dynamic fields
-        "original_message_count": statistics.get('total_messages', 0),
-        "total_tokens": statistics.get('total_tokens', 0),
-        "session_id": metadata.get('session_id', ''),
-        "git_branch": metadata.get('git_branch', '') or 'unknown',
-        "timestamp": metadata.get('timestamp', '')
-    }
+    claude CLI를 subprocess로 호출하여 MCP chromadb 서버를 통해 저장
 
-    try:
-        console.print(f"\n[cyan]SAVE[/] MCP를 통해 ChromaDB에 저장 중...")
-        console.print(f"   컬렉션: {collection_name}")
-        console.print(f"   문서 ID: {doc_id}")
+    Args:
+        ids: 문서 ID 목록
+        documents: 문서 목록
+        metadatas: documents와 같은 순서의 문서 메타데이터 목록
+        collection_name: 컬렉션 이름
 
+    Returns:
+        (성공 여부, 오류 메시지) 튜플
+    """
+    try:
         # MCP config 경로
         project_root = find_project_root()
         if not project_root:
@@ -583,9 +948,9 @@ def save_to_chromadb_direct(
         # JSON 데이터 준비
         mcp_request = {
             "collection_name": collection_name,
-            "documents": [summary],
-            "ids": [doc_id],
-            "metadatas": [doc_metadata]
+            "documents": documents,
+            "ids": ids,
+            "metadatas": metadatas
         }
 
         # claude CLI로 MCP 호출
@@ -597,7 +962,7 @@ def save_to_chromadb_direct(
             "--strict-mcp-config",
             "--dangerously-skip-permissions",
             "--output-format", "json",
-            f"chromadb에 문서를 추가하세요. chroma_add_documents 도구를 사용하세요: {json.dumps(mcp_request, ensure_ascii=False)}"
+            f"chromadb에 문서를 추가하세요. chroma_add_documents 도구를 사용하세요: {fastjson.dumps(mcp_request).decode('utf-8')}"
         ]
 
         result = subprocess.run(
@@ -613,17 +978,6 @@ def save_to_chromadb_direct(
             console.print(f"   [yellow]WARNING: {error_detail}[/]")
             return False, error_detail
 
-        # 성공 확인
-        try:
-            output = json.loads(result.stdout) if result.stdout else {}
-        except json.JSONDecodeError:
-            output = {"raw": result.stdout}
-
-        console.print(f"   [green]OK[/] ChromaDB 저장 완료!")
-        console.print(f"   메시지: {statistics.get('total_messages', 0)}개")
-        console.print(f"   토큰: {statistics.get('total_tokens', 0):,}")
-        console.print(f"   요약 길이: {len(summary)} 문자\n")
-
         return True, None
 
     except subprocess.TimeoutExpired:
@@ -637,6 +991,79 @@ def save_to_chromadb_direct(
         return False, error_detail
 
 
+def save_to_chromadb_direct(
+    summary: str,
+    backup_data: Dict[str, Any],
+    config: Dict[str, Any]
+) -> tuple[bool, Optional[str]]:
+    """
+    ChromaDB 저장
+
+    기본적으로 ChromaDB HTTP 클라이언트로 저장하며, `use_mcp_cli`가 설정되었거나
+    클라이언트를 사용할 수 없거나 요청이 실패하면 claude CLI + MCP 경로를 사용
+
+    Args:
+        summary: 요약 내용
+        backup_data: 백업 데이터
+        config: 설정
+
+    Returns:
+        (성공 여부, 오류 메시지) 튜플. 성공 시 (True, None), 실패 시 (False, "오류 상세")
+    """
+    metadata = backup_data.get('backup_metadata', {})
+    statistics = backup_data.get('statistics', {})
+
+    now = datetime.now()
+    doc_id = f"context_compact_{now.strftime('%Y%m%d_%H%M%S')}"
+
+    # Get metadata template from chromadb_integration config
+    chromadb_config = config['chromadb_integration']
+    collection_name = chromadb_config['collection']
+    metadata_template = chromadb_config['metadata_template']
+
+    # Build doc_metadata from template, filling in dynamic values
+    doc_metadata = {
+        "project": metadata_template.get('project', 'example_project'),
+        "subproject": metadata_template.get('subproject', 'core'),
+        "type": metadata_template.get('type', 'context_compact'),
+        "date": now.strftime('%Y-%m-%d'),
+        "summary": f"컨텍스트 압축 - {statistics.get('total_messages', 0)}개 메시지",
+        "tags": metadata_template.get('tags', 'auto-compact, summary'),
+        "status": metadata_template.get('status', 'completed'),
+        # Additional dynamic fields
+        "original_message_count": statistics.get('total_messages', 0),
+        "total_tokens": statistics.get('total_tokens', 0),
+        "session_id": metadata.get('session_id', ''),
+        "git_branch": metadata.get('git_branch', '') or 'unknown',
+        "timestamp": metadata.get('timestamp', '')
+    }
+
+    console.print(f"\n[cyan]SAVE[/] ChromaDB에 저장 중...")
+    console.print(f"   컬렉션: {collection_name}")
+    console.print(f"   문서 ID: {doc_id}")
+
+    ids, documents, metadatas = [doc_id], [summary], [doc_metadata]
+
+    if chromadb_config.get('use_mcp_cli', False):
+        success, error_detail = save_to_chromadb_mcp(ids, documents, metadatas, collection_name)
+    else:
+        success, error_detail = save_to_chromadb_client(ids, documents, metadatas, chromadb_config)
+        if not success:
+            console.print(f"   [yellow]WARNING: {error_detail} - MCP로 폴백합니다[/]")
+            success, error_detail = save_to_chromadb_mcp(ids, documents, metadatas, collection_name)
+
+    if not success:
+        return False, error_detail
+
+    # 성공 확인
+    console.print(f"   [green]OK[/] ChromaDB 저장 완료!")
+    console.print(f"   메시지: {statistics.get('total_messages', 0)}개")
+    console.print(f"   토큰: {statistics.get('total_tokens', 0):,}")
+    console.print(f"   요약 길이: {len(summary)} 문자\n")
+
+    return True, None
+
+
 def save_summary_to_chromadb(
     summary: str,
     backup_data: Dict[str, Any],
@@ -695,6 +1122,89 @@ def remove_pid_file() -> None:
         console.print(f"[yellow]⚠ PID 파일 삭제 실패: {e}[/yellow]")
 
 
+class StatusWriter:
+    """
+    compact-status.json 디바운스 및 원자적 기록
+
+    직전 기록 후 디바운스 구간 내에 들어온 업데이트는 메모리에 보관했다가
+    타이머로 기록하며, 단계(stage) 변경, 종료 상태(completed/error),
+    인터프리터 종료 시에는 즉시 기록하고 종료 상태는 fsync까지 수행. 임시 파일에 쓴 뒤 rename하여 PostToolUse 훅이
+    불완전한 JSON을 읽지 않도록 함
+    """
+
+    def __init__(self, debounce_seconds: float = STATUS_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self.base = {'pid': os.getpid()}
+        self.started_at: Optional[str] = None
+        self.status_file: Optional[Path] = None
+        self.pending: Optional[Dict[str, Any]] = None
+        self.written_stage: Optional[str] = None
+        self.last_write = 0.0
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _get_status_file(self) -> Path:
+        """상태 파일 경로를 한 번만 계산하고 디렉토리 생성"""
+        if self.status_file is None:
+            project_root = find_project_root()
+            if project_root:
+                status_file = project_root / ".claude" / "recovery" / "compact-status.json"
+            else:
+                status_file = Path(".claude/recovery/compact-status.json")
+            status_file.parent.mkdir(parents=True, exist_ok=True)
+            self.status_file = status_file
+        return self.status_file
+
+    def update(self, fields: Dict[str, Any]) -> None:
+        """상태 업데이트를 즉시 또는 디바운스 구간 이후에 기록"""
+        with self.lock:
+            self.pending = {**self.base, **fields}
+            remaining = self.debounce_seconds - (time.monotonic() - self.last_write)
+            urgent = (
+                fields.get('status') in ('completed', 'error')
+                or fields.get('stage') != self.written_stage
+            )
+            if not urgent and remaining > 0:
+                if self.timer is None:
+                    self.timer = threading.Timer(remaining, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 상태를 원자적 rename으로 기록"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            if self.pending is None:
+                return
+
+            try:
+                status_file = self._get_status_file()
+                tmp_file = status_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(fastjson.dumps(self.pending))
+                    # 종료 상태는 훅 종료 직후 크래시가 나도 남아 있어야 함
+                    if self.pending.get('status') in ('completed', 'error'):
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_file, status_file)
+                self.written_stage = self.pending.get('stage')
+            except Exception as e:
+                console.print(f"[yellow]⚠ 진행 상태 업데이트 실패: {e}[/yellow]")
+            finally:
+                self.pending = None
+                self.last_write = time.monotonic()
+
+
+_status_writer = StatusWriter()
+
+
 def update_progress_status(
     status: str,
     stage: str,
@@ -714,39 +1224,23 @@ def update_progress_status(
         error: Error message if status is error
         started_at: ISO timestamp when started (for first call)
     """
-    try:
-        project_root = find_project_root()
-        if project_root:
-            status_file = project_root / ".claude" / "recovery" / "compact-status.json"
-        else:
-            status_file = Path(".claude/recovery/compact-status.json")
-
-        status_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Load existing data to preserve started_at
-        existing_started_at = started_at
-        if status_file.exists() and not started_at:
-            try:
-                existing_data = json.loads(status_file.read_text(encoding='utf-8'))
-                existing_started_at = existing_data.get('started_at')
-            except Exception:
-                pass
-
-        status_data = {
-            'pid': os.getpid(),
-            'status': status,
-            'stage': stage,
-            'progress': progress,
-            'message': message,
-            'started_at': existing_started_at or datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
-            'completed_at': datetime.now().isoformat() if status == 'completed' else None,
-            'error': error
-        }
-
-        status_file.write_text(json.dumps(status_data, indent=2, ensure_ascii=False), encoding='utf-8')
-    except Exception as e:
-        console.print(f"[yellow]⚠ 진행 상태 업데이트 실패: {e}[/yellow]")
+    now = datetime.now().isoformat()
+    # 첫 호출의 started_at을 메모리에 유지
+    if started_at:
+        _status_writer.started_at = started_at
+    elif _status_writer.started_at is None:
+        _status_writer.started_at = now
+
+    _status_writer.update({
+        'status': status,
+        'stage': stage,
+        'progress': progress,
+        'message': message,
+        'started_at': _status_writer.started_at,
+        'updated_at': now,
+        'completed_at': now if status == 'completed' else None,
+        'error': error
+    })
 
 
 def save_compact_state(
@@ -789,8 +1283,8 @@ def save_compact_state(
             'conversation_duration': statistics.get('conversation_duration_seconds', 0)
         }
 
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    with open(recovery_file, 'wb') as f:
+        f.write(fastjson.dumps(state))
 
 
 def create_compact_marker(config: Dict[str, Any]) -> None:
@@ -812,14 +1306,16 @@ def create_compact_marker(config: Dict[str, Any]) -> None:
         'message': '자동 컨텍스트 압축이 발생했습니다. 대화를 요약하고 ChromaDB에 저장하세요.'
     }
 
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    with open(recovery_file, 'wb') as f:
+        f.write(fastjson.dumps(state))
 
 
 def main():
     """메인 함수"""
     # Sentry 초기화
     init_sentry('auto-compact', additional_tags={'hook_type': 'pre_compact'})
+    # 남은 Sentry 이벤트는 종료 시점에 전송 (정상 경로에서 대기하지 않음)
+    atexit.register(flush, timeout=1.0)
 
     # 로거 초기화
     logger = HookLogger("auto-compact")
@@ -827,12 +1323,12 @@ def main():
     try:
         logger.log_start()
 
-        add_breadcrumb("Hook execution started", category="lifecycle")
+        breadcrumb_buffer.record("Hook execution started", category="lifecycle")
 
         # PID 파일 생성 (백그라운드 프로세스 추적)
         pid_file = create_pid_file()
         if pid_file:
-            add_breadcrumb("PID file created", category="progress", data={"pid": os.getpid()})
+            breadcrumb_buffer.record("PID file created", category="progress", data={"pid": os.getpid()})
             logger.log_info("PID 파일 생성", pid=os.getpid(), pid_file=str(pid_file))
 
         # 초기 상태 업데이트
@@ -847,7 +1343,7 @@ def main():
 
         # 설정 로드
         config = load_auto_compact_config()
-        add_breadcrumb("Config loaded successfully", category="config", data={"collection": config['chromadb_integration']['collection']})
+        breadcrumb_buffer.record("Config loaded successfully", category="config", data={"collection": config['chromadb_integration']['collection']})
 
         update_progress_status(
             status="running",
@@ -860,15 +1356,21 @@ def main():
         # Non-blocking read with timeout - 실패해도 계속 진행
         conversation = ""
         try:
-            # 5초 타임아웃으로 stdin 대기
-            if select.select([sys.stdin], [], [], 5)[0]:
+            # stdin이 파이프/파일일 때만 읽기 (터미널이면 수동 실행이므로 대기하지 않음)
+            try:
+                stdin_mode = os.fstat(sys.stdin.fileno()).st_mode
+                piped = stat.S_ISFIFO(stdin_mode) or stat.S_ISSOCK(stdin_mode) or stat.S_ISREG(stdin_mode)
+            except OSError:
+                # 프로세스 내 호출(hooks.py auto-compact)이 넘긴 메모리 stdin
+                piped = True
+            if piped:
                 conversation = sys.stdin.read()
                 logger.log_info(
                     "stdin에서 대화 내용 읽기 성공",
                     content_length=len(conversation) if conversation else 0
                 )
             else:
-                warning_msg = "stdin 읽기 타임아웃 (5초) - 수동 압축이거나 stdin 전달 안됨"
+                warning_msg = "stdin이 파이프가 아님 - 수동 압축이거나 stdin 전달 안됨"
                 console.print(f"[yellow]WARNING: {warning_msg}[/]")
                 logger.log_error(warning_msg)
         except Exception as e:
@@ -886,12 +1388,41 @@ def main():
                 progress=20,
                 message="대화 내용 백업 중..."
             )
-            add_breadcrumb("Starting backup creation", category="backup", data={"size": len(conversation)})
+            breadcrumb_buffer.record("Starting backup creation", category="backup", data={"size": len(conversation)})
             # 대화 내용 백업 (조용히)
-            backup_file, backup_data = backup_conversation(conversation, config)
-            if backup_file:
-                stats = backup_data.get('statistics', {}) if backup_data else {}
-                add_breadcrumb("Backup created successfully", category="backup", data={
+            backup_file, backup_data = prepare_backup(conversation, config)
+        else:
+            warning_msg = "대화 내용이 전달되지 않음 - 수동 압축이거나 빈 대화"
+            breadcrumb_buffer.record(warning_msg, category="backup", level="warning")
+            logger.log_error(warning_msg)
+
+        # 압축 마커 생성
+        create_compact_marker(config)
+        breadcrumb_buffer.record("Compact marker created", category="marker")
+        logger.log_info("압축 마커 생성 완료")
+
+        # 요약 생성 (Claude CLI 사용, 조용히)
+        summary = ""
+        if backup_data:
+            # 요약에는 최근 메시지만 필요
+            keep_recent = config['compact_strategy'].get('keep_recent_messages', 10)
+            summary_input = clean_backup_for_summary(backup_data, keep_recent=keep_recent)
+
+            # 트랜스크립트 파싱 이후 백업 기록과 Claude CLI 요약은 서로 독립적이므로 병렬 실행
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                backup_future = executor.submit(backup_conversation, backup_data, config)
+                summary_future = executor.submit(generate_claude_cli_summary, summary_input, config)
+                breadcrumb_buffer.record("Starting summary generation", category="summary")
+
+                backup_file = backup_future.result()
+                # 이후에는 메타데이터와 통계만 사용하므로 Claude CLI 호출 동안
+                # 전체 대화 내용을 보관하지 않도록 해제
+                backup_data = {
+                    key: value for key, value in backup_data.items()
+                    if key not in ('conversation', 'file_history')
+                }
+                stats = backup_data.get('statistics', {})
+                breadcrumb_buffer.record("Backup created successfully", category="backup", data={
                     "file": str(backup_file),
                     "messages": stats.get('total_messages', 0),
                     "tokens": stats.get('total_tokens', 0)
@@ -908,30 +1439,17 @@ def main():
                     progress=40,
                     message=f"백업 완료 ({stats.get('total_messages', 0)}개 메시지)"
                 )
-        else:
-            warning_msg = "대화 내용이 전달되지 않음 - 수동 압축이거나 빈 대화"
-            add_breadcrumb(warning_msg, category="backup", level="warning")
-            logger.log_error(warning_msg)
-
-        # 압축 마커 생성
-        create_compact_marker(config)
-        add_breadcrumb("Compact marker created", category="marker")
-        logger.log_info("압축 마커 생성 완료")
+                update_progress_status(
+                    status="running",
+                    stage="summary",
+                    progress=50,
+                    message="Claude CLI로 요약 생성 중..."
+                )
 
-        # 요약 생성 (Claude CLI 사용, 조용히)
-        summary = ""
-        if backup_data:
-            update_progress_status(
-                status="running",
-                stage="summary",
-                progress=50,
-                message="Claude CLI로 요약 생성 중..."
-            )
-            add_breadcrumb("Starting summary generation", category="summary")
-            summary = generate_claude_cli_summary(backup_data, config)
+                summary = summary_future.result()
 
             if summary:
-                add_breadcrumb("Summary generated successfully", category="summary", data={"length": len(summary)})
+                breadcrumb_buffer.record("Summary generated successfully", category="summary", data={"length": len(summary)})
                 logger.log_info("요약 생성 완료", summary_length=len(summary))
                 update_progress_status(
                     status="running",
@@ -947,11 +1465,11 @@ def main():
                     progress=80,
                     message="ChromaDB에 저장 중..."
                 )
-                add_breadcrumb("Saving to ChromaDB", category="chromadb")
+                breadcrumb_buffer.record("Saving to ChromaDB", category="chromadb")
                 success, error_msg = save_summary_to_chromadb(summary, backup_data, config)
 
                 if success:
-                    add_breadcrumb("ChromaDB save successful", category="chromadb")
+                    breadcrumb_buffer.record("ChromaDB save successful", category="chromadb")
                     logger.log_info("ChromaDB 저장 완료")
                     update_progress_status(
                         status="running",
@@ -960,11 +1478,12 @@ def main():
                         message="ChromaDB 저장 완료"
                     )
                 else:
-                    add_breadcrumb("ChromaDB save failed", category="chromadb", level="error",
-                                 data={"error": error_msg})
+                    breadcrumb_buffer.record("ChromaDB save failed", category="chromadb", level="error",
+                                             data={"error": error_msg})
                     logger.log_error(f"ChromaDB 저장 실패: {error_msg}")
 
                     # Sentry에 상세 오류 보고
+                    breadcrumb_buffer.replay()
                     capture_exception(
                         Exception(f"ChromaDB save failed: {error_msg}"),
                         context={
@@ -975,7 +1494,7 @@ def main():
                         }
                     )
             else:
-                add_breadcrumb("Summary generation failed", category="summary", level="error")
+                breadcrumb_buffer.record("Summary generation failed", category="summary", level="error")
                 logger.log_error("요약 생성 실패")
         else:
             logger.log_error("백업 데이터 없음")
@@ -989,7 +1508,7 @@ def main():
                 message="압축 상태 저장 중..."
             )
             save_compact_state(backup_file, summary, config, backup_data)
-            add_breadcrumb("Compact state saved", category="state")
+            breadcrumb_buffer.record("Compact state saved", category="state")
             logger.log_info("압축 상태 저장 완료")
 
         # 완료 상태 업데이트
@@ -1002,7 +1521,7 @@ def main():
 
         # PID 파일 삭제
         remove_pid_file()
-        add_breadcrumb("PID file removed", category="progress")
+        breadcrumb_buffer.record("PID file removed", category="progress")
         logger.log_info("PID 파일 삭제 완료")
 
         # 종료
@@ -1012,14 +1531,14 @@ def main():
             summary_generated=bool(summary)
         )
 
-        # Sentry flush before exit
-        flush()
         sys.exit(0)
 
     except Exception as e:
         error_msg = f"오류 발생: {e}"
         console.print(f"[red]ERROR: {error_msg}[/]")
-        traceback.print_exc(file=sys.stderr)
+        # 전체 traceback은 Sentry로 전송되므로 로컬 출력은 디버그 모드에서만
+        if os.environ.get("CLAUDE_HOOK_DEBUG"):
+            traceback.print_exc(file=sys.stderr)
 
         # 에러 상태 업데이트
         update_progress_status(
@@ -1034,6 +1553,7 @@ def main():
         remove_pid_file()
 
         # Capture exception to Sentry
+        breadcrumb_buffer.replay()
         capture_exception(e, context={
             "hook": "auto-compact",
             "error_message": error_msg
@@ -1041,8 +1561,8 @@ def main():
 
         logger.log_end(success=False, error=str(e))
 
-        # Flush Sentry before exit
-        flush()
+        # Flush Sentry before exit so the error report is delivered
+        flush(timeout=2.0)
         sys.exit(1)
 
 
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Deferred Sentry Breadcrumbs
+
+Breadcrumbs only matter when an event is sent, so hooks record them into
+an in-process buffer on the happy path and replay them into Sentry right
+before capturing an exception.
+"""
+from collections import deque
+from typing import Dict, Any, Optional, Literal
+
+from .sentry import add_breadcrumb
+
+# Matches the Sentry SDK default max_breadcrumbs
+MAX_BREADCRUMBS = 50
+
+_buffer: deque = deque(maxlen=MAX_BREADCRUMBS)
+
+
+def record(
+    message: str,
+    category: str = "default",
+    level: Literal["fatal", "critical", "error", "warning", "info", "debug"] = "info",
+    data: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Buffer a breadcrumb without touching the Sentry scope.
+
+    Args:
+        message: Breadcrumb message
+        category: Breadcrumb category
+        level: Severity level (fatal, critical, error, warning, info, debug)
+        data: Additional data
+    """
+    _buffer.append((message, category, level, data))
+
+
+def replay() -> None:
+    """Send buffered breadcrumbs to Sentry in order and clear the buffer."""
+    while _buffer:
+        message, category, level, data = _buffer.popleft()
+        add_breadcrumb(message, category=category, level=level, data=data)
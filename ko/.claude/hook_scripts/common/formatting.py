@@ -10,7 +10,6 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.rule import Rule
 from rich.theme import Theme
-from rich.syntax import Syntax
 from typing import List, Dict, Any, Optional, Tuple
 
 
@@ -183,6 +182,8 @@ def print_git_status(
 def print_metadata_template(metadata: Dict[str, Any], title: str = "Metadata Template") -> None:
     """메타데이터 템플릿을 JSON 포맷으로 출력"""
     json_str = json.dumps(metadata, indent=2, ensure_ascii=False)
+    from rich.syntax import Syntax
+
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
 
     console.print(f"\n[bold cyan]{title}[/bold cyan]")
@@ -196,6 +197,8 @@ def print_code_example(
     title: Optional[str] = None
 ) -> None:
     """코드 예시를 Syntax Highlighting과 함께 출력"""
+    from rich.syntax import Syntax
+
     syntax = Syntax(code, language, theme="monokai", line_numbers=False)
 
     if title:
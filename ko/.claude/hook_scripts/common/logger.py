@@ -2,13 +2,18 @@
 """
 Hook Logger - 훅 스크립트 로깅 시스템
 """
+import atexit
 import json
 import os
+import signal
 import sys
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 
+from . import fastjson
 from .config import load_settings
 from rich.console import Console
 
@@ -23,6 +28,44 @@ LOG_LEVELS = {
     'CRITICAL': 50
 }
 
+# Pending JSONL records are written out once they would exceed this size;
+# a typical hook run fits in one write
+LOG_BUFFER_SIZE = 8192
+
+# Loggers with an open file sink, flushed at exit and on SIGTERM
+_open_loggers: "weakref.WeakSet[HookLogger]" = weakref.WeakSet()
+_sigterm_handler_installed = False
+
+
+def _flush_open_loggers() -> None:
+    """버퍼에 남은 레코드가 있는 모든 로거 flush"""
+    for hook_logger in list(_open_loggers):
+        hook_logger.flush()
+
+
+def _handle_sigterm(signum, frame) -> None:
+    """버퍼된 레코드를 flush한 뒤 기본 SIGTERM 동작으로 종료"""
+    _flush_open_loggers()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _install_sigterm_handler() -> None:
+    """스크립트가 자체 핸들러를 두지 않은 경우 flush용 SIGTERM 핸들러 설치"""
+    global _sigterm_handler_installed
+    if _sigterm_handler_installed:
+        return
+    _sigterm_handler_installed = True
+    try:
+        if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, _handle_sigterm)
+    except ValueError:
+        # Not called from the main thread
+        pass
+
+
+atexit.register(_flush_open_loggers)
+
 
 class HookLogger:
     """훅 스크립트 로거"""
@@ -58,6 +101,15 @@ class HookLogger:
         self.rotation_enabled = rotation_config.get('enabled', True)
         self.max_size_mb = rotation_config.get('max_size_mb', 10)
 
+        # Guards the log file sink when worker threads log concurrently
+        self._file_lock = threading.RLock()
+        # Unbuffered append handle, opened on the first write
+        self._file = None
+        # Encoded JSONL records not yet written; only whole records are written, so
+        # concurrent runs appending to the same log never interleave half-lines
+        self._pending_records: List[bytes] = []
+        self._pending_size = 0
+
     def _get_log_dir(self) -> Path:
         """로그 디렉토리 경로 반환 및 생성"""
         # 프로젝트 루트 찾기
@@ -134,6 +186,7 @@ class HookLogger:
             **kwargs
         }
         self._write_log(log_entry, level=level)
+        self.flush()
 
     def log_info(self, message: str, **kwargs) -> None:
         """정보 로그"""
@@ -162,6 +215,7 @@ class HookLogger:
             **kwargs
         }
         self._write_log(log_entry, level='ERROR')
+        self.flush()
 
     def log_warning(self, message: str, **kwargs) -> None:
         """경고 로그"""
@@ -180,14 +234,17 @@ class HookLogger:
     def _write_log(self, log_entry: Dict[str, Any], level: str = 'INFO') -> None:
         """로그 기록 (handlers에 따라 다른 출력)"""
         try:
-            # Check rotation before writing
-            if self.rotation_enabled and 'file' in self.handlers:
-                self._check_rotation()
-
             # Write to file handler (JSON format)
             if 'file' in self.handlers:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+                record = fastjson.dumps(log_entry) + b'\n'
+                # Serialize rotation + append across threads sharing this logger
+                with self._file_lock:
+                    if self._pending_size + len(record) > LOG_BUFFER_SIZE:
+                        self._write_records()
+                    self._pending_records.append(record)
+                    self._pending_size += len(record)
+                _open_loggers.add(self)
+                _install_sigterm_handler()
 
             # Write to console handler (formatted)
             if 'console' in self.handlers:
@@ -202,6 +259,33 @@ class HookLogger:
             # 로깅 실패는 스크립트 실행을 방해하지 않음
             console.print(f"[yellow]WARNING: Log write failed: {e}[/]")
 
+    def _open_file(self) -> None:
+        """버퍼 없는 O_APPEND 로그 파일 싱크 열기 (로테이션은 실행당 한 번 확인)"""
+        if self.rotation_enabled:
+            self._check_rotation()
+        self._file = open(self.log_file, 'ab', buffering=0)
+
+    def _write_records(self) -> None:
+        """대기 중인 레코드를 레코드 단위로 로그 파일에 추가 (호출 측이 _file_lock 보유)"""
+        if not self._pending_records:
+            return
+        if self._file is None:
+            self._open_file()
+
+        data = memoryview(b''.join(self._pending_records))
+        self._pending_records.clear()
+        self._pending_size = 0
+        while data:
+            data = data[self._file.write(data):]
+
+    def flush(self) -> None:
+        """버퍼된 로그 레코드를 로그 파일에 기록"""
+        with self._file_lock:
+            try:
+                self._write_records()
+            except Exception as e:
+                console.print(f"[yellow]WARNING: Log flush failed: {e}[/]")
+
     def _format_message(self, log_entry: Dict[str, Any], level: str) -> str:
         """Format log message according to config format string"""
         timestamp_str = datetime.fromisoformat(log_entry['timestamp']).strftime(self.timestamp_format)
@@ -252,11 +336,12 @@ class HookLogger:
         try:
             # Import here to avoid circular imports
             from .sentry import capture_message, add_breadcrumb, _sentry_initialized
-            import sentry_sdk
 
             if not _sentry_initialized:
                 return
 
+            import sentry_sdk
+
             # Add project description to Sentry context
             if self.description:
                 sentry_sdk.set_context('project_info', {
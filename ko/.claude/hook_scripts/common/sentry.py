@@ -4,24 +4,20 @@ Sentry Integration Utilities
 """
 import os
 import sys
-from typing import Dict, Any, Optional, Literal
-
-import sentry_sdk
-from sentry_sdk.integrations.argv import ArgvIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-from sentry_sdk.integrations.modules import ModulesIntegration
-from sentry_sdk.integrations.threading import ThreadingIntegration
-from sentry_sdk.types import Event, Hint
+from typing import TYPE_CHECKING, Dict, Any, Optional, Literal
 
 from .config import load_settings
-from rich.console import Console
 
-console = Console(stderr=True)
+if TYPE_CHECKING:
+    from sentry_sdk.types import Event, Hint
+
+# sentry_sdk 모듈 (Sentry가 활성화된 경우에만 init_sentry에서 import)
+sentry_sdk = None
 
 _sentry_initialized = False
 
 
-def filter_sensitive_data(event: Event, hint: Hint) -> Optional[Event]:
+def filter_sensitive_data(event: "Event", hint: "Hint") -> Optional["Event"]:
     """
     Filter sensitive data from Sentry events before sending.
     Sentry 이벤트에서 민감한 데이터 필터링.
@@ -77,7 +73,7 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
     Returns:
         True if Sentry was initialized, False otherwise
     """
-    global _sentry_initialized
+    global _sentry_initialized, sentry_sdk
 
     # Return early if already initialized
     if _sentry_initialized:
@@ -97,6 +93,12 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
         return False
 
     try:
+        import sentry_sdk
+        from sentry_sdk.integrations.argv import ArgvIntegration
+        from sentry_sdk.integrations.logging import LoggingIntegration
+        from sentry_sdk.integrations.modules import ModulesIntegration
+        from sentry_sdk.integrations.threading import ThreadingIntegration
+
         # Prepare tags
         tags = {
             'script': script_name,
@@ -167,7 +169,9 @@ def init_sentry(script_name: str, additional_tags: Optional[Dict[str, str]] = No
 
     except Exception as e:
         # Sentry initialization failed, but don't crash the hook
-        console.print(f"[yellow]WARNING: Sentry initialization failed: {e}[/]")
+        from rich.console import Console
+
+        Console(stderr=True).print(f"[yellow]WARNING: Sentry initialization failed: {e}[/]")
         return False
 
 
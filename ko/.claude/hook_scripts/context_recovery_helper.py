@@ -11,36 +11,44 @@ Example Project Context Recovery Helper
 """
 
 import gzip
-import json
 import os
-import signal
 import subprocess
 import sys
 import tempfile
+import time
 import traceback
-from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
+from common import breadcrumb_buffer, fastjson
 from common.logger import HookLogger
-from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
+from common.sentry import init_sentry, capture_exception, flush
 from common.config import load_config
 from common.formatting import console
 
 # token_manager import 추가
 from token_manager import is_continued_session
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
+# 프로젝트 이름은 pyproject.toml 상단의 [project]에 있으므로 앞부분만 확인
+PYPROJECT_SCAN_BYTES = 4096
 
+# auto_compact가 만드는 백업 파일 확장자 (JSON, gzip, zstd, txt)
+BACKUP_SUFFIXES = ('.json', '.json.gz', '.json.zst', '.txt')
 
+# 압축 백업 읽기 버퍼 (기본값이면 gzip이 작은 단위로 읽음)
+BACKUP_READ_BUFFER = 1 << 20
+
+
+@cache
 def find_project_root() -> Optional[Path]:
     """Example Project 프로젝트 루트 자동 탐지
 
     pyproject.toml에 example_project가 있는 루트 디렉토리를 찾음
+
+    아래 헬퍼들이 모두 이 결과로 경로를 구하므로 캐시함
+    (CLAUDE_PROJECT_DIR와 cwd는 훅 실행 중 바뀌지 않음)
     """
     # 1. 환경변수 우선
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
@@ -56,12 +64,13 @@ def find_project_root() -> Optional[Path]:
         pyproject = parent / "pyproject.toml"
         if pyproject.exists():
             try:
-                content = pyproject.read_text(encoding='utf-8')
-                if 'example_project' in content.lower() or 'example_project' in content:
+                with pyproject.open('rb') as f:
+                    head = f.read(PYPROJECT_SCAN_BYTES)
+                if b'example_project' in head.lower():
                     # .claude 디렉토리가 있는지 확인
                     if (parent / ".claude").exists():
                         return parent
-            except Exception:
+            except OSError:
                 pass
 
         # .git 디렉토리가 있고 .claude 디렉토리가 있는 경우
@@ -71,32 +80,40 @@ def find_project_root() -> Optional[Path]:
     return None
 
 
-def load_recovery_state() -> Optional[Dict[str, Any]]:
-    """복구 상태 파일 로드"""
-    # 프로젝트 루트 자동 탐지
-    project_root = find_project_root()
-
-    candidates = []
+@cache
+def get_claude_dirs() -> Tuple[Path, ...]:
+    """복구 상태와 백업을 담는 .claude 디렉토리 목록 (우선순위 순)
 
-    # 프로젝트 루트를 찾았으면 우선 사용
+    프로젝트 루트를 찾으면 그 .claude 디렉토리만 사용하고,
+    못 찾으면 CLAUDE_PROJECT_DIR, 현재 디렉토리, 홈 디렉토리 순으로 시도
+    """
+    project_root = find_project_root()
     if project_root:
-        candidates.append(project_root / ".claude" / "recovery" / "compact-recovery.json")
+        return (project_root / ".claude",)
+
+    claude_dirs = []
 
     # 환경변수 폴백
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
     if project_dir:
-        candidates.append(Path(project_dir) / ".claude" / "recovery" / "compact-recovery.json")
+        claude_dirs.append(Path(project_dir) / ".claude")
 
     # 기존 후보들 추가
-    candidates.extend([
-        Path.cwd() / ".claude" / "recovery" / "compact-recovery.json",
-        Path.home() / ".claude" / "recovery" / "compact-recovery.json",
+    claude_dirs.extend([
+        Path.cwd() / ".claude",
+        Path.home() / ".claude",
     ])
 
-    for candidate in candidates:
+    return tuple(dict.fromkeys(claude_dirs))
+
+
+def load_recovery_state() -> Optional[Dict[str, Any]]:
+    """복구 상태 파일 로드"""
+    for claude_dir in get_claude_dirs():
+        candidate = claude_dir / "recovery" / "compact-recovery.json"
         if candidate.exists():
-            with open(candidate, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(candidate, 'rb') as f:
+                return fastjson.loads(f.read())
 
     return None
 
@@ -107,78 +124,55 @@ def save_recovery_state(state: Dict[str, Any]) -> None:
     Args:
         state: 저장할 상태 데이터
     """
-    project_root = find_project_root()
-
-    if project_root:
-        recovery_file = project_root / ".claude" / "recovery" / "compact-recovery.json"
-    else:
-        project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
-        if project_dir:
-            recovery_file = Path(project_dir) / ".claude" / "recovery" / "compact-recovery.json"
-        else:
-            recovery_file = Path.cwd() / ".claude" / "recovery" / "compact-recovery.json"
+    recovery_file = get_claude_dirs()[0] / "recovery" / "compact-recovery.json"
 
     # 디렉토리 생성
     recovery_file.parent.mkdir(parents=True, exist_ok=True)
 
     # 저장
-    with open(recovery_file, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2, ensure_ascii=False)
+    recovery_file.write_bytes(fastjson.dumps(state))
 
 
-def list_backups() -> List[tuple[Path, datetime]]:
-    """백업 파일 목록 조회 (JSON, gzip, txt 모두 포함)"""
-    # 프로젝트 루트 자동 탐지
-    project_root = find_project_root()
-
-    backup_dirs = []
-
-    # 프로젝트 루트를 찾았으면 우선 사용
-    if project_root:
-        backup_dirs.append(project_root / ".claude" / "backups")
-
-    # 환경변수 폴백
-    project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
-    if project_dir:
-        backup_dirs.append(Path(project_dir) / ".claude" / "backups")
-
-    # 기존 후보들 추가
-    backup_dirs.extend([
-        Path.cwd() / ".claude" / "backups",
-        Path.home() / ".claude" / "backups",
-    ])
+def list_backups() -> List[tuple[Path, float, int]]:
+    """백업 파일 목록 조회 (JSON, gzip, zstd, txt 모두 포함) - (경로, 수정 시간, 크기)"""
+    backup_dirs = [claude_dir / "backups" for claude_dir in get_claude_dirs()]
 
     backups = []
-    seen_files = set()  # 중복 방지
+    seen_dirs = set()  # 중복 방지 (폴백 후보가 같은 디렉토리를 가리킬 수 있음)
     for backup_dir in backup_dirs:
-        if not backup_dir.exists():
+        real_dir = os.path.realpath(backup_dir)
+        if real_dir in seen_dirs or not os.path.isdir(real_dir):
             continue
+        seen_dirs.add(real_dir)
 
-        # JSON, gzip, txt 모두 찾기
-        patterns = ['conversation_*.json', 'conversation_*.json.gz', 'conversation_*.txt']
-        for pattern in patterns:
-            for backup_file in backup_dir.glob(pattern):
-                # 중복 체크 (절대 경로 기준)
-                abs_path = backup_file.resolve()
-                if abs_path in seen_files:
+        # 디렉토리를 한 번만 읽으며 JSON, gzip, zstd, txt 모두 찾기
+        with os.scandir(backup_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith('conversation_') and name.endswith(BACKUP_SUFFIXES)):
+                    continue
+                if not entry.is_file():
                     continue
-                seen_files.add(abs_path)
 
-                mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-                backups.append((backup_file, mtime))
+                st = entry.stat()
+                backups.append((Path(entry.path), st.st_mtime, st.st_size))
 
     return sorted(backups, key=lambda x: x[1], reverse=True)
 
 
 def load_backup_file(backup_path: Path) -> Optional[Dict[str, Any]]:
-    """백업 파일 로드 (JSON 또는 gzip)"""
+    """백업 파일 로드 (JSON, gzip 또는 zstd)"""
     try:
         if backup_path.suffix == '.gz':
-            with gzip.open(backup_path, 'rt', encoding='utf-8') as f:  # type: ignore[assignment]
-                return json.load(f)
+            with open(backup_path, 'rb', buffering=BACKUP_READ_BUFFER) as raw, gzip.GzipFile(fileobj=raw) as gz:
+                return fastjson.loads(gz.read())
+        elif backup_path.suffix == '.zst':
+            import zstandard
+            with open(backup_path, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                return fastjson.loads(reader.read())
         elif backup_path.suffix == '.json':
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(backup_path, 'rb') as f:
+                return fastjson.loads(f.read())
         else:
             # 구버전 txt 파일
             return None
@@ -204,6 +198,9 @@ def load_summary_from_state(state: Dict[str, Any]) -> Optional[str]:
 
 def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: str) -> None:
     """컨텍스트 복구 가이드 출력"""
+    from rich.panel import Panel
+    from rich import box
+
     guide_parts = []
 
     if recovery_state:
@@ -236,10 +233,9 @@ def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: s
     backups = list_backups()
     if backups:
         guide_parts.append("[cyan]최근 백업 파일:[/]")
-        for i, (backup_path, mtime) in enumerate(backups[:5], 1):
-            size = backup_path.stat().st_size
+        for i, (backup_path, mtime, size) in enumerate(backups[:5], 1):
             guide_parts.append(f"   {i}. {backup_path.name}")
-            guide_parts.append(f"      시간: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+            guide_parts.append(f"      시간: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))}")
             guide_parts.append(f"      크기: {size:,} bytes")
             guide_parts.append(f"      경로: {backup_path}\n")
     else:
@@ -264,6 +260,9 @@ def print_recovery_guide(recovery_state: Optional[Dict[str, Any]], collection: s
 
 def check_recent_compacts(config: Dict[str, Any], days: int = 7) -> None:
     """최근 압축 이력 확인"""
+    from rich.panel import Panel
+    from rich import box
+
     collection = config.get('collection', 'example_project_context')
 
     start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
@@ -291,7 +290,11 @@ def check_recent_compacts(config: Dict[str, Any], days: int = 7) -> None:
 
 def list_recovery_files() -> None:
     """복구 관련 파일 확인"""
-    project_root = find_project_root()
+    from rich.table import Table
+    from rich import box
+
+    # save_recovery_state가 저장하는 것과 같은 기준 디렉토리
+    base_dir = get_claude_dirs()[0].parent
 
     files = [
         (".claude/recovery/compact-recovery.json", "복구 상태 파일"),
@@ -312,16 +315,14 @@ def list_recovery_files() -> None:
     table.add_column("정보", style="yellow")
 
     for filepath, description in files:
-        if project_root:
-            full_path = project_root / filepath
-        else:
-            full_path = Path.cwd() / filepath
+        full_path = base_dir / filepath
 
         if full_path.exists():
             if full_path.is_file():
-                size = full_path.stat().st_size
-                mtime = datetime.fromtimestamp(full_path.stat().st_mtime)
-                info = f"크기: {size:,} bytes\n수정: {mtime.strftime('%Y-%m-%d %H:%M:%S')}"
+                st = full_path.stat()
+                size = st.st_size
+                mtime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(st.st_mtime))
+                info = f"크기: {size:,} bytes\n수정: {mtime}"
                 table.add_row("[green]존재[/]", str(filepath), description, info)
             else:
                 table.add_row("[green]존재[/]", str(filepath), description, "디렉토리")
@@ -331,76 +332,70 @@ def list_recovery_files() -> None:
     console.print(table)
 
 
-def check_recent_compact(state: Optional[Dict[str, Any]], threshold_hours: int = 24) -> bool:
-    """최근에 자동 컴팩트가 발생했는지 확인
+def parse_compact_time(state: Optional[Dict[str, Any]]) -> Optional[datetime]:
+    """아직 복구되지 않은 복구 상태의 압축 시각 파싱
 
     Args:
         state: 복구 상태 데이터
-        threshold_hours: 복구 메시지를 표시할 임계값 (시간 단위, 기본 24시간)
 
     Returns:
-        최근 압축 여부
+        압축 시각 (상태가 없거나, 이미 복구했거나, 타임스탬프가 없거나 잘못되면 None)
     """
     if not state:
-        return False
+        return None
 
-    # recovered 플래그 체크 - 이미 복구했으면 False 반환
+    # recovered 플래그 체크 - 이미 복구했으면 None 반환
     if state.get('recovered', False):
-        return False
+        return None
 
     timestamp_str = state.get('timestamp', '')
     if not timestamp_str:
-        return False
+        return None
 
     try:
-        compact_time = datetime.fromisoformat(timestamp_str)
+        return datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError):
+        return None
 
-        # UTC 시간인 경우 처리
-        if compact_time.tzinfo is not None:
-            now = datetime.now(timezone.utc)
-        else:
-            now = datetime.now()
 
-        diff = now - compact_time
-        return diff.total_seconds() < (threshold_hours * 3600)
-    except Exception:
-        return False
+def check_recent_compact(compact_time: Optional[datetime], threshold_hours: int = 24) -> bool:
+    """최근에 자동 컴팩트가 발생했는지 확인
 
+    Args:
+        compact_time: parse_compact_time()으로 얻은 압축 시각
+        threshold_hours: 복구 메시지를 표시할 임계값 (시간 단위, 기본 24시간)
 
-def print_quiet_status():
-    """복구 필요 없을 때 조용한 상태 메시지"""
-    console.print("[green]✓[/green] 정상 세션 시작 (압축 이력 없음)")
+    Returns:
+        최근 압축 여부
+    """
+    if compact_time is None:
+        return False
 
+    # UTC 시간인 경우 처리
+    if compact_time.tzinfo is not None:
+        now = datetime.now(timezone.utc)
+    else:
+        now = datetime.now()
 
-@contextmanager
-def timeout_context(seconds: int):
-    """컨텍스트 관리자로 타임아웃 구현
+    diff = now - compact_time
+    return diff.total_seconds() < (threshold_hours * 3600)
 
-    Args:
-        seconds: 타임아웃 초
 
-    Raises:
-        TimeoutError: 타임아웃 발생 시
-    """
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"작업이 {seconds}초 내에 완료되지 않았습니다")
-
-    # 유닉스 계열 시스템에서만 동작
-    if hasattr(signal, 'SIGALRM'):
-        original_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        try:
-            yield
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, original_handler)
-    else:
-        # Windows 등 SIGALRM 미지원 시스템
-        yield
+def print_quiet_status():
+    """복구 필요 없을 때 조용한 상태 메시지"""
+    console.print("[green]✓[/green] 정상 세션 시작 (압축 이력 없음)")
 
 
 def main():
     """메인 함수 - 자동 맥락 복구"""
+    # 연속 세션이면 복구할 것이 없으므로 Sentry/로거 초기화 전에 종료
+    try:
+        if is_continued_session():
+            sys.exit(0)
+    except Exception:
+        # 세션 상태를 읽지 못하면 신규 세션으로 처리
+        pass
+
     # Sentry 초기화
     init_sentry('context-recovery-helper', additional_tags={'hook_type': 'session_start'})
 
@@ -411,39 +406,25 @@ def main():
         if logger:
             logger.log_start()
 
-        add_breadcrumb("Recovery hook execution started", category="lifecycle")
-
-        # 세션 연속성 체크 - 신규 세션인지 확인
-        is_new_session = not is_continued_session()
-        add_breadcrumb("Session continuity check", category="session", data={"is_new_session": is_new_session})
-
-        if logger:
-            logger.log_info("세션 연속성 체크", is_new_session=is_new_session)
-
-        # 연속 세션이면 복구 가이드 출력하지 않음
-        if not is_new_session:
-            if logger:
-                logger.log_end(success=True, status="continued_session")
-            sys.exit(0)
+        breadcrumb_buffer.record("Recovery hook execution started", category="lifecycle")
 
-        # 신규 세션 - 복구 가이드 출력
         # 설정 로드
         config = load_config('auto-compact.json')
-        add_breadcrumb("Config loaded", category="config")
+        breadcrumb_buffer.record("Config loaded", category="config")
 
         # 복구 상태 로드
         state = load_recovery_state()
-        add_breadcrumb("Recovery state loaded", category="state", data={"has_state": bool(state)})
+        breadcrumb_buffer.record("Recovery state loaded", category="state", data={"has_state": bool(state)})
 
         # 최근 압축 체크 (12시간 이내)
         recovery_config = config.get('recovery', {})
         threshold_hours = int(recovery_config.get('threshold_hours', 12))
-        is_recent_compact = check_recent_compact(state, threshold_hours=threshold_hours)
-        add_breadcrumb("Recent compact check", category="compact", data={"is_recent": is_recent_compact})
+        is_recent_compact = check_recent_compact(parse_compact_time(state), threshold_hours=threshold_hours)
+        breadcrumb_buffer.record("Recent compact check", category="compact", data={"is_recent": is_recent_compact})
 
         # 요약 존재 여부 확인
-        summary = state.get('summary') if state else None
-        has_summary = bool(summary and summary.strip())
+        summary = load_summary_from_state(state) if state else None
+        has_summary = summary is not None
 
         if logger:
             logger.log_info(
@@ -461,10 +442,9 @@ def main():
 
         # 최근에 자동 컴팩트가 발생한 경우
         # 1. 복구 상태에서 저장된 요약 확인 (auto_compact.py가 저장한 AI 요약)
-        add_breadcrumb("Attempting to load summary from state", category="recovery")
-        summary = load_summary_from_state(state)
+        breadcrumb_buffer.record("Using summary from state", category="recovery", data={"has_summary": has_summary})
 
-        if not summary:
+        if summary is None:
             # 복구 상태에 요약이 없음 - 비정상 상황
             console.print("[yellow]WARNING: 압축 파일에 요약이 없습니다.[/]")
             console.print("[yellow]다음 세션에 다시 요약이 생성됩니다.[/]")
@@ -475,7 +455,7 @@ def main():
             sys.exit(0)
 
         # 요약 출력
-        add_breadcrumb("Summary output", category="recovery", data={"length": len(summary)})
+        breadcrumb_buffer.record("Summary output", category="recovery", data={"length": len(summary)})
 
         # 명확한 우선순위 지시
         console.print("\n" + "="*80)
@@ -493,7 +473,7 @@ def main():
         state['recovered_at'] = datetime.now().isoformat()
         save_recovery_state(state)
 
-        add_breadcrumb("Recovery completed successfully", category="recovery")
+        breadcrumb_buffer.record("Recovery completed successfully", category="recovery")
 
         if logger:
             logger.log_end(success=True, status="recovery_completed", summary_length=len(summary))
@@ -506,9 +486,12 @@ def main():
         error_msg = f"복구 헬퍼 실행 중 오류: {e}"
         console.print(f"[yellow]WARNING: {error_msg}[/]")
         console.print("세션을 계속 진행합니다...\n")
-        traceback.print_exc(file=sys.stderr)
+        # 전체 traceback은 Sentry로 전송되므로 터미널이거나 디버그 모드일 때만 출력
+        if os.environ.get("CLAUDE_HOOK_DEBUG") or sys.stderr.isatty():
+            traceback.print_exc(file=sys.stderr)
 
         # Capture exception to Sentry
+        breadcrumb_buffer.replay()
         capture_exception(e, context={
             "hook": "context-recovery-helper",
             "error_message": error_msg
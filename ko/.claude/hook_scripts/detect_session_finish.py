@@ -8,9 +8,11 @@ Claude Code Hook: Session Finish Detector
 Hook Event: UserPromptSubmit
 """
 import json
+import re
 import sys
 from typing import List
 
+from common import fastjson
 from common.logger import HookLogger
 from common.sentry import init_sentry, add_breadcrumb, flush
 
@@ -32,6 +34,14 @@ FINISH_KEYWORDS: List[str] = [
     "세션종료",
 ]
 
+# 프롬프트를 한 번만 훑도록 모든 키워드를 하나의 패턴으로 결합
+# (대소문자 무시 매칭이라 프롬프트를 소문자로 복사하지 않음)
+_FINISH_RE = re.compile('|'.join(re.escape(keyword) for keyword in FINISH_KEYWORDS), re.IGNORECASE)
+
+# 키워드만 입력한 프롬프트 (예: "완료")는 집합 조회로 바로 판정
+_FINISH_SET = frozenset(keyword.lower() for keyword in FINISH_KEYWORDS)
+_FINISH_SET_MAX_LEN = max(len(keyword) for keyword in FINISH_KEYWORDS)
+
 
 def detect_finish_keyword(prompt: str) -> bool:
     """
@@ -43,13 +53,11 @@ def detect_finish_keyword(prompt: str) -> bool:
     Returns:
         키워드가 감지되면 True
     """
-    prompt_lower = prompt.lower().strip()
-
-    for keyword in FINISH_KEYWORDS:
-        if keyword.lower() in prompt_lower:
-            return True
+    stripped = prompt.strip()
+    if len(stripped) <= _FINISH_SET_MAX_LEN and stripped.lower() in _FINISH_SET:
+        return True
 
-    return False
+    return _FINISH_RE.search(prompt) is not None
 
 
 def create_finish_context() -> str:
@@ -79,6 +87,13 @@ def create_finish_context() -> str:
 
 def main():
     """메인 함수"""
+    # stdin에서 JSON 입력 읽기
+    raw_input = sys.stdin.buffer.read()
+
+    # 다른 이벤트에는 이벤트 이름이 없으므로 파싱 및 로거/Sentry 초기화 전에 건너뜀
+    if b'"UserPromptSubmit"' not in raw_input:
+        sys.exit(0)
+
     logger = HookLogger('detect-session-finish')
     logger.log_start()
 
@@ -90,11 +105,10 @@ def main():
     try:
         add_breadcrumb("Hook execution started", category="lifecycle")
 
-        # stdin에서 JSON 입력 읽기
         try:
-            input_data = json.load(sys.stdin)
+            input_data = fastjson.loads(raw_input)
             add_breadcrumb("Input data loaded", category="input")
-        except json.JSONDecodeError as e:
+        except fastjson.JSONDecodeError as e:
             logger.log_error("JSON decode error", error=str(e))
             logger.log_end(success=False)
             flush()
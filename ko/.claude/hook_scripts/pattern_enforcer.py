@@ -4,41 +4,82 @@ Example Project - Code pattern enforcement script.
 Enforces coding patterns and best practices.
 """
 import json
+import os
 import re
 import sys
-from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from functools import cache
+from typing import Dict, Any, List, Set, Tuple, Optional
 
-from rich.console import Console
+from common import fastjson
+from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
 
-console = Console(stderr=True)
+# 패턴 검사에서 제외되는 테스트 파일 경로
+TEST_PATH_RE = re.compile("|".join([
+    r"test_.*\.py$",
+    r".*_test\.py$",
+    r"/tests?/",
+    r"conftest\.py$",
+    r"\.test\.",
+    r"\.spec\.",
+]))
 
-from common.sentry import init_sentry, capture_exception, add_breadcrumb, flush
+# 모든 금지 패턴에 필요한 리터럴 토큰 (하나도 없으면 정규식 스캔 생략)
+FORBIDDEN_TOKENS = ("getattr", "setattr", "hasattr", "delattr")
 
+# 공백을 제외한 첫 문자가 "#"인 줄의 시작 위치
+COMMENT_LINE_RE = re.compile(r"^[^\S\n]*#", re.MULTILINE)
 
-def load_pattern_config() -> Dict[str, Any]:
+# Repository/Service 패턴 검사: 신호별 named group을 가진 단일 스캔.
+# lookahead로 모든 매칭을 폭 0으로 만들어 신호끼리 서로 가리지 않도록 함.
+REPO_SCAN_RE = re.compile(
+    r"(?="
+    r"(?P<service_class>class\s+\w+Service\s*(?:\(|:))"
+    r"|(?P<repository_import>from\s+.*\s+import\s+.*Repository)"
+    r"|(?P<repository_usage>(?i:self\.\w*repo(?:sitory)?))"
+    r"|(?P<db_method>def\s+(?:get|create|update|delete|save|find|list)_|session\.|await\s+.*\.execute)"
+    r")"
+)
+
+
+@cache
+def get_console():
+    """stderr 콘솔을 처음 사용할 때 생성 (rich는 에러 경로에서만 필요)"""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@cache
+def _pattern_config_paths() -> Tuple[str, ...]:
     """
-    Load code-quality.json and command-restrictions.json configuration files.
-    코드 품질 및 명령어 제한 설정 파일 로드.
+    Find existing code-quality.json files, in load order.
+    존재하는 code-quality.json 파일 목록 (로드 순서).
     """
     candidates = [
-        Path.cwd() / ".claude" / "config",
-        Path.home() / ".claude" / "config",
+        os.path.join(os.getcwd(), ".claude", "config", "code-quality.json"),
+        os.path.join(os.path.expanduser("~"), ".claude", "config", "code-quality.json"),
     ]
 
+    return tuple(path for path in candidates if os.path.isfile(path))
+
+
+@cache
+def load_pattern_config() -> Dict[str, Any]:
+    """
+    Load code-quality.json and command-restrictions.json configuration files.
+    코드 품질 및 명령어 제한 설정 파일 로드.
+    """
     config = {
         "forbidden_patterns": {},
         "enabled": True
     }
 
-    for base_path in candidates:
-        code_quality_path = base_path / "code-quality.json"
-        if code_quality_path.exists():
-            try:
-                with open(code_quality_path, 'r', encoding='utf-8') as f:
-                    config["code_quality"] = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                continue
+    for code_quality_path in _pattern_config_paths():
+        try:
+            with open(code_quality_path, 'r', encoding='utf-8') as f:
+                config["code_quality"] = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
 
     # Default forbidden patterns
     config["forbidden_patterns"] = {
@@ -103,6 +144,12 @@ def load_pattern_config() -> Dict[str, Any]:
         }
     }
 
+    # One alternation with a named group per pattern, scanned once per file
+    config["fused_pattern"] = re.compile("|".join(
+        f"(?P<{name}>{info['pattern']})"
+        for name, info in config["forbidden_patterns"].items()
+    ))
+
     return config
 
 
@@ -133,31 +180,19 @@ class CodePatternValidator:
 
         self.config = config
         self.forbidden_patterns = config.get("forbidden_patterns", {})
+        self.fused_pattern = config.get("fused_pattern")
 
     def should_skip_validation(self) -> bool:
         """
         Check if file should skip validation.
         파일이 검증을 건너뛰어야 하는지 확인.
         """
-        # Skip test files
-        test_patterns = [
-            r"test_.*\.py$",
-            r".*_test\.py$",
-            r"/tests?/",
-            r"conftest\.py$",
-            r"\.test\.",
-            r"\.spec\.",
-        ]
-
-        for pattern in test_patterns:
-            if re.search(pattern, self.file_path):
-                return True
-
         # Skip non-Python files for code pattern checks
         if not self.file_path.endswith('.py'):
             return True
 
-        return False
+        # Skip test files
+        return TEST_PATH_RE.search(self.file_path) is not None
 
     def validate(self) -> Tuple[List[str], List[str]]:
         """
@@ -171,7 +206,11 @@ class CodePatternValidator:
         self._check_forbidden_patterns()
 
         # Check Repository/Service pattern (only for Service files)
-        if 'service' in self.file_path.lower() and 'class' in self.content.lower():
+        if (
+            'service' in self.file_path.lower()
+            and 'class' in self.content
+            and 'Service' in self.content
+        ):
             self._check_repository_pattern()
 
         return self.errors, self.warnings
@@ -181,36 +220,68 @@ class CodePatternValidator:
         Check for forbidden code patterns.
         금지된 코드 패턴 확인.
         """
-        lines = self.content.split('\n')
-
-        for pattern_name, pattern_info in self.forbidden_patterns.items():
-            pattern = pattern_info["pattern"]
-            matches = []
-
-            # Find all matches with line numbers
-            for line_num, line in enumerate(lines, 1):
-                # Skip comments
-                stripped = line.strip()
-                if stripped.startswith('#'):
-                    continue
+        content = self.content
+        if not any(token in content for token in FORBIDDEN_TOKENS):
+            return
 
-                if re.search(pattern, line):
-                    matches.append((line_num, line.strip()))
+        matches_by_name = self._find_forbidden_matches()
 
+        for pattern_name, pattern_info in self.forbidden_patterns.items():
+            matches = matches_by_name.get(pattern_name)
             if matches:
-                error_msg = f"[{pattern_name.upper()}] {pattern_info['message']}\n"
-                error_msg += f"\n발견된 위치:\n"
+                parts = [
+                    f"[{pattern_name.upper()}] {pattern_info['message']}\n",
+                    "\n발견된 위치:\n",
+                ]
                 for line_num, line_content in matches:
-                    error_msg += f"  {self.file_path}:{line_num}\n"
-                    error_msg += f"    {line_content[:80]}\n"
+                    parts.append(f"  {self.file_path}:{line_num}\n")
+                    parts.append(f"    {line_content[:80]}\n")
 
-                error_msg += f"\n대안:\n"
+                parts.append("\n대안:\n")
                 for alt in pattern_info.get('alternatives', []):
-                    error_msg += f"  {alt}\n"
+                    parts.append(f"  {alt}\n")
+
+                parts.append(f"\n참조: {pattern_info.get('reference', 'Backend Skill 문서')}")
+
+                self.errors.append("".join(parts))
+
+    def _find_forbidden_matches(self) -> Dict[str, List[Tuple[int, str]]]:
+        """
+        Find forbidden patterns line by line with the fused regex.
+        통합 정규식으로 줄 단위 금지 패턴 검색.
+        """
+        content = self.content
+        line_num = 1
+        counted_to = 0
+        comment_lines: Optional[Set[int]] = None
+        matches_by_name: Dict[str, List[Tuple[int, str]]] = {}
+
+        for match in self.fused_pattern.finditer(content):
+            start = match.start()
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+
+            # Matches must stay within a single line
+            if match.end() > line_end:
+                continue
+
+            # Skip comments
+            if comment_lines is None:
+                comment_lines = {m.start() for m in COMMENT_LINE_RE.finditer(content)}
+            if line_start in comment_lines:
+                continue
+
+            # Matches arrive in order, so count newlines incrementally
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
 
-                error_msg += f"\n참조: {pattern_info.get('reference', 'Backend Skill 문서')}"
+            matches = matches_by_name.setdefault(match.lastgroup, [])
+            if not matches or matches[-1][0] != line_num:
+                matches.append((line_num, content[line_start:line_end].strip()))
 
-                self.errors.append(error_msg)
+        return matches_by_name
 
     def _check_repository_pattern(self) -> None:
         """
@@ -219,28 +290,16 @@ class CodePatternValidator:
 
         Note: This is a soft check - warns but doesn't block.
         """
-        # Find Service class definitions
-        service_class_pattern = r"class\s+\w+Service\s*(?:\(|:)"
-        service_classes = re.findall(service_class_pattern, self.content)
-
-        if not service_classes:
-            return
-
-        # Check if Repository is imported or used
-        has_repository_import = bool(re.search(r"from\s+.*\s+import\s+.*Repository", self.content))
-        has_repository_usage = bool(re.search(r"self\.\w*repo(?:sitory)?", self.content, re.IGNORECASE))
+        found = set()
+        for match in REPO_SCAN_RE.finditer(self.content):
+            # Repository import/usage means there is nothing to warn about
+            if match.lastgroup in ('repository_import', 'repository_usage'):
+                return
+            found.add(match.lastgroup)
 
         # Only warn if it looks like a Service that might need Repository
         # (has database-like method names but no Repository usage)
-        db_method_patterns = [
-            r"def\s+(?:get|create|update|delete|save|find|list)_",
-            r"session\.",
-            r"await\s+.*\.execute",
-        ]
-
-        has_db_methods = any(re.search(pattern, self.content) for pattern in db_method_patterns)
-
-        if has_db_methods and not (has_repository_import or has_repository_usage):
+        if 'service_class' in found and 'db_method' in found:
             self.warnings.append(
                 "[PATTERN] Service 클래스에서 데이터베이스 접근이 감지되었습니다.\n"
                 "\n"
@@ -306,13 +365,13 @@ def main():
         add_breadcrumb("Hook execution started", category="lifecycle")
 
         # stdin에서 JSON 입력 읽기
-        input_data = json.load(sys.stdin)
+        input_data = fastjson.loads(sys.stdin.buffer.read())
         add_breadcrumb("Input data loaded", category="input")
-    except json.JSONDecodeError as e:
+    except fastjson.JSONDecodeError as e:
         error_msg = f"Invalid JSON input: {e}"
         sys.stderr.write(f"\n❌ Error: {error_msg}\n")
         sys.stderr.flush()
-        console.print(f"[red]Error: {error_msg}[/]")
+        get_console().print(f"[red]Error: {error_msg}[/]")
 
         capture_exception(e, context={
             "hook": "pattern-enforcer",
@@ -325,7 +384,7 @@ def main():
         error_msg = f"Unexpected error during input processing: {e}"
         sys.stderr.write(f"\n❌ Error: {error_msg}\n")
         sys.stderr.flush()
-        console.print(f"[red]Error: {error_msg}[/]")
+        get_console().print(f"[red]Error: {error_msg}[/]")
 
         capture_exception(e, context={
             "hook": "pattern-enforcer",
@@ -388,21 +447,22 @@ def main():
     if errors:
         add_breadcrumb("Validation errors found, denying", category="validation", level="error", data={"error_count": len(errors)})
 
-        reason = "❌ [코드 패턴 검증 실패]\n\n"
-        reason += "**오류:**\n"
-        for error in errors:
-            reason += f"{error}\n\n"
+        parts = ["❌ [코드 패턴 검증 실패]\n\n", "**오류:**\n"]
+        parts.extend(f"{error}\n\n" for error in errors)
 
         if warnings:
-            reason += "**경고:**\n"
-            for warning in warnings:
-                reason += f"{warning}\n\n"
+            parts.append("**경고:**\n")
+            parts.extend(f"{warning}\n\n" for warning in warnings)
 
-        reason += "\n💡 Backend Skill 문서를 참조하세요:\n"
-        reason += "  .claude/skills/backend/SKILL.md"
+        parts.append("\n💡 Backend Skill 문서를 참조하세요:\n")
+        parts.append("  .claude/skills/backend/SKILL.md")
+        reason = "".join(parts)
 
         output = create_hook_output("deny", reason)
-        print(json.dumps(output))
+        payload = memoryview(fastjson.dumps(output) + b'\n')
+        # fd 1에 직접 출력 (파이프가 일부만 받는 경우를 대비해 반복)
+        while payload:
+            payload = payload[os.write(1, payload):]
 
         flush()
         sys.exit(0)
@@ -411,9 +471,7 @@ def main():
     if warnings:
         add_breadcrumb("Validation warnings found, allowing with notice", category="validation", level="warning", data={"warning_count": len(warnings)})
 
-        reason = "⚠️ [코드 패턴 경고]\n\n"
-        for warning in warnings:
-            reason += f"{warning}\n\n"
+        reason = "⚠️ [코드 패턴 경고]\n\n" + "".join(f"{warning}\n\n" for warning in warnings)
 
         # 경고는 시스템 메시지로만 표시하고 통과
         flush()
@@ -9,12 +9,15 @@ Example Project Pre-Session Hook
 4. 완료 체크리스트
 """
 
+import heapq
 import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from common.config import load_config
@@ -25,6 +28,7 @@ from common.formatting import (
     create_info_table,
     create_rules_table,
 )
+from rich.console import Group
 from rich.panel import Panel
 from rich.padding import Padding
 from rich.table import Table
@@ -33,73 +37,100 @@ from rich import box
 from common.servers import SERVER_CONFIG, get_server_status_internal
 from token_manager import is_continued_session, should_reset_token_usage
 
+# 경로는 한 번만 계산: 이 훅은 <project>/.claude/hook_scripts 에 위치
+CLAUDE_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = CLAUDE_DIR.parent
 
-def detect_work_context() -> str:
+# token_manager와 공유하는 토큰 사용량 파일
+TOKEN_USAGE_PATH = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
+
+# 메시지 문자열에 붙을 수 있는 아이콘 접두사 (정보 테이블에서는 제거)
+ICON_PREFIX_RE = re.compile('[📅🕐📍📁🎯] ')
+
+# 세션 헤더 날짜/시간 표시용 타임존
+HEADER_TZ = ZoneInfo('Asia/Seoul')
+
+# 프로젝트 타입별 특화 규칙 (한 번만 생성)
+PROJECT_RULES: Dict[str, Tuple[str, ...]] = {
+    'python_fastapi': (
+        "FastAPI dependency injection 적극 활용",
+        "Pydantic 스키마 검증 필수 (schemas 패키지)",
+        "Repository/Service 패턴 준수",
+        "mypy strict mode 통과 필수",
+        "Alembic 마이그레이션 동기화 확인",
+    ),
+}
+
+# 작업 컨텍스트 판별 기준 (디렉토리명, 확장자, 파일명)
+FRONTEND_DIRS = frozenset({'app', 'components', 'pages', 'features'})  # React 앱
+FRONTEND_EXTS = frozenset({'.tsx', '.jsx', '.ts', '.css', '.scss'})
+FRONTEND_FILES = ('vite.config', 'tsconfig.json')
+
+BACKEND_DIRS = frozenset({'example_project', 'alembic', 'migrations'})  # 메인 백엔드
+BACKEND_EXTS = frozenset({'.py'})
+BACKEND_FILES = ('pyproject.toml', 'poetry.lock')
+BACKEND_PATH_PARTS = ('tests/integration/', 'tests/unit/')
+
+
+def _scan_work_context() -> str:
     """
     현재 작업 컨텍스트 자동 감지 (frontend/backend).
     git status로 수정된 파일들을 분석하여 판단.
     """
     try:
         # 프로젝트 루트에서 실행하도록 cwd 설정
-        project_root = Path(__file__).parent.parent.parent
-
         result = subprocess.run(
-            ['git', 'status', '--short'],
+            ['git', 'status', '--porcelain=v1', '-z'],
             capture_output=True,
             text=True,
             timeout=5,
-            cwd=str(project_root)
+            cwd=str(PROJECT_ROOT),
+            check=False
         )
 
         if result.returncode != 0:
             return 'backend'  # git 실패시 기본값
 
-        modified_files = result.stdout.strip().split('\n')
-        if not modified_files or modified_files == ['']:
+        entries = result.stdout.split('\0')
+        if not any(entries):
             return 'backend'  # 수정된 파일 없으면 기본값
 
-        # 파일 패턴 분석
-        frontend_indicators = [
-            'app/',  # React 앱
-            'components/',
-            'pages/',
-            'features/',
-            '.tsx', '.jsx', '.ts', '.css', '.scss',
-            'vite.config', 'tsconfig.json'
-        ]
-
-        backend_indicators = [
-            'example_project/',  # 메인 백엔드
-            '.py',
-            'pyproject.toml', 'poetry.lock',
-            'alembic/', 'migrations/',
-            'tests/integration/', 'tests/unit/'
-        ]
-
         frontend_count = 0
         backend_count = 0
 
-        for line in modified_files:
-            if not line.strip():
+        entries_iter = iter(entries)
+        for entry in entries_iter:
+            if len(entry) <= 3:
                 continue
-            # git status 형식: " M path/to/file" 또는 "?? path/to/file"
-            filepath = line[3:].strip() if len(line) > 3 else ''
+            # porcelain -z 형식: "XY path\0" (rename/copy는 원래 경로가 뒤따름)
+            status = entry[:2]
+            if 'R' in status or 'C' in status:
+                next(entries_iter, None)
+            filepath = entry[3:]
 
             # .claude 디렉토리 파일은 스킵
             if '.claude/' in filepath:
                 continue
 
-            for indicator in frontend_indicators:
-                if indicator in filepath:
-                    frontend_count += 1
-                    break
+            dirs = filepath.split('/')
+            filename = dirs.pop()
+            ext = os.path.splitext(filename)[1]
+
+            if (
+                ext in FRONTEND_EXTS
+                or filename.startswith(FRONTEND_FILES)
+                or not FRONTEND_DIRS.isdisjoint(dirs)
+            ):
+                frontend_count += 1
+
+            if (
+                ext in BACKEND_EXTS
+                or filename in BACKEND_FILES
+                or not BACKEND_DIRS.isdisjoint(dirs)
+                or any(part in filepath for part in BACKEND_PATH_PARTS)
+            ):
+                backend_count += 1
 
-            for indicator in backend_indicators:
-                if indicator in filepath:
-                    backend_count += 1
-                    break
-
-        # 프론트엔드 파일이 더 많으면 frontend
         if frontend_count > backend_count:
             return 'frontend'
 
@@ -109,7 +140,7 @@ def detect_work_context() -> str:
         return 'backend'  # 예외 발생시 기본값
 
 
-def detect_environment(config: Dict[str, Any]) -> tuple[str, str]:
+def _probe_environment(config: Dict[str, Any]) -> tuple[str, str]:
     """현재 환경 감지 (Docker/Mac/WSL)"""
     paths = config['project_paths']
 
@@ -138,7 +169,7 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
     messages = config['messages']
 
     # 현재 날짜와 시간 (한국 시간)
-    now = datetime.now(tz=ZoneInfo('Asia/Seoul'))
+    now = datetime.now(tz=HEADER_TZ)
     current_date = now.strftime("%Y-%m-%d (%A)")
     current_time = now.strftime("%H:%M:%S")
 
@@ -147,11 +178,14 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
 
     # 기본 정보 테이블
     info_data = {
-        messages['date_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): current_date,
-        messages['time_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): current_time,
-        messages['environment_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): env,
-        messages['project_path_prefix'].replace('📅 ', '').replace('🕐 ', '').replace('📍 ', '').replace('📁 ', ''): project_path,
-        messages['work_context_prefix'].replace('🎯 ', ''): work_context.upper(),
+        ICON_PREFIX_RE.sub('', messages[key]): value
+        for key, value in (
+            ('date_prefix', current_date),
+            ('time_prefix', current_time),
+            ('environment_prefix', env),
+            ('project_path_prefix', project_path),
+            ('work_context_prefix', work_context.upper()),
+        )
     }
     table = create_info_table(info_data)
     console.print(table)
@@ -170,16 +204,24 @@ def print_header(config: Dict[str, Any], env: str, project_path: str, work_conte
     server_table.add_column("Status", justify="center")
     server_table.add_column("PID", justify="right")
 
+    # 모든 서버 상태를 병렬로 조회 (행 순서는 SERVER_CONFIG 순서 유지)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = {
+            (category, server_type): executor.submit(get_server_status_internal, category, server_type)
+            for category in ("backend", "frontend")
+            for server_type in SERVER_CONFIG[category]
+        }
+
     # Backend servers
     for backend_type, config in SERVER_CONFIG["backend"].items():
-        is_running, _, pid = get_server_status_internal("backend", backend_type)
+        is_running, _, pid = statuses[("backend", backend_type)].result()
         status = "[green]RUNNING[/]" if is_running else "[yellow]STOPPED[/]"
         pid_str = str(pid) if pid else "-"
         server_table.add_row("Backend", backend_type, str(config["port"]), status, pid_str)
 
     # Frontend servers
     for frontend_type, config in SERVER_CONFIG["frontend"].items():
-        is_running, _, pid = get_server_status_internal("frontend", frontend_type)
+        is_running, _, pid = statuses[("frontend", frontend_type)].result()
         status = "[green]RUNNING[/]" if is_running else "[yellow]STOPPED[/]"
         pid_str = str(pid) if pid else "-"
         server_table.add_row("Frontend", frontend_type, str(config["port"]), status, pid_str)
@@ -253,19 +295,7 @@ def get_project_specific_rules(config: Dict[str, Any]) -> list[str]:
     프로젝트 타입별 특화 규칙 반환.
     모노레포 환경에서 백엔드/프론트엔드 모두 지원.
     """
-    project_type = config.get('project_type', '')
-    rules = []
-
-    if project_type == 'python_fastapi':
-        rules.extend([
-            "FastAPI dependency injection 적극 활용",
-            "Pydantic 스키마 검증 필수 (schemas 패키지)",
-            "Repository/Service 패턴 준수",
-            "mypy strict mode 통과 필수",
-            "Alembic 마이그레이션 동기화 확인",
-        ])
-
-    return rules
+    return list(PROJECT_RULES.get(config.get('project_type', ''), ()))
 
 
 def print_guidelines(config: Dict[str, Any]) -> None:
@@ -493,37 +523,49 @@ def get_current_token_usage() -> Optional[int]:
             pass
 
     # Try temporary file
-    token_file = Path('/tmp/claude-token-usage.txt')
-    if token_file.exists():
-        try:
-            content = token_file.read_text().strip()
-            return int(content)
-        except (ValueError, OSError):
-            pass
+    try:
+        with open('/tmp/claude-token-usage.txt', 'rb') as f:
+            return int(f.read().strip())
+    except (ValueError, OSError):
+        pass
 
     return None
 
 
-def print_token_status(config: Dict[str, Any]) -> None:
+def _usage_bar(completed: int, total: int, color: str) -> Table:
+    """정적 사용량 바 행: 들여쓰기, 40칸 바, 퍼센트"""
+    from rich.progress_bar import ProgressBar
+
+    row = Table.grid(padding=(0, 1))
+    row.add_row(
+        "  ",
+        ProgressBar(total=total, completed=completed, width=40, complete_style=color),
+        f"[progress.percentage]{min(100.0, completed * 100 / total):>3.0f}%"
+    )
+    return row
+
+
+def print_token_status(config: Dict[str, Any]) -> bool:
     """
     토큰 사용량 상태 표시 (JSON 기반).
 
     - 현재 세션 토큰
     - 전체 누적 토큰
     - 경고 및 리셋 가이드
-    """
-    import json
 
+    섹션을 출력했으면 True 반환.
+    """
     # token-usage.json 로드
-    usage_path = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
+    usage_path = TOKEN_USAGE_PATH
     if not usage_path.exists():
-        return
+        return False
+
+    from common import fastjson
 
     try:
-        with open(usage_path, 'r') as f:
-            usage_data = json.load(f)
+        usage_data = fastjson.load_file(usage_path)
     except Exception:
-        return
+        return False
 
     # token-limits.json 로드
     try:
@@ -535,14 +577,14 @@ def print_token_status(config: Dict[str, Any]) -> None:
         }
 
     if not limits_config.get('enabled', True):
-        return
+        return False
 
     # 현재 세션 정보
     current_session_id = usage_data.get('current_session', '')
     sessions = usage_data.get('sessions', {})
 
     if current_session_id not in sessions:
-        return
+        return False
 
     session_data = sessions[current_session_id]
     current_tokens = session_data.get('tokens', 0)
@@ -559,72 +601,66 @@ def print_token_status(config: Dict[str, Any]) -> None:
     total_critical = total_limits.get('critical', 500000)
 
     # 경고 레벨 판단
-    show_warning = False
-    is_critical = False
+    session_over_critical = current_tokens >= session_critical
+    session_over_warning = current_tokens >= session_warning
+    total_over_critical = total_accumulated >= total_critical
+    total_over_warning = total_accumulated >= total_warning
 
-    if current_tokens >= session_critical or total_accumulated >= total_critical:
-        is_critical = True
+    is_critical = session_over_critical or total_over_critical
+    if is_critical:
         show_warning = display.get('show_on_critical', True)
-    elif current_tokens >= session_warning or total_accumulated >= total_warning:
+    elif session_over_warning or total_over_warning:
         show_warning = display.get('show_on_warning', True)
+    else:
+        show_warning = False
 
     if not show_warning:
-        return
+        return False
 
     # 표시
-    from rich.progress import Progress, BarColumn, TextColumn
-    from rich.panel import Panel
-
     style = "red bold" if is_critical else "yellow"
     title = "🚨 토큰 사용량 경고" if is_critical else "⚠️  토큰 사용량 알림"
 
     print_rule(title, style=style)
-    console.print()
-
-    # 세션 프로그레스
-    session_pct = min(100, int(current_tokens * 100 / session_critical))
-    session_color = "red" if current_tokens >= session_critical else "yellow" if current_tokens >= session_warning else "green"
 
-    console.print(f"  [bold]현재 세션:[/bold] {current_tokens:,} / {session_critical:,} tokens ({session_pct}%)")
+    # 섹션 전체를 모아 한 번에 출력
+    renderables: list = [""]
 
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40, complete_style=session_color),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("", total=session_critical, completed=current_tokens)
+    # 세션 프로그레스
+    session_pct = 100 if session_over_critical else current_tokens * 100 // session_critical
+    session_color = "red" if session_over_critical else "yellow" if session_over_warning else "green"
 
-    console.print()
+    renderables.extend([
+        f"  [bold]현재 세션:[/bold] {current_tokens:,} / {session_critical:,} tokens ({session_pct}%)",
+        _usage_bar(current_tokens, session_critical, session_color),
+        ""
+    ])
 
     # 전체 누적 프로그레스
-    total_pct = min(100, int(total_accumulated * 100 / total_critical))
-    total_color = "red" if total_accumulated >= total_critical else "yellow" if total_accumulated >= total_warning else "green"
-
-    console.print(f"  [bold]전체 누적:[/bold] {total_accumulated:,} / {total_critical:,} tokens ({total_pct}%)")
+    total_pct = 100 if total_over_critical else total_accumulated * 100 // total_critical
+    total_color = "red" if total_over_critical else "yellow" if total_over_warning else "green"
 
-    with Progress(
-        TextColumn("  "),
-        BarColumn(bar_width=40, complete_style=total_color),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-        task = progress.add_task("", total=total_critical, completed=total_accumulated)
-
-    console.print()
+    renderables.extend([
+        f"  [bold]전체 누적:[/bold] {total_accumulated:,} / {total_critical:,} tokens ({total_pct}%)",
+        _usage_bar(total_accumulated, total_critical, total_color),
+        ""
+    ])
 
     # 리셋 가이드
-    if is_critical or total_accumulated >= total_warning:
-        console.print(Panel(
+    if is_critical or total_over_warning:
+        renderables.append(Panel(
             "[yellow]💡 토큰을 리셋하려면:[/yellow]\n"
             "  • 자연어: [cyan]\"토큰 리셋해줘\"[/cyan] 또는 [cyan]\"토큰 초기화\"[/cyan]\n"
             "  • CLI: [cyan]python3 .claude/hook_scripts/reset_tokens.py[/cyan]",
             border_style="yellow",
             padding=(0, 1)
         ))
-        console.print()
+        renderables.append("")
+
+    console.print(Group(*renderables))
 
     print_rule("", style="dim")
+    return True
 
 
 # ====================================================================================================
@@ -639,52 +675,66 @@ def check_context_recovery_needed() -> Dict[str, Any]:
     신규 세션에서 복구 가능한 컨텍스트 데이터를 확인.
     압축 파일, 백업 파일 등을 감지하여 복구 옵션 반환.
     """
-    project_root = Path(__file__).parent.parent.parent
-    recovery_dir = project_root / ".claude" / "recovery"
-    backup_dir = project_root / ".claude" / "backups"
+    recovery_dir = CLAUDE_DIR / "recovery"
+    backup_dir = CLAUDE_DIR / "backups"
 
     recovery_options: Dict[str, Any] = {
         "has_recovery": False,
         "compressed_file": None,
         "latest_backup": None,
-        "backup_files": []
+        "backup_files": [],
+        "compact_recovery_data": None
     }
 
+    # One readdir of .claude tells which of recovery/ and backups/ exist
+    try:
+        with os.scandir(CLAUDE_DIR) as it:
+            subdirs = {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
+        return recovery_options
+
+    compact_recovery = recovery_dir / "compact-recovery.json"
     compact_recovery_exists = False
 
     # 1. Check for compressed context data
-    if recovery_dir.exists():
-        compact_recovery = recovery_dir / "compact-recovery.json"
-        if compact_recovery.exists():
-            compact_recovery_exists = True
-            # Check if recovery has already been completed
-            try:
-                import json
-                with open(compact_recovery, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-
-                # Only show guidance if NOT already recovered
-                if not state.get('recovered', False):
-                    recovery_options["has_recovery"] = True
-                    recovery_options["compressed_file"] = str(compact_recovery)
-            except Exception:
-                # If can't read file, assume recovery needed
+    # Check if recovery has already been completed
+    if "recovery" in subdirs:
+        compact_recovery_exists = True
+        try:
+            from common import fastjson
+            with open(compact_recovery, 'rb') as f:
+                state = fastjson.loads(f.read())
+            recovery_options["compact_recovery_data"] = state
+
+            # Only show guidance if NOT already recovered
+            if not state.get('recovered', False):
                 recovery_options["has_recovery"] = True
                 recovery_options["compressed_file"] = str(compact_recovery)
+        except (FileNotFoundError, NotADirectoryError):
+            compact_recovery_exists = False
+        except Exception:
+            # If can't read file, assume recovery needed
+            recovery_options["has_recovery"] = True
+            recovery_options["compressed_file"] = str(compact_recovery)
 
     # 2. Check for backup files ONLY if compact-recovery.json does NOT exist
-    if not compact_recovery_exists and backup_dir.exists():
-        # Find all conversation backup files
-        backup_files = sorted(
-            backup_dir.glob("conversation_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True  # Most recent first
-        )
+    if not compact_recovery_exists and "backups" in subdirs:
+        # Find all conversation backup files (DirEntry.stat() reuses the scandir result)
+        entries = []
+        try:
+            with os.scandir(backup_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('conversation_') and name.endswith('.json'):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        latest = heapq.nlargest(5, entries)  # Top 5 most recent, newest first
 
-        if backup_files:
+        if latest:
             recovery_options["has_recovery"] = True
-            recovery_options["latest_backup"] = str(backup_files[0])
-            recovery_options["backup_files"] = [str(f) for f in backup_files[:5]]  # Top 5 most recent
+            recovery_options["latest_backup"] = latest[0][1]
+            recovery_options["backup_files"] = [path for _, path in latest]
 
     return recovery_options
 
@@ -700,7 +750,6 @@ def print_context_recovery_guidance(recovery_options: Dict[str, Any]):
         return  # No recovery options available, skip
 
     print_rule("Step 1: 컨텍스트 복구 확인", style="bold cyan")
-    console.print()
 
     # Priority message for Claude
     priority_msg = """[bold yellow]
@@ -710,9 +759,6 @@ Claude 자동 생성 영문 요약보다 아래 내용을 우선하세요
 ================================================================================
 [/bold yellow]"""
 
-    console.print(priority_msg)
-    console.print()
-
     # Build recovery guidance content
     guidance_lines = []
 
@@ -725,19 +771,14 @@ Claude 자동 생성 영문 요약보다 아래 내용을 우선하세요
         )
         guidance_lines.append("")
 
-    # Check for compact-recovery.json (saved context from critical token state)
-    compact_recovery = Path(".claude/recovery/compact-recovery.json")
-    if compact_recovery.exists():
+    # compact-recovery.json (saved context from critical token state), already parsed by check_context_recovery_needed
+    recovery_data = recovery_options.get("compact_recovery_data")
+    if isinstance(recovery_data, dict):
         try:
-            import json
-            with open(compact_recovery, 'r') as f:
-                recovery_data = json.load(f)
-
             timestamp = recovery_data.get('timestamp', '')
             summary_length = recovery_data.get('summary_length', 0)
 
             if timestamp and summary_length > 0:
-                from datetime import datetime
                 saved_time = datetime.fromisoformat(timestamp)
                 time_diff = datetime.now() - saved_time
                 hours_ago = int(time_diff.total_seconds() / 3600)
@@ -795,16 +836,21 @@ Claude 자동 생성 영문 요약보다 아래 내용을 우선하세요
 
     guidance_content = "\n".join(guidance_lines)
 
-    # Display guidance panel
+    # Priority message and guidance panel in a single print
     console.print(
-        Panel(
-            guidance_content,
-            title="[bold green]컨텍스트 복구 안내[/bold green]",
-            border_style="green",
-            padding=(1, 2),
+        Group(
+            "",
+            priority_msg,
+            "",
+            Panel(
+                guidance_content,
+                title="[bold green]컨텍스트 복구 안내[/bold green]",
+                border_style="green",
+                padding=(1, 2),
+            ),
+            ""
         )
     )
-    console.print()
 
 
 def main():
@@ -821,11 +867,12 @@ def main():
         # ========================================
         if should_reset_token_usage():
             # 새 세션 시작 - token-usage.json 초기화
-            import json
-            from datetime import datetime, UTC
+            from datetime import UTC
+            from common import fastjson
 
-            usage_path = Path.home() / '.claude' / 'sessions' / 'token-usage.json'
-            usage_path.parent.mkdir(parents=True, exist_ok=True)
+            usage_path = TOKEN_USAGE_PATH
+            if not usage_path.parent.is_dir():
+                usage_path.parent.mkdir(parents=True, exist_ok=True)
 
             new_data = {
                 "current_session": "",
@@ -835,8 +882,9 @@ def main():
                 "reset_count": 0
             }
 
-            with open(usage_path, 'w') as f:
-                json.dump(new_data, f, indent=2)
+            tmp_path = usage_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(fastjson.dumps(new_data, indent=True))
+            os.replace(tmp_path, usage_path)
 
             if logger:
                 logger.log_info("새 세션 감지 - token-usage.json 초기화 완료")
@@ -852,10 +900,10 @@ def main():
             )
 
         # 환경 감지
-        env, project_path = detect_environment(config)
+        env, project_path = _probe_environment(config)
 
         # 작업 컨텍스트 자동 감지
-        work_context = detect_work_context()
+        work_context = _scan_work_context()
 
         if logger:
             logger.log_info(
@@ -865,53 +913,55 @@ def main():
                 work_context=work_context
             )
 
-        # ========================================
-        # Step 1: 컨텍스트 복구 확인
-        # ========================================
-        recovery_options = check_context_recovery_needed()
-        if recovery_options["has_recovery"]:
-            print_context_recovery_guidance(recovery_options)
-
-            if logger:
-                logger.log_info(
-                    "컨텍스트 복구 안내 표시 완료",
-                    has_compressed=recovery_options["compressed_file"] is not None,
-                    has_backup=recovery_options["latest_backup"] is not None,
-                    backup_count=len(recovery_options["backup_files"])
-                )
-
-        # ========================================
-        # Step 2: 프로젝트 정보 및 작업 가이드
-        # ========================================
-        # Step 1이 출력되지 않았을 때만 Step 2 헤더 출력
-        if recovery_options["has_recovery"]:
-            print_rule("Step 2: 프로젝트 정보 및 작업 가이드", style="bold cyan")
-            console.print()
-
-        # 토큰 상태 표시 (warning 이상일 때만)
-        print_token_status(config)
-
-        # 세션 시작 정보 출력
-        print_header(config, env, project_path, work_context)
-        print_mcp_priority(config)  # MCP 도구 우선순위
-        print_context_search_guide(config)  # ChromaDB 자동 검색 트리거
-        print_guidelines(config)  # 동적 guidelines + 프로젝트 특화 규칙
-        print_work_rules(config)
-        print_code_style_rules(config)
-        print_completion_checklist(config)
-        print_footer(config)
+        # 전체 배너를 콘솔 버퍼에 모아 한 번에 출력
+        with console:
+            # ========================================
+            # Step 1: 컨텍스트 복구 확인
+            # ========================================
+            recovery_options = check_context_recovery_needed()
+            if recovery_options["has_recovery"]:
+                print_context_recovery_guidance(recovery_options)
+
+                if logger:
+                    logger.log_info(
+                        "컨텍스트 복구 안내 표시 완료",
+                        has_compressed=recovery_options["compressed_file"] is not None,
+                        has_backup=recovery_options["latest_backup"] is not None,
+                        backup_count=len(recovery_options["backup_files"])
+                    )
+
+            # ========================================
+            # Step 2: 프로젝트 정보 및 작업 가이드
+            # ========================================
+            # Step 1이 출력되지 않았을 때만 Step 2 헤더 출력
+            if recovery_options["has_recovery"]:
+                print_rule("Step 2: 프로젝트 정보 및 작업 가이드", style="bold cyan")
+                console.print()
+
+            # 토큰 상태 표시 (warning 이상일 때만)
+            token_status_printed = print_token_status(config)
+
+            # 세션 시작 정보 출력
+            print_header(config, env, project_path, work_context)
+            print_mcp_priority(config)  # MCP 도구 우선순위
+            print_context_search_guide(config)  # ChromaDB 자동 검색 트리거
+            print_guidelines(config)  # 동적 guidelines + 프로젝트 특화 규칙
+            print_work_rules(config)
+            print_code_style_rules(config)
+            print_completion_checklist(config)
+            print_footer(config)
 
         if logger:
             logger.log_end(
                 success=True,
                 sections_printed=[
                     "context_recovery" if recovery_options["has_recovery"] else None,
-                    "token_status" if get_current_token_usage() else None,
+                    "token_status" if token_status_printed else None,
                     "header",
                     "mcp_priority" if config.get('mcp_tools_priority') else None,
                     "context_search" if config['context_search']['enabled'] else None,
                     "guidelines" if config.get('guidelines') else None,
-                    "project_rules" if get_project_specific_rules(config) else None,
+                    "project_rules" if config.get('project_type', '') in PROJECT_RULES else None,
                     "work_rules" if config.get('work_rules') else None,
                     "code_style_rules" if config.get('code_style_rules') else None,
                     "checklist" if config.get('completion_checklist') else None,
@@ -11,8 +11,8 @@ Usage:
     python .claude/session-start.py
 """
 
+import importlib
 import os
-import subprocess
 import sys
 from pathlib import Path
 
@@ -26,22 +26,11 @@ def clear_terminal() -> None:
         # Termius 같은 SSH 클라이언트에서는 서버 측에서 클라이언트
         # 스크롤백을 완전히 제어하기 어렵지만 최선을 다함
 
-        if os.name == 'posix':
-            # 방법 1: reset 명령어 (tput reset보다 강력)
-            # 완전한 터미널 재초기화
-            os.system('reset 2>/dev/null || tput reset 2>/dev/null || clear 2>/dev/null')
-
-            # 방법 2: 여러 ANSI escape codes 조합
-            # RIS (Reset to Initial State) - 가장 강력한 리셋
-            # print("\033c", end='', flush=True)
-
-            # 스크롤백 버퍼 클리어 시퀀스들
-            print("\033[3J", end='', flush=True)  # 스크롤백 버퍼 클리어
-            # print("\033[2J", end='', flush=True)  # 화면 클리어
-            # print("\033[H", end='', flush=True)   # 커서 홈으로
-
-            # 추가: Erase Saved Lines (일부 터미널에서 지원)
-            # print("\033[3J\033[1;1H", end='', flush=True)
+        if sys.stdout.isatty():
+            # reset/tput/clear 프로세스 대신 escape sequence 직접 출력
+            # RIS (Reset to Initial State) + 스크롤백 버퍼 클리어 + 화면 클리어 + 커서 홈
+            sys.stdout.write("\033c\033[3J\033[2J\033[H")
+            sys.stdout.flush()
 
     except Exception:
         pass  # 실패해도 세션 시작 방해하지 않음
@@ -52,6 +41,29 @@ def get_script_dir() -> Path:
     return Path(__file__).parent
 
 
+def _has_any_recovery_artifacts() -> bool:
+    """context_recovery_helper가 읽는 .claude 디렉토리에 복구 상태나 백업이 있는지 확인"""
+    # context_recovery_helper의 후보 디렉토리 + 현재 프로젝트
+    claude_dirs = [str(get_script_dir().parent)]
+    project_dir = os.environ.get('CLAUDE_PROJECT_DIR')
+    if project_dir:
+        claude_dirs.append(os.path.join(project_dir, '.claude'))
+    claude_dirs.append(os.path.join(os.getcwd(), '.claude'))
+    claude_dirs.append(os.path.join(os.path.expanduser('~'), '.claude'))
+
+    for claude_dir in dict.fromkeys(claude_dirs):
+        if os.path.isfile(os.path.join(claude_dir, 'recovery', 'compact-recovery.json')):
+            return True
+        try:
+            with os.scandir(os.path.join(claude_dir, 'backups')) as it:
+                if any(entry.name.startswith('conversation_') for entry in it):
+                    return True
+        except OSError:
+            pass
+
+    return False
+
+
 def run_script(script_name: str, description: str, logger=None) -> bool:
     """
     스크립트 실행
@@ -81,30 +93,26 @@ def run_script(script_name: str, description: str, logger=None) -> bool:
     # (context_recovery_helper는 자체 출력 처리)
 
     try:
-        # capture_output=True로 변경하여 Claude Code가 출력을 캡처할 수 있도록 함
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            check=False,
-            capture_output=True,
-            text=True
-        )
-
-        # stdout을 직접 출력 (Claude Code가 이를 캡처함)
-        if result.stdout:
-            print(result.stdout, end='', flush=True)
-
-        # stderr도 출력 (경고/에러 메시지)
-        if result.stderr:
-            print(result.stderr, end='', file=sys.stderr, flush=True)
-
-        if result.returncode != 0:
+        # 새 인터프리터를 띄우지 않고 현재 프로세스에서 main() 실행
+        # (훅의 sys.exit()는 종료 코드로 처리)
+        module = importlib.import_module(script_path.stem)
+        try:
+            module.main()
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        if returncode != 0:
             error_msg = f"{script_name} 실행 중 오류 발생 (계속 진행)"
             console.print(f"\n[yellow][WARNING] {error_msg}[/yellow]")
             if logger:
-                logger.log_error(error_msg, script=script_name, returncode=result.returncode)
+                logger.log_error(error_msg, script=script_name, returncode=returncode)
         else:
             if logger:
-                logger.log_info(f"스크립트 실행 완료", script=script_name, returncode=result.returncode)
+                logger.log_info(f"스크립트 실행 완료", script=script_name, returncode=returncode)
 
         return True
 
@@ -130,12 +138,15 @@ def main():
             except Exception:
                 pass
 
-        # 1. Context Recovery Helper 실행
-        run_script(
-            "context_recovery_helper.py",
-            "Step 1: 컨텍스트 복구 확인",
-            logger
-        )
+        # 1. Context Recovery Helper 실행 (복구 파일이 없으면 생략)
+        if _has_any_recovery_artifacts():
+            run_script(
+                "context_recovery_helper.py",
+                "Step 1: 컨텍스트 복구 확인",
+                logger
+            )
+        elif logger:
+            logger.log_info("복구 파일 없음 - Context Recovery Helper 생략")
 
         # 2. Pre-Session Hook 실행
         run_script(
@@ -6,20 +6,86 @@ Prevents incorrect dates in documentation, commits, and changelogs.
 Can be used as a pre-commit hook or standalone validator.
 """
 import json
+import mmap
+import os
 import re
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Union
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
 
-console = Console(stderr=True)
+# Directories never descended into when walking the project
+EXCLUDE_DIRS = frozenset({'node_modules', '.git', '__pycache__', '.venv', 'venv'})
 
+# Files larger than this are skipped (generated or binary-like content)
+MAX_FILE_BYTES = 5 * 1024 * 1024
 
+# Files at least this large are scanned through mmap as bytes instead of decoded
+MMAP_THRESHOLD = 64 * 1024
+
+# Any non-ASCII byte sends a large file through the strict UTF-8 decode instead
+_NON_ASCII = re.compile(rb'[\x80-\xff]')
+
+# Every supported date format contains a four-digit year
+_DATE_PREFILTER = re.compile(rb'\d{4}')
+
+# Supported date formats: named group and regex for each strptime format
+DATE_FORMAT_PATTERNS = {
+    "%Y-%m-%d": ('iso', r'\d{4}-\d{1,2}-\d{1,2}'),
+    "%m/%d/%Y": ('us', r'\d{1,2}/\d{1,2}/\d{4}'),
+    "%d.%m.%Y": ('eu', r'\d{1,2}\.\d{1,2}\.\d{4}'),
+    "%B %d, %Y": ('long', r'\w+ \d{1,2}, \d{4}'),
+}
+
+
+def _parse_ymd(date_str: str) -> datetime:
+    year, month, day = date_str.split('-')
+    return datetime(int(year), int(month), int(day))
+
+
+def _parse_mdy(date_str: str) -> datetime:
+    month, day, year = date_str.split('/')
+    return datetime(int(year), int(month), int(day))
+
+
+def _parse_dmy(date_str: str) -> datetime:
+    day, month, year = date_str.split('.')
+    return datetime(int(year), int(month), int(day))
+
+
+# Numeric formats skip strptime's format interpretation; others fall back to it
+_FAST_DATE_PARSERS = {
+    "%Y-%m-%d": _parse_ymd,
+    "%m/%d/%Y": _parse_mdy,
+    "%d.%m.%Y": _parse_dmy,
+}
+
+
+def parse_date(date_str: str, date_format: str) -> datetime:
+    """
+    Parse a date string, using a specialized parser when one exists.
+    전용 파서가 있으면 사용해 날짜 문자열 파싱.
+
+    Raises:
+        ValueError: If the string does not form a valid date
+    """
+    parser = _FAST_DATE_PARSERS.get(date_format)
+    if parser is not None:
+        return parser(date_str)
+    return datetime.strptime(date_str, date_format)
+
+
+@cache
+def get_console():
+    """Rich stderr console (rich is imported only when there is something to report)"""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@cache
 def load_git_hooks_config() -> Dict[str, Any]:
     """
     Load git-hooks.json configuration file.
@@ -31,12 +97,11 @@ def load_git_hooks_config() -> Dict[str, Any]:
     ]
 
     for candidate in candidates:
-        if candidate.exists():
-            try:
-                with open(candidate, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                continue
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
 
     # Default fallback configuration
     return {
@@ -82,85 +147,127 @@ class TimestampValidator:
         self.max_date_offset_days = timestamp_config.get('max_date_offset_days', 30)
         date_formats = timestamp_config.get('date_formats', [])
 
-        # Build validate file patterns from extensions
-        self.validate_files = [r'CHANGELOG.*', r'docs/.*', r'.*README.*']
-        for ext in validate_extensions:
-            self.validate_files.append(r'.*\{ext}$'.replace('{ext}', re.escape(ext)))
+        # Date bounds stay fixed for the validator's lifetime
+        self._min_date = self.current_date + timedelta(days=self.min_date_offset_days)
+        self._max_date = self.current_date + timedelta(days=self.max_date_offset_days)
+        self._current_date_date = self.current_date.date()
+        self._year_ago_date = self._current_date_date - timedelta(days=365)
+        self._today_str = self.current_date.strftime('%Y-%m-%d')
 
-        # Add special files
-        for special_file in special_files:
-            self.validate_files.append(re.escape(special_file))
+        # Memoized is_date_reasonable results keyed by (date_str, date_format)
+        self._reasonable_cache: Dict[Tuple[str, str], bool] = {}
 
-        # Exclude patterns (hardcoded as they are environment-specific)
-        self.exclude_files = [
-            r'node_modules/', r'\.git/', r'__pycache__/', r'\.venv/', r'venv/'
-        ]
+        # Include test is plain string work on the project-relative path: extension
+        # suffix, README anywhere, or a top-level CHANGELOG*/docs/special file
+        self._valid_extensions = tuple(validate_extensions)
+        self._root_prefixes = ('CHANGELOG', 'docs/', *special_files)
 
-        # Build date patterns from config
-        self.date_patterns = []
+        # Exclude patterns (hardcoded as they are environment-specific)
+        exclude_files = [r'node_modules/', r'\.git/', r'__pycache__/', r'\.venv/', r'venv/']
+        self._exclude_re = re.compile('|'.join(exclude_files))
+
+        # Fuse configured date patterns into one lookahead alternation (single scan per
+        # content). The lookahead consumes nothing, so a date overlapping another
+        # format's match (e.g. the year of "Sprint 3, 2019-05-01") is still found
+        self._group_to_format: Dict[str, str] = {}
+        alternatives = []
         for date_format in date_formats:
-            if date_format == "%Y-%m-%d":
-                self.date_patterns.append((date_format, r'\d{4}-\d{2}-\d{2}'))
-                self.date_patterns.append((date_format, r'\d{4}-\d{1,2}-\d{1,2}'))
-            elif date_format == "%m/%d/%Y":
-                self.date_patterns.append((date_format, r'\d{1,2}/\d{1,2}/\d{4}'))
-            elif date_format == "%d.%m.%Y":
-                self.date_patterns.append((date_format, r'\d{1,2}\.\d{1,2}\.\d{4}'))
-            elif date_format == "%B %d, %Y":
-                self.date_patterns.append((date_format, r'\w+ \d{1,2}, \d{4}'))
+            if date_format not in DATE_FORMAT_PATTERNS:
+                continue
+            group, pattern = DATE_FORMAT_PATTERNS[date_format]
+            if group in self._group_to_format:
+                continue
+            self._group_to_format[group] = date_format
+            alternatives.append(f'(?P<{group}>{pattern})')
+        fused = f"(?={'|'.join(alternatives)})"
+        self.date_pattern = re.compile(fused) if alternatives else None
+        self.date_pattern_bytes = re.compile(fused.encode('ascii')) if alternatives else None
+
+        self.changelog_pattern = re.compile(r'CHANGELOG', re.IGNORECASE)
+        self.version_pattern = re.compile(r'## \[[\d.]+\] - (\d{4}-\d{2}-\d{2})')
+        self.version_pattern_bytes = re.compile(self.version_pattern.pattern.encode('ascii'))
 
     def is_date_reasonable(self, date_str: str, date_format: str) -> bool:
         """
         Check if date is within reasonable range.
         날짜가 합리적인 범위인지 확인.
         """
-        try:
-            date_obj = datetime.strptime(date_str, date_format)
-
-            # Use configured date offsets
-            min_date = self.current_date + timedelta(days=self.min_date_offset_days)
-            max_date = self.current_date + timedelta(days=self.max_date_offset_days)
+        key = (date_str, date_format)
+        cached = self._reasonable_cache.get(key)
+        if cached is not None:
+            return cached
 
-            return min_date <= date_obj <= max_date
+        try:
+            date_obj = parse_date(date_str, date_format)
+            result = self._min_date <= date_obj <= self._max_date
         except ValueError:
-            return True  # 파싱 실패 시 건너뛰기
+            result = True  # 파싱 실패 시 건너뛰기
+
+        self._reasonable_cache[key] = result
+        return result
 
-    def find_dates_in_content(self, content: str) -> List[Tuple[str, str]]:
+    def find_dates_in_content(self, content: Union[str, bytes, mmap.mmap]) -> Iterator[Tuple[str, str]]:
         """
         Find all date patterns in content.
         콘텐츠에서 모든 날짜 패턴 찾기.
         """
-        found_dates = []
-        for date_format, pattern in self.date_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                found_dates.append((match, date_format))
-        return found_dates
-
-    def validate_changelog(self, content: str, filepath: str) -> List[str]:
+        if self.date_pattern is None:
+            return
+
+        is_text = isinstance(content, str)
+        pattern = self.date_pattern if is_text else self.date_pattern_bytes
+        seen = set()
+        # Per-format scan position: like a separate findall per format, a format's
+        # matches never overlap each other. Zero-padded ISO dates keep their own
+        # position, since a greedy loose ISO match can swallow the start of one
+        # ("2026-1-62026-06-22")
+        next_start = dict.fromkeys((*self._group_to_format, 'iso_padded'), 0)
+        for match in pattern.finditer(content):
+            group = match.lastgroup
+            start, end = match.span(group)
+            is_new = start >= next_start[group]
+            is_new_padded = group == 'iso' and end - start == 10 and start >= next_start['iso_padded']
+            if not (is_new or is_new_padded):
+                continue
+            if is_new:
+                next_start[group] = end
+            if is_new_padded:
+                next_start['iso_padded'] = end
+
+            # Byte patterns only match ASCII, so matched dates decode trivially
+            date_str = match.group(group) if is_text else match.group(group).decode('ascii')
+            found = (date_str, self._group_to_format[group])
+            # Repeated dates are yielded once, in first-seen order
+            if found not in seen:
+                seen.add(found)
+                yield found
+
+    def validate_changelog(self, content: Union[str, bytes, mmap.mmap], filepath: str) -> List[str]:
         """CHANGELOG 파일 검증"""
         warnings = []
 
-        if not re.search(r'CHANGELOG', filepath, re.IGNORECASE):
+        if not self.changelog_pattern.search(filepath):
             return warnings
 
         # 버전 헤더 날짜 패턴: ## [version] - YYYY-MM-DD
-        version_pattern = r'## \[[\d.]+\] - (\d{4}-\d{2}-\d{2})'
-        matches = re.findall(version_pattern, content)
+        is_text = isinstance(content, str)
+        pattern = self.version_pattern if is_text else self.version_pattern_bytes
 
-        for date_str in matches:
+        for match in pattern.finditer(content):
+            date_str = match.group(1) if is_text else match.group(1).decode('ascii')
             try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+                # Version headers are strict YYYY-MM-DD, which the C ISO parser handles
+                date_obj = date.fromisoformat(date_str)
 
                 # 미래 날짜 체크
-                if date_obj.date() > self.current_date.date():
+                if date_obj > self._current_date_date:
                     warnings.append(
                         f"[DATE] CHANGELOG: 미래 날짜 '{date_str}' 발견. "
-                        f"오늘 날짜 사용: {self.current_date.strftime('%Y-%m-%d')}"
+                        f"오늘 날짜 사용: {self._today_str}"
                     )
 
                 # 너무 오래된 날짜 체크 (1년 이상 전)
-                if date_obj < self.current_date - timedelta(days=365):
+                if date_obj < self._year_ago_date:
                     warnings.append(
                         f"[DATE] CHANGELOG: 매우 오래된 날짜 '{date_str}'. "
                         "실수는 아닌가요?"
@@ -170,28 +277,71 @@ class TimestampValidator:
 
         return warnings
 
+    def should_validate(self, filepath: str) -> bool:
+        """
+        검증 대상 파일인지 확인 (포함 조건 후 제외 패턴).
+
+        filepath는 프로젝트 루트 기준 상대 경로이므로 CHANGELOG*, docs/,
+        special files는 최상위에서만 일치합니다.
+        """
+        included = (
+            os.path.basename(filepath).endswith(self._valid_extensions)
+            or filepath.startswith(self._root_prefixes)
+            or 'README' in filepath
+        )
+        return included and not self._exclude_re.search(filepath)
+
     def validate_file_content(self, filepath: str) -> List[str]:
         """파일 내용 검증"""
-        warnings = []
-
         # Check if validation is enabled
         if not self.enabled:
-            return warnings
+            return []
+
+        # 검증 대상 파일인지 확인 (제외 패턴 포함)
+        if not self.should_validate(filepath):
+            return []
+
+        return self._validate_file(filepath)
 
-        # 검증 대상 파일인지 확인
-        if not any(re.match(pattern, filepath) for pattern in self.validate_files):
+    def _validate_file(self, filepath: str) -> List[str]:
+        """대상 확인을 이미 통과한 파일의 내용 검증"""
+        warnings = []
+
+        try:
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MAX_FILE_BYTES:
+                    return warnings
+
+                # Large ASCII files are scanned in place instead of copied into a str:
+                # ASCII is valid UTF-8 and byte patterns match it as str patterns would
+                if size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if _DATE_PREFILTER.search(mm) is None:
+                            return warnings
+                        if _NON_ASCII.search(mm) is None:
+                            return self._validate_content(mm, filepath)
+                        raw = mm[:]
+                else:
+                    raw = f.read()
+        except (FileNotFoundError, PermissionError):
             return warnings
 
-        # 제외 파일인지 확인
-        if any(re.search(pattern, filepath) for pattern in self.exclude_files):
+        # No four-digit run means no date candidates: skip decoding and scanning
+        if _DATE_PREFILTER.search(raw) is None:
             return warnings
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except (FileNotFoundError, UnicodeDecodeError, PermissionError):
+            content = raw.decode('utf-8')
+        except UnicodeDecodeError:
             return warnings
 
+        return self._validate_content(content, filepath)
+
+    def _validate_content(self, content: Union[str, bytes, mmap.mmap], filepath: str) -> List[str]:
+        """문자열 콘텐츠와 mmap 버퍼 공통 날짜 검증"""
+        warnings = []
+
         # CHANGELOG 특별 검증
         changelog_warnings = self.validate_changelog(content, filepath)
         warnings.extend(changelog_warnings)
@@ -207,8 +357,8 @@ class TimestampValidator:
 
         if suspicious_dates:
             warnings.append(
-                f"[DATE] {filepath}: 의심스러운 날짜 발견: {', '.join(set(suspicious_dates))}"
-                f"   현재 날짜: {self.current_date.strftime('%Y-%m-%d')}"
+                f"[DATE] {filepath}: 의심스러운 날짜 발견: {', '.join(suspicious_dates)}"
+                f"   현재 날짜: {self._today_str}"
             )
 
         return warnings
@@ -216,15 +366,19 @@ class TimestampValidator:
     def suggest_timestamps(self) -> dict:
         """현재 타임스탬프 제안"""
         return {
-            'iso_date': self.current_date.strftime('%Y-%m-%d'),
+            'iso_date': self._today_str,
             'iso_datetime': self.current_date.strftime('%Y-%m-%d %H:%M:%S'),
             'readable': self.current_date.strftime('%A, %B %d, %Y'),
-            'changelog': self.current_date.strftime('%Y-%m-%d'),
+            'changelog': self._today_str,
             'log_format': self.current_date.strftime('%Y-%m-%d %H:%M:%S'),
         }
 
 
-def validate_commit_message(message: str, config: Optional[Dict[str, Any]] = None) -> List[str]:
+def validate_commit_message(
+    message: str,
+    config: Optional[Dict[str, Any]] = None,
+    validator: Optional[TimestampValidator] = None
+) -> List[str]:
     """
     Validate dates in commit message.
     커밋 메시지의 날짜 검증.
@@ -232,11 +386,13 @@ def validate_commit_message(message: str, config: Optional[Dict[str, Any]] = Non
     Args:
         message: Commit message to validate
         config: Configuration from git-hooks.json
+        validator: Existing validator to reuse (built from config if omitted)
 
     Returns:
         List of warning messages
     """
-    validator = TimestampValidator(config)
+    if validator is None:
+        validator = TimestampValidator(config)
 
     # Check if validation is enabled
     if not validator.enabled:
@@ -250,12 +406,48 @@ def validate_commit_message(message: str, config: Optional[Dict[str, Any]] = Non
         if not validator.is_date_reasonable(date_str, date_format):
             warnings.append(
                 f"[DATE] 커밋 메시지에 의심스러운 날짜 포함: '{date_str}'. "
-                f"   현재 날짜: {validator.current_date.strftime('%Y-%m-%d')}"
+                f"   현재 날짜: {validator._today_str}"
             )
 
     return warnings
 
 
+def iter_candidate_files(
+    root: str, include: Callable[[str], bool], prefix: str = ''
+) -> Iterator[str]:
+    """
+    Yield files under root that may need timestamp validation.
+    타임스탬프 검증 대상일 수 있는 파일 경로 반환.
+
+    Excluded directories are pruned instead of descended into, and files are
+    yielded only when include() accepts their path relative to the walk root.
+
+    Args:
+        root: Directory to walk
+        include: Filter on the root-relative path, e.g. TimestampValidator.should_validate
+        prefix: Relative path of root within the walk (set by the recursion)
+
+    Yields:
+        File paths
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name not in EXCLUDE_DIRS:
+                    yield from iter_candidate_files(entry.path, include, f'{prefix}{name}/')
+            elif entry.is_file() and include(prefix + name):
+                yield entry.path
+        except OSError:
+            continue
+
+
 def main():
     """
     Main function for timestamp validation.
@@ -280,21 +472,31 @@ def main():
             with open(commit_msg_file, 'r', encoding='utf-8') as f:
                 commit_message = f.read()
 
-            warnings = validate_commit_message(commit_message, config)
+            warnings = validate_commit_message(commit_message, config, validator)
             all_warnings.extend(warnings)
         except (FileNotFoundError, UnicodeDecodeError):
             pass
     else:
         # 독립 실행: 현재 디렉토리의 모든 파일 검증
+        from concurrent.futures import ThreadPoolExecutor
+
         project_root = Path.cwd()
+        paths = list(iter_candidate_files(str(project_root), validator.should_validate))
 
-        for filepath in project_root.rglob('*'):
-            if filepath.is_file():
-                file_warnings = validator.validate_file_content(str(filepath))
-                all_warnings.extend(file_warnings)
+        # The walk already applied should_validate, so files go straight to _validate_file.
+        # File reads dominate, so files are validated on a thread pool (results keep walk order)
+        extend = all_warnings.extend
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_warnings in executor.map(validator._validate_file, paths):
+                extend(file_warnings)
 
     # 경고 출력
     if all_warnings:
+        from rich.table import Table
+        from rich import box
+
+        console = get_console()
         console.print("[yellow bold]TIMESTAMP VALIDATION WARNINGS:[/]")
         for warning in all_warnings:
             console.print(f"  [yellow]-[/] {warning}")
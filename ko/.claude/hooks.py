@@ -5,15 +5,15 @@ Example Project Hook Scripts CLI Manager
 통합 CLI로 모든 hook scripts를 수동 실행 및 관리.
 """
 import sys
+from functools import cache
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # hook_scripts 디렉토리를 Python 경로에 추가
 HOOK_SCRIPTS_DIR = Path(__file__).parent / "hook_scripts"
 sys.path.insert(0, str(HOOK_SCRIPTS_DIR))
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 app = typer.Typer(
     name="hooks",
@@ -22,7 +22,104 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-console = Console()
+@cache
+def get_console():
+    """터미널 출력용 Rich 콘솔 (rich는 처음 사용할 때 import)"""
+    from rich.console import Console
+
+    return Console()
+
+
+def _run_hook_main(
+    hook_main, stdin_text: str, argv: List[str], stream_stdout: bool = False
+) -> Tuple[int, str, str]:
+    """
+    Hook script의 main()을 프로세스 내에서 실행.
+
+    stdin/argv를 바꿔 끼우고 stdout/stderr를 캡처하여, 하위 Python 프로세스를
+    띄우던 것과 같은 결과를 (exit code, stdout, stderr)로 반환합니다.
+    stream_stdout이면 훅이 실행 중에 바로 터미널로 출력하고 반환되는 stdout은 비어 있습니다.
+    """
+    import contextlib
+    import io
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_stdin, saved_argv = sys.stdin, sys.argv
+    sys.stdin, sys.argv = io.StringIO(stdin_text), argv
+    returncode = 0
+    try:
+        redirect = contextlib.nullcontext() if stream_stdout else contextlib.redirect_stdout(stdout)
+        with redirect, contextlib.redirect_stderr(stderr):
+            hook_main()
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        else:
+            returncode = e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.stdin, sys.argv = saved_stdin, saved_argv
+
+    return returncode, stdout.getvalue(), stderr.getvalue()
+
+
+# 검사 훅이 stdin으로 읽는 PreToolUse Write 입력 (tool_input만 달라짐)
+_PRETOOL_WRITE_ENVELOPE = '{"hook_event_name": "PreToolUse", "tool_name": "Write", "tool_input": %s}'
+
+
+def _pretool_write_input(file_path: Optional[str] = None) -> str:
+    """file_path에 대한 PreToolUse Write 훅 입력 직렬화 (None이면 빈 tool_input)"""
+    if file_path is None:
+        return _PRETOOL_WRITE_ENVELOPE % "{}"
+
+    from common import fastjson
+
+    return _PRETOOL_WRITE_ENVELOPE % fastjson.dumps({"file_path": file_path}).decode()
+
+
+# preflight 검사 -> (훅 모듈, argv[0])
+_CHECK_HOOKS = {
+    "scan_secrets": ("secret_scanner", "secret_scanner.py"),
+    "check_mocks": ("no_mock_code", "no_mock_code.py"),
+    "validate_timestamp": ("timestamp_validator", "timestamp_validator.py"),
+}
+
+
+def _run_check_hook(check: str, file_path: Optional[str]) -> Tuple[int, str, str]:
+    """
+    검사 훅의 main()을 PreToolUse Write 입력으로 실행
+
+    프로세스 풀에 제출할 수 있도록 모듈 레벨에 정의
+    """
+    import importlib
+
+    module_name, script_name = _CHECK_HOOKS[check]
+
+    return _run_hook_main(
+        importlib.import_module(module_name).main, _pretool_write_input(file_path), [script_name]
+    )
+
+
+# 세션 단계 -> (훅 모듈, 상태 메시지)
+_SESSION_PHASES = {
+    "session_start": ("session_start", "[cyan]세션 시작 중...[/cyan]"),
+    "context_recovery": ("context_recovery_helper", "[cyan]컨텍스트 복구 중...[/cyan]"),
+    "pre_session": ("pre_session_hook", "[cyan]프로젝트 가이드 표시 중...[/cyan]"),
+    "post_session": ("post_session_hook", "[cyan]세션 종료 처리 중...[/cyan]"),
+}
+
+
+def _run_session_phase(phase: str) -> None:
+    """세션 단계의 훅 모듈을 import하고 안내 메시지 출력 후 main() 실행"""
+    import importlib
+
+    module_name, message = _SESSION_PHASES[phase]
+    hook_main = importlib.import_module(module_name).main
+
+    get_console().print(message)
+    try:
+        hook_main()
+    except SystemExit:
+        pass
 
 
 @app.command()
@@ -45,13 +142,7 @@ def session_start(
     1. Context Recovery Helper (컨텍스트 복구)
     2. Pre-Session Hook (프로젝트 정보 및 가이드)
     """
-    from session_start import main as session_start_main
-
-    console.print("[cyan]세션 시작 중...[/cyan]")
-    try:
-        session_start_main()
-    except SystemExit:
-        pass
+    _run_session_phase("session_start")
 
 
 @app.command()
@@ -64,13 +155,7 @@ def context_recovery():
     - 최근 백업 파일 자동 로드
     - 새 세션에 맥락 자동 제공
     """
-    from context_recovery_helper import main as recovery_main
-
-    console.print("[cyan]컨텍스트 복구 중...[/cyan]")
-    try:
-        recovery_main()
-    except SystemExit:
-        pass
+    _run_session_phase("context_recovery")
 
 
 @app.command()
@@ -84,26 +169,15 @@ def pre_session():
     - 작업 규칙 및 지침
     - 완료 체크리스트
     """
-    from pre_session_hook import main as pre_session_main
-
-    console.print("[cyan]프로젝트 가이드 표시 중...[/cyan]")
-    try:
-        pre_session_main()
-    except SystemExit:
-        pass
+    _run_session_phase("pre_session")
 
 
 @app.command()
 def auto_compact(
-    threshold: float = typer.Option(
-        None,
-        "--threshold",
-        help="압축 임계값 (0.0-1.0)"
-    ),
     force: bool = typer.Option(
         False,
         "--force",
-        help="강제 압축 실행"
+        help="stdin에 PreCompact 입력이 없어도 압축 실행"
     )
 ):
     """
@@ -114,9 +188,41 @@ def auto_compact(
     - AI 요약 생성
     - ChromaDB에 저장
     - 복구 파일 생성
+
+    stdin에 PreCompact hook 입력이 있거나 --force일 때만 실행합니다.
     """
-    console.print("[cyan]컨텍스트 압축 확인 중...[/cyan]")
-    console.print("[yellow]Note: PreCompact hook으로 실행해야 정상 작동합니다[/yellow]")
+    import json
+    import os
+    import stat
+
+    # stdin에 PreCompact 입력이 있을 때(또는 --force)만 압축 실행
+    # 단순 수동 실행이 직전 압축의 복구 상태를 덮어쓰지 않도록 함
+    payload = ""
+    try:
+        stdin_mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError):
+        stdin_mode = 0
+    if stat.S_ISFIFO(stdin_mode) or stat.S_ISSOCK(stdin_mode) or stat.S_ISREG(stdin_mode):
+        payload = sys.stdin.read()
+
+    try:
+        is_pre_compact = json.loads(payload).get("hook_event_name") == "PreCompact"
+    except (ValueError, AttributeError):
+        is_pre_compact = False
+
+    get_console().print("[cyan]컨텍스트 압축 확인 중...[/cyan]")
+    if not (is_pre_compact or force):
+        get_console().print("[yellow]Note: PreCompact hook으로 실행해야 정상 작동합니다[/yellow]")
+        return
+
+    from auto_compact import main as auto_compact_main
+
+    _, _, stderr = _run_hook_main(
+        auto_compact_main, payload, ["auto_compact.py"], stream_stdout=True
+    )
+
+    if stderr:
+        get_console().print(stderr, style="dim")
 
 
 @app.command()
@@ -129,13 +235,7 @@ def post_session():
     - 로그 정리
     - 상태 저장
     """
-    from post_session_hook import main as post_session_main
-
-    console.print("[cyan]세션 종료 처리 중...[/cyan]")
-    try:
-        post_session_main()
-    except SystemExit:
-        pass
+    _run_session_phase("post_session")
 
 
 @app.command()
@@ -156,19 +256,21 @@ def validate_commit(
     """
     from validate_git_commit import main as validate_main
 
-    if message:
-        # 메시지를 stdin으로 제공
-        import io
-        sys.stdin = io.StringIO(message)
+    get_console().print("[cyan]커밋 메시지 검증 중...[/cyan]")
 
-    console.print("[cyan]커밋 메시지 검증 중...[/cyan]")
-    try:
-        validate_main()
-    except SystemExit as e:
-        if e.code != 0:
-            console.print("[red]검증 실패[/red]")
-        else:
-            console.print("[green]검증 통과[/green]")
+    # 메시지 인자가 없으면 stdin을 그대로 훅에 전달
+    stdin_text = message if message else sys.stdin.read()
+    returncode, _, stderr = _run_hook_main(
+        validate_main, stdin_text, ["validate_git_commit.py"], stream_stdout=True
+    )
+
+    if stderr:
+        get_console().print(stderr, style="dim")
+
+    if returncode != 0:
+        get_console().print("[red]검증 실패[/red]")
+    else:
+        get_console().print("[green]검증 통과[/green]")
 
 
 @app.command()
@@ -185,36 +287,24 @@ def scan_secrets(
     - 토큰 패턴
     - 민감한 파일명
     """
-    import subprocess
-    import json
-
-    console.print(f"[cyan]시크릿 스캔 중: {path}[/cyan]")
+    get_console().print(f"[cyan]시크릿 스캔 중: {path}[/cyan]")
 
     # secret_scanner.py는 PreToolUse hook으로 설계됨
     # stdin으로 JSON 전달
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {"file_path": path}
-    }
-
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "secret_scanner.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from secret_scanner import main as secret_scanner_main
+
+        returncode, _, stderr = _run_hook_main(
+            secret_scanner_main, _pretool_write_input(path), ["secret_scanner.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]경고: 스캔 중 오류 발생 (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]경고: 스캔 중 오류 발생 (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]오류: {e}[/red]")
+        get_console().print(f"[red]오류: {e}[/red]")
 
 
 @app.command()
@@ -230,35 +320,23 @@ def check_mocks(
     - 플레이스홀더 코드
     - 미구현 함수
     """
-    import subprocess
-    import json
-
-    console.print(f"[cyan]Mock 코드 체크 중: {path}[/cyan]")
+    get_console().print(f"[cyan]Mock 코드 체크 중: {path}[/cyan]")
 
     # no_mock_code.py는 PreToolUse hook으로 설계됨
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {"file_path": path}
-    }
-
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "no_mock_code.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from no_mock_code import main as no_mock_code_main
+
+        returncode, _, stderr = _run_hook_main(
+            no_mock_code_main, _pretool_write_input(path), ["no_mock_code.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]경고: 체크 중 오류 발생 (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]경고: 체크 중 오류 발생 (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]오류: {e}[/red]")
+        get_console().print(f"[red]오류: {e}[/red]")
 
 
 @app.command()
@@ -271,35 +349,74 @@ def validate_timestamp():
     - 오래된 타임스탬프
     - 만료된 시간 값
     """
-    import subprocess
-    import json
-
-    console.print("[cyan]타임스탬프 검증 중...[/cyan]")
+    get_console().print("[cyan]타임스탬프 검증 중...[/cyan]")
 
     # timestamp_validator.py는 PreToolUse hook으로 설계됨
-    hook_input = {
-        "hook_event_name": "PreToolUse",
-        "tool_name": "Write",
-        "tool_input": {}
-    }
-
     try:
-        result = subprocess.run(
-            [sys.executable, str(HOOK_SCRIPTS_DIR / "timestamp_validator.py")],
-            input=json.dumps(hook_input),
-            capture_output=True,
-            text=True
+        from timestamp_validator import main as timestamp_validator_main
+
+        returncode, _, stderr = _run_hook_main(
+            timestamp_validator_main, _pretool_write_input(), ["timestamp_validator.py"], stream_stdout=True
         )
 
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr:
-            console.print(result.stderr, style="dim")
+        if stderr:
+            get_console().print(stderr, style="dim")
 
-        if result.returncode != 0:
-            console.print(f"[yellow]경고: 검증 중 오류 발생 (exit code: {result.returncode})[/yellow]")
+        if returncode != 0:
+            get_console().print(f"[yellow]경고: 검증 중 오류 발생 (exit code: {returncode})[/yellow]")
     except Exception as e:
-        console.print(f"[red]오류: {e}[/red]")
+        get_console().print(f"[red]오류: {e}[/red]")
+
+
+@app.command()
+def preflight(
+    path: str = typer.Argument(".", help="검사할 경로")
+):
+    """
+    시크릿 스캔, Mock 코드 체크, 타임스탬프 검증을 동시에 실행
+
+    훅은 stdin/stdout을 사용하므로 검사마다 별도 워커 프로세스에서
+    실행하고, 끝나는 순서대로 결과를 출력
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    get_console().print(f"[cyan]Preflight 검사 중: {path}[/cyan]")
+
+    file_paths = {
+        "scan_secrets": path,
+        "check_mocks": path,
+        "validate_timestamp": None,
+    }
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=len(file_paths)) as executor:
+        futures = {
+            executor.submit(_run_check_hook, check, file_path): check
+            for check, file_path in file_paths.items()
+        }
+        for future in as_completed(futures):
+            check = futures[future]
+            try:
+                returncode, stdout, stderr = future.result()
+            except Exception as e:
+                get_console().print(f"[red]{check}: 오류: {e}[/red]")
+                failed.append(check)
+                continue
+
+            if stdout:
+                get_console().print(stdout)
+            if stderr:
+                get_console().print(stderr, style="dim")
+
+            if returncode != 0:
+                get_console().print(f"[yellow]경고: {check} 종료 코드 {returncode}[/yellow]")
+                failed.append(check)
+
+    if failed:
+        get_console().print(f"[red]Preflight 실패: {', '.join(failed)}[/red]")
+        raise typer.Exit(1)
+
+    get_console().print("[green]모든 preflight 검사 통과[/green]")
 
 
 @app.command()
@@ -310,19 +427,22 @@ def view_logs(
     json_output: bool = typer.Option(False, "--json", help="JSON 형식으로 출력")
 ):
     """훅 로그 조회"""
-    import subprocess
+    from common.log_viewer import view as view_logs_cmd
+
+    # common/log_viewer의 view를 프로세스 내에서 직접 호출
+    view_logs_cmd(script, limit, errors, json_output)
 
-    # view_logs.py의 view 서브커맨드를 직접 실행
-    cmd = [sys.executable, str(HOOK_SCRIPTS_DIR / "view_logs.py"), "view"]
-    if script:
-        cmd.append(script)
-    cmd.extend(["--limit", str(limit)])
-    if errors:
-        cmd.append("--errors")
-    if json_output:
-        cmd.append("--json")
 
-    subprocess.run(cmd)
+# server 액션 -> 액션 뒤 위치 인자 수 (필수, 허용)
+# start-*는 category 인자를 타입으로 사용, 알 수 없는 액션은 common/servers.py가 처리
+_SERVER_ACTIONS = {
+    "list": (0, 0),
+    "status": (2, 2),
+    "start-backend": (0, 1),
+    "start-frontend": (0, 1),
+    "stop": (2, 2),
+    "stop-all": (0, 0),
+}
 
 
 @app.command()
@@ -351,26 +471,43 @@ def server(
         .claude/hooks server stop backend auth-example
         .claude/hooks server stop-all
     """
-    import subprocess
+    from common.servers import app as servers_app
 
-    # common/servers.py를 직접 실행
-    cmd = [sys.executable, str(HOOK_SCRIPTS_DIR / "common" / "servers.py"), action]
+    # common/servers.py의 Typer 앱을 프로세스 내에서 실행
+    required, accepted = _SERVER_ACTIONS.get(action, (0, 0))
+    args = [category, server_type][:accepted]
+    if not all(args[:required]):
+        get_console().print(f"[red]오류: {action}는 <category> <type> 형식이 필요합니다[/red]")
+        get_console().print(f"[yellow]예시: .claude/hooks server {action} backend auth-example[/yellow]")
+        raise typer.Exit(1)
 
-    # start-backend, start-frontend: category를 타입으로 사용
-    if action in ["start-backend", "start-frontend"]:
-        if category:
-            cmd.append(category)
+    cmd = [action, *(arg for arg in args if arg)]
 
-    # status, stop: category와 type 둘 다 필요
-    elif action in ["status", "stop"]:
-        if not category or not server_type:
-            console.print(f"[red]오류: {action}는 <category> <type> 형식이 필요합니다[/red]")
-            console.print(f"[yellow]예시: .claude/hooks server {action} backend auth-example[/yellow]")
-            raise typer.Exit(1)
-        cmd.append(category)
-        cmd.append(server_type)
+    try:
+        servers_app(args=cmd, prog_name="hooks server")
+    except SystemExit:
+        pass
 
-    subprocess.run(cmd)
+
+# list-hooks 표 행: (명령어, 설명, 유형)
+_HOOK_ROWS = (
+    ("session-start", "세션 시작 (복구 + 가이드)", "Lifecycle"),
+    ("context-recovery", "컨텍스트 복구", "Lifecycle"),
+    ("pre-session", "프로젝트 가이드 표시", "Lifecycle"),
+    ("auto-compact", "자동 컨텍스트 압축", "Lifecycle"),
+    ("post-session", "세션 종료 정리", "Lifecycle"),
+    ("validate-commit", "커밋 메시지 검증", "Git"),
+    ("scan-secrets", "시크릿 스캔", "Security"),
+    ("check-mocks", "Mock 코드 체크", "Quality"),
+    ("validate-timestamp", "타임스탬프 검증", "Quality"),
+    ("preflight", "시크릿 + Mock + 타임스탬프 검사 (병렬)", "Quality"),
+    ("view-logs", "훅 로그 조회", "Utility"),
+    ("server", "개발 서버 관리", "Dev"),
+    ("token-status", "토큰 사용량 상태", "Token"),
+    ("token-reset", "토큰 카운터 리셋", "Token"),
+    ("token-extract", "토큰 추출 (PostToolUse Hook)", "Token"),
+    ("token-check", "세션 연속성 체크", "Token"),
+)
 
 
 @app.command()
@@ -378,34 +515,18 @@ def list_hooks():
     """
     사용 가능한 모든 훅 스크립트 목록 표시
     """
+    from rich.table import Table
+
     table = Table(title="Hook Scripts", show_header=True, header_style="bold cyan")
     table.add_column("Command", style="green")
     table.add_column("Description", style="white")
     table.add_column("Type", style="yellow")
 
-    hooks = [
-        ("session-start", "세션 시작 (복구 + 가이드)", "Lifecycle"),
-        ("context-recovery", "컨텍스트 복구", "Lifecycle"),
-        ("pre-session", "프로젝트 가이드 표시", "Lifecycle"),
-        ("auto-compact", "자동 컨텍스트 압축", "Lifecycle"),
-        ("post-session", "세션 종료 정리", "Lifecycle"),
-        ("validate-commit", "커밋 메시지 검증", "Git"),
-        ("scan-secrets", "시크릿 스캔", "Security"),
-        ("check-mocks", "Mock 코드 체크", "Quality"),
-        ("validate-timestamp", "타임스탬프 검증", "Quality"),
-        ("view-logs", "훅 로그 조회", "Utility"),
-        ("server", "개발 서버 관리", "Dev"),
-        ("token-status", "토큰 사용량 상태", "Token"),
-        ("token-reset", "토큰 카운터 리셋", "Token"),
-        ("token-extract", "토큰 추출 (PostToolUse Hook)", "Token"),
-        ("token-check", "세션 연속성 체크", "Token"),
-    ]
-
-    for cmd, desc, type_ in hooks:
+    for cmd, desc, type_ in _HOOK_ROWS:
         table.add_row(cmd, desc, type_)
 
-    console.print(table)
-    console.print("\n[dim]자세한 정보: .claude/hooks [command] --help[/dim]")
+    get_console().print(table)
+    get_console().print("\n[dim]자세한 정보: .claude/hooks [command] --help[/dim]")
 
 
 @app.command()